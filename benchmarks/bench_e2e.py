@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmark de bout en bout du pipeline main.py sur des fichiers audio générés.
+
+Les fichiers de test (sons purs modulés et silences, différentes durées et
+dispositions de canaux) sont générés localement. Chaque cas est exécuté dans
+un processus neuf, avec l'un des modèles de substitution :
+- fake : moteur factice (--backend fake), segments scriptés (mesure tout sauf le modèle) ;
+- random : modèle Whisper "tiny" initialisé aléatoirement (coût d'inférence réel).
+
+Le bilan donne le facteur temps réel, le temps par étape (profileur) et le
+pic de mémoire résidente.
+
+Exemples:
+  python benchmarks/bench_e2e.py
+  python benchmarks/bench_e2e.py --backends fake,random --durations 30,600 --json e2e.json
+  python benchmarks/bench_e2e.py --backends fake --fake-rtf 0.05 --layouts 5.1 --durations 3600
+"""
+
+import os
+import sys
+import json
+import wave
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).parent.parent
+
+# Disposition -> (canaux, fréquence d'échantillonnage)
+LAYOUTS = {
+    "mono": (1, 16000),
+    "stereo": (2, 44100),
+    "5.1": (6, 48000),
+}
+
+# Étapes affichées dans le tableau (toutes figurent dans le JSON)
+SUMMARY_STAGES = ("audio.decode", "inference", "post_process", "save.srt", "save.txt")
+
+
+def write_fixture(path: str, duration: float, layout: str, seed: int = 0) -> None:
+    """
+    Génère un fichier WAV alternant rafales de son modulé et silences.
+
+    Args:
+        path: Chemin de sortie
+        duration: Durée en secondes
+        layout: Disposition des canaux (mono, stereo, 5.1)
+        seed: Graine aléatoire (fréquences et durées des rafales)
+    """
+    channels, sample_rate = LAYOUTS[layout]
+    rng = np.random.default_rng(seed)
+
+    with wave.open(path, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+
+        # Écriture par blocs pour ne pas dépendre de la durée du fichier
+        written = 0
+        total = int(duration * sample_rate)
+        while written < total:
+            burst = int(rng.uniform(1.5, 6.0) * sample_rate)
+            silence = int(rng.uniform(0.3, 2.5) * sample_rate)
+            t = np.arange(burst) / sample_rate
+            # Porteuse modulée à ~4 Hz, rythme approximatif des syllabes
+            signal = np.sin(2 * np.pi * rng.uniform(120, 400) * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)) * 0.4
+            block = np.concatenate([signal, np.zeros(silence)])[:total - written]
+            frames = np.repeat((block * 32767).astype(np.int16)[:, None], channels, axis=1)
+            f.writeframes(frames.tobytes())
+            written += len(block)
+
+
+def run_case(fixture: str, duration: float, backend: str, outputs: str, fake_rtf: float, output_dir: str) -> Dict[str, Any]:
+    """
+    Exécute main.py sur un fichier dans le processus courant (processus neuf).
+
+    Args:
+        fixture: Fichier audio
+        duration: Durée du fichier en secondes
+        backend: fake ou random
+        outputs: Formats de sortie
+        fake_rtf: Temps de calcul simulé du modèle factice par seconde d'audio
+        output_dir: Répertoire des sorties et des caches
+
+    Returns:
+        Bilan du cas
+    """
+    os.environ["JJ_CAPTION_CACHE_DIR"] = os.path.join(output_dir, "cache")
+    sys.path.insert(0, str(ROOT))
+    import main as cli
+    from profiling import enable_profiling, disable_profiling
+    from transcription.model_registry import get_model_registry
+    from transcription.backends import FakeBackend, register_backend
+    from transcription.stub_models import random_tiny_model
+
+    argv = [
+        fixture, "--model", "tiny", "--language", "French",
+        "--output", outputs, "--output-dir", output_dir,
+        "--no-cache", "--log-level", "WARNING",
+    ]
+    if backend == "fake":
+        register_backend("fake", lambda: FakeBackend(realtime_factor=fake_rtf))
+        argv += ["--backend", "fake"]
+    else:
+        # Le gestionnaire trouvera ce modèle dans le registre au lieu de le télécharger
+        model = random_tiny_model()
+        get_model_registry().get("tiny", "cpu", lambda name, device: model)
+
+    args = cli.build_parser().parse_args(argv)
+    cli.setup_logging(args.log_level)
+
+    profiler = enable_profiling()
+    start = time.perf_counter()
+    error = None
+    try:
+        cli.run(args)
+    except SystemExit as e:
+        error = f"arrêt (code {e.code})"
+    wall = time.perf_counter() - start
+    disable_profiling()
+
+    # ru_maxrss : kilo-octets sous Linux, octets sous macOS
+    unit = 1 if platform.system() == "Darwin" else 1024
+    return {
+        "fixture": os.path.basename(fixture),
+        "backend": backend,
+        "duration": duration,
+        "wall": wall,
+        "rtf": wall / duration if duration else 0.0,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit / (1024 * 1024),
+        "peak_rss_children_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit / (1024 * 1024),
+        "stages": profiler.report()["stages"],
+        "error": error,
+    }
+
+
+def format_report(cases: List[Dict[str, Any]]) -> str:
+    """
+    Formate les bilans sous forme de tableau.
+
+    Args:
+        cases: Bilans de run_case
+
+    Returns:
+        Tableau texte
+    """
+    header = f"{'Fichier':<26} {'Modèle':<7} {'Durée':>7} {'Temps':>8} {'RTF':>7} {'RSS Mo':>7}"
+    header += "".join(f" {stage:>13}" for stage in SUMMARY_STAGES)
+    lines = [header, "-" * len(header)]
+    for case in cases:
+        totals = {stage["stage"]: stage["total"] for stage in case["stages"]}
+        line = (
+            f"{case['fixture']:<26} {case['backend']:<7} {case['duration']:>6.0f}s {case['wall']:>7.2f}s "
+            f"{case['rtf']:>7.4f} {case['peak_rss_mb']:>7.0f}"
+        )
+        line += "".join(f" {totals.get(stage, 0.0):>12.3f}s" for stage in SUMMARY_STAGES)
+        if case["error"]:
+            line += f"  ❌ {case['error']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main():
+    """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Benchmark de bout en bout (facteur temps réel, étapes, mémoire)")
+    parser.add_argument("--backends", default="fake", help="Modèles: fake, random (séparés par des virgules, défaut: fake)")
+    parser.add_argument("--durations", default="30,300", help="Durées des fichiers en secondes (défaut: 30,300)")
+    parser.add_argument("--layouts", default="mono,stereo,5.1", help=f"Dispositions: {', '.join(LAYOUTS)}")
+    parser.add_argument("--output", default="srt,vtt,txt,json", help="Formats produits (défaut: srt,vtt,txt,json)")
+    parser.add_argument("--fake-rtf", type=float, default=0.0, help="Temps de calcul simulé du modèle factice (s par s d'audio)")
+    parser.add_argument("--fixtures-dir", help="Conserver les fichiers générés dans ce répertoire")
+    parser.add_argument("--json", help="Écrire les bilans dans ce fichier JSON")
+    args = parser.parse_args()
+
+    backends = args.backends.split(",")
+    durations = [float(d) for d in args.durations.split(",")]
+    layouts = args.layouts.split(",")
+    for name in backends:
+        if name not in ("fake", "random"):
+            parser.error(f"Modèle inconnu: {name}")
+    for layout in layouts:
+        if layout not in LAYOUTS:
+            parser.error(f"Disposition inconnue: {layout}")
+
+    cases = []
+    with tempfile.TemporaryDirectory(prefix="jj_e2e_") as tmp_dir:
+        fixtures_dir = args.fixtures_dir or os.path.join(tmp_dir, "fixtures")
+        os.makedirs(fixtures_dir, exist_ok=True)
+
+        for duration in durations:
+            for layout in layouts:
+                channels, sample_rate = LAYOUTS[layout]
+                fixture = os.path.join(fixtures_dir, f"tones_{layout}_{sample_rate // 1000}k_{duration:g}s.wav")
+                if not os.path.exists(fixture):
+                    write_fixture(fixture, duration, layout)
+
+                for backend in backends:
+                    output_dir = os.path.join(tmp_dir, f"{Path(fixture).stem}_{backend}")
+                    os.makedirs(output_dir, exist_ok=True)
+                    # Un processus neuf par cas : registre vide et pic mémoire propre
+                    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                        case = executor.submit(
+                            run_case, fixture, duration, backend, args.output, args.fake_rtf, output_dir
+                        ).result()
+                    cases.append(case)
+                    print(f"  {case['fixture']} [{backend}] : {case['wall']:.2f}s (RTF {case['rtf']:.4f})")
+
+    print()
+    print(format_report(cases))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "cases": cases}, f, indent=2)
+        print(f"\n📄 Bilan écrit: {args.json}")
+
+    if any(case["error"] for case in cases):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks des chemins critiques hors modèle : analyse SRT, conversions,
+écriture des sous-titres et étapes du post-traitement.
+
+Les transcriptions sont synthétiques (déterministes) de 1k à 1M segments. Les
+temps et une empreinte des sorties sont comparés à une référence enregistrée :
+un ralentissement au-delà de la tolérance (confirmé par une seconde mesure),
+une sortie différente ou une mesure absente de la référence fait échouer le
+script (code de sortie 1).
+
+Exemples:
+  python benchmarks/bench_hot_paths.py --update-baseline
+  python benchmarks/bench_hot_paths.py --sizes 1000,10000,100000
+  python benchmarks/bench_hot_paths.py --sizes 1000 --only parse_srt,save_srt
+"""
+
+import gc
+import os
+import sys
+import copy
+import json
+import time
+import random
+import hashlib
+import argparse
+import logging
+import platform
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from transcription.whisper_handler import WhisperHandler
+from conversion.format_converter import FormatConverter
+from transcription.segment_table import SegmentTable
+from transcription import timing
+
+DEFAULT_BASELINE = str(Path(__file__).parent / "baselines" / "hot_paths.json")
+DEFAULT_SIZES = "1000,10000,100000"
+
+# Cahier des charges de minutage du benchmark reflow
+REFLOW_RULES = {"merge_under": 1.0, "max_chars": 42, "max_cps": 17.0, "min_duration": 1.0, "max_gap": 0.5, "min_gap": 0.08}
+
+# Vocabulaire incluant des erreurs corrigées par _correct_common_errors
+WORDS = (
+    "le la les un une des et mais donc pour avec dans sur pêche mer plage village "
+    "communauté tradition Boquilla Colombie Brigitte matin quoi comment pourquoi "
+    "super génial parfait oh ah awe vi brigette paix maix page contre plache main grave "
+    "salez traille soquies racker colombe pirelles crabeurs matre"
+).split()
+
+
+def make_segments(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Génère une transcription synthétique déterministe.
+
+    Args:
+        count: Nombre de segments
+        seed: Graine aléatoire
+
+    Returns:
+        Segments au format Whisper (id, start, end, text)
+    """
+    rng = random.Random(seed)
+    segments = []
+    position = 0.0
+    for i in range(count):
+        # Environ un segment sur cinq est plus court qu'une seconde
+        duration = rng.choice((0.4, 0.8, 1.5, 2.5, 3.5, 4.0))
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12)))
+        segments.append({"id": i, "start": round(position, 3), "end": round(position + duration, 3), "text": " " + text})
+        position += duration + rng.choice((0.0, 0.1, 0.3, 2.5))
+    return segments
+
+
+def _digest_file(path: str, tmp_dir: str) -> str:
+    """Empreinte d'un fichier, sans les champs variables (date, heure, chemins temporaires)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = [
+            line.replace(tmp_dir, "<tmp>") for line in f
+            if not line.startswith(("\\ Date:", "\\ Time:"))
+        ]
+    return hashlib.sha256("".join(lines).encode("utf-8")).hexdigest()[:16]
+
+
+def _digest_data(data: Any) -> str:
+    """Empreinte d'une structure de données."""
+    return hashlib.sha256(json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class Context:
+    """Données partagées par les benchmarks d'une taille donnée."""
+
+    def __init__(self, count: int, tmp_dir: str):
+        self.count = count
+        self.tmp_dir = tmp_dir
+        self.handler = WhisperHandler(model_name="tiny", use_audio_cache=False)
+        self.converter = FormatConverter()
+        self.segments = make_segments(count)
+        self.result = {"text": "".join(seg["text"] for seg in self.segments), "segments": self.segments, "language": "fr"}
+        self.table = SegmentTable.from_result(self.result)
+        self.srt_path = os.path.join(tmp_dir, f"input_{count}.srt")
+        self.handler.save_srt(self.result, self.srt_path)
+
+    def output(self, extension: str) -> str:
+        return os.path.join(self.tmp_dir, f"output_{self.count}.{extension}")
+
+
+def _file_benchmark(run: Callable[[Context, str], None], extension: str):
+    """Benchmark produisant un fichier : (préparation, exécution, empreinte)."""
+    def bench(ctx: Context) -> Tuple[Callable[[], Any], Callable[[Any], str]]:
+        path = ctx.output(extension)
+        return (lambda: run(ctx, path)), (lambda _: _digest_file(path, ctx.tmp_dir))
+    return bench
+
+
+def _segments_benchmark(step: Callable[[Context, List[Dict[str, Any]]], Any]):
+    """Benchmark d'une étape sur une copie fraîche des segments (copie non chronométrée)."""
+    def bench(ctx: Context) -> Tuple[Callable[[], Any], Callable[[Any], str]]:
+        segments = copy.deepcopy(ctx.segments)
+        return (lambda: step(ctx, segments)), _digest_data
+    return bench
+
+
+# Nom -> (fabrique du benchmark, taille maximale par défaut)
+BENCHMARKS: Dict[str, Tuple[Callable, Optional[int]]] = {
+    "parse_srt": (
+        lambda ctx: ((lambda: ctx.converter._parse_srt(ctx.srt_path)), _digest_data), None),
+    "srt_to_vtt": (_file_benchmark(lambda ctx, path: ctx.converter.srt_to_vtt(ctx.srt_path, path), "vtt"), 100000),
+    "srt_to_scc": (_file_benchmark(lambda ctx, path: ctx.converter.srt_to_scc(ctx.srt_path, path), "scc"), 10000),
+    "srt_to_ass": (_file_benchmark(lambda ctx, path: ctx.converter.srt_to_ass(ctx.srt_path, path), "ass"), None),
+    "srt_to_txt": (_file_benchmark(lambda ctx, path: ctx.converter.srt_to_txt(ctx.srt_path, path), "txt"), None),
+    "srt_to_json": (_file_benchmark(lambda ctx, path: ctx.converter.srt_to_json(ctx.srt_path, path), "json"), None),
+    "save_srt": (_file_benchmark(lambda ctx, path: ctx.handler.save_srt(ctx.result, path), "srt"), None),
+    "save_vtt": (_file_benchmark(lambda ctx, path: ctx.handler.save_vtt(ctx.result, path), "vtt"), None),
+    "save_txt": (_file_benchmark(lambda ctx, path: ctx.handler.save_txt(ctx.result, path), "broadcast.txt"), None),
+    "save_json": (_file_benchmark(lambda ctx, path: ctx.handler.save_json(ctx.result, path), "whisper.json"), None),
+    "save_srt_table": (_file_benchmark(lambda ctx, path: ctx.handler.save_srt(ctx.table, path), "srt"), None),
+    "save_vtt_table": (_file_benchmark(lambda ctx, path: ctx.handler.save_vtt(ctx.table, path), "vtt"), None),
+    "save_txt_table": (_file_benchmark(lambda ctx, path: ctx.handler.save_txt(ctx.table, path), "broadcast.txt"), None),
+    "save_json_table": (_file_benchmark(lambda ctx, path: ctx.handler.save_json(ctx.table, path), "whisper.json"), None),
+    "correct_common_errors": (_segments_benchmark(lambda ctx, segs: ctx.handler._correct_common_errors(segs)), None),
+    "improve_punctuation": (_segments_benchmark(lambda ctx, segs: ctx.handler._improve_punctuation(segs)), None),
+    "merge_short_segments": (_segments_benchmark(lambda ctx, segs: ctx.handler._merge_short_segments(segs)), None),
+    "post_process": (_segments_benchmark(
+        lambda ctx, segs: ctx.handler.post_process_transcription({**ctx.result, "segments": segs})), None),
+    "post_process_table": (
+        lambda ctx: ((lambda: ctx.handler.post_process_transcription(ctx.table)), lambda table: _digest_data(table.to_result())),
+        None),
+    "merge_short_table": (
+        lambda ctx: ((lambda: timing.merge_short(ctx.table)), lambda table: _digest_data(table.to_result())), None),
+    "reflow": (
+        lambda ctx: ((lambda: timing.reflow(ctx.table, **REFLOW_RULES)), lambda table: _digest_data(table.to_result())),
+        None),
+}
+
+
+def _calibration_run() -> float:
+    """
+    Chronomètre une charge de référence fixe (chaînes, dictionnaires, tris).
+
+    Returns:
+        Durée en secondes
+    """
+    start = time.perf_counter()
+    rows = {f"{i:06d}": f" segment {i} ".strip().upper() for i in range(500)}
+    "".join(sorted(rows.values(), key=len))
+    return time.perf_counter() - start
+
+
+def run_benchmark(factory: Callable, ctx: Context, repeat: int, min_time: float) -> Dict[str, Any]:
+    """
+    Exécute un benchmark à répétition et garde le meilleur temps d'exécution.
+
+    Chaque série enchaîne les exécutions jusqu'à cumuler min_time secondes
+    mesurées : une opération de quelques millisecondes est exécutée des
+    dizaines de fois, et le meilleur temps écarte les interruptions du
+    système (le bruit ne fait qu'allonger une mesure). Une charge de
+    référence est chronométrée au même moment : le rapport des deux compense
+    les variations de vitesse de la machine d'une minute à l'autre.
+
+    Args:
+        factory: Fabrique (contexte) -> (exécution, empreinte)
+        ctx: Contexte de la taille courante
+        repeat: Nombre de séries
+        min_time: Temps mesuré minimal d'une série (secondes)
+
+    Returns:
+        Dictionnaire (seconds, us_per_segment, calibration, digest)
+    """
+    best = None
+    calibration = None
+    digest = None
+    for _ in range(max(1, repeat)):
+        elapsed = 0.0
+        runs = 0
+        # Ramasse-miettes suspendu pendant la série, comme timeit
+        gc.collect()
+        gc.disable()
+        try:
+            while runs == 0 or elapsed < min_time:
+                # Préparation (copie des segments...) non chronométrée
+                run, fingerprint = factory(ctx)
+                if runs < 30:
+                    reference = _calibration_run()
+                    calibration = reference if calibration is None else min(calibration, reference)
+                start = time.perf_counter()
+                output = run()
+                duration = time.perf_counter() - start
+                elapsed += duration
+                runs += 1
+                best = duration if best is None else min(best, duration)
+        finally:
+            gc.enable()
+        digest = fingerprint(output)
+    return {"seconds": best, "us_per_segment": best / ctx.count * 1e6, "calibration": calibration, "digest": digest}
+
+
+def compare(name: str, size: int, measure: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> Tuple[str, bool]:
+    """
+    Compare une mesure à la référence.
+
+    Une mesure sans référence est un échec : tout benchmark exécuté doit être
+    couvert par la référence (--update-baseline pour l'enregistrer).
+
+    Returns:
+        Tuple (texte du statut, True si régression ou référence absente)
+    """
+    reference = baseline.get(name, {}).get(str(size))
+    if not reference:
+        return "SANS RÉFÉRENCE", True
+    if reference.get("digest") and reference["digest"] != measure["digest"]:
+        return "SORTIE DIFFÉRENTE", True
+    ratio = measure["seconds"] / reference["seconds"] if reference["seconds"] else 1.0
+    if reference.get("calibration"):
+        # Temps ramenés à la vitesse de la machine au moment de chaque mesure
+        ratio *= reference["calibration"] / measure["calibration"]
+    if ratio > tolerance:
+        return f"RÉGRESSION x{ratio:.2f}", True
+    return f"x{ratio:.2f}", False
+
+
+def main():
+    """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Micro-benchmarks des conversions, écritures et post-traitements")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Nombres de segments (défaut: {DEFAULT_SIZES})")
+    parser.add_argument("--only", help="Benchmarks à exécuter, séparés par des virgules")
+    parser.add_argument("--all", action="store_true", help="Ignorer les tailles maximales (pycaption est lent)")
+    parser.add_argument("--repeat", type=int, default=3, help="Séries par mesure, meilleur temps retenu (défaut: 3)")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Temps mesuré minimal d'une série en secondes (défaut: 0.2)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Fichier de référence JSON")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Ralentissement toléré (défaut: x1.5)")
+    parser.add_argument("--update-baseline", action="store_true", help="Enregistrer les mesures comme nouvelle référence")
+    parser.add_argument("--json", help="Écrire les mesures dans ce fichier JSON")
+    args = parser.parse_args()
+
+    # Les conversions journalisent chaque appel : rester silencieux pendant les mesures
+    logging.basicConfig(level=logging.WARNING)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Benchmarks inconnus: {', '.join(unknown)} (choix: {', '.join(BENCHMARKS)})")
+
+    stored = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            stored = json.load(f).get("benchmarks", {})
+
+    results: Dict[str, Dict[str, Any]] = {}
+    failures = []
+    print(f"{'Benchmark':<22} {'Segments':>9} {'Temps (s)':>10} {'µs/segment':>11}  Statut")
+    print("-" * 70)
+
+    with tempfile.TemporaryDirectory(prefix="jj_bench_") as tmp_dir:
+        for size in sizes:
+            ctx = Context(size, tmp_dir)
+            for name in names:
+                factory, max_size = BENCHMARKS[name]
+                if max_size and size > max_size and not args.all:
+                    continue
+                measure = run_benchmark(factory, ctx, args.repeat, args.min_time)
+                if args.update_baseline:
+                    status, failed = "enregistré", False
+                else:
+                    status, failed = compare(name, size, measure, stored, args.tolerance)
+                    if failed and status.startswith("RÉGRESSION"):
+                        # Confirmation : un ralentissement doit se reproduire sur une nouvelle mesure
+                        retry = run_benchmark(factory, ctx, args.repeat, args.min_time)
+                        if retry["seconds"] / retry["calibration"] < measure["seconds"] / measure["calibration"]:
+                            measure = retry
+                        status, failed = compare(name, size, measure, stored, args.tolerance)
+                results.setdefault(name, {})[str(size)] = measure
+                if failed:
+                    failures.append(f"{name} ({size}): {status}")
+                print(f"{name:<22} {size:>9} {measure['seconds']:>10.4f} {measure['us_per_segment']:>11.2f}  {status}")
+
+    report = {"python": platform.python_version(), "machine": platform.machine(), "benchmarks": results}
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        # Les mesures non refaites (autres tailles ou benchmarks) sont conservées
+        for name, measures in results.items():
+            stored.setdefault(name, {}).update(measures)
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({**report, "benchmarks": stored}, f, indent=2)
+        print(f"\n📄 Référence enregistrée: {args.baseline}")
+        return
+
+    if failures:
+        print("\n❌ Régressions détectées:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\n✅ Aucune régression")
+
+
+if __name__ == "__main__":
+    main()
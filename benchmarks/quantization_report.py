@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Compare un modèle Whisper fp32 et sa version quantifiée int8 sur un fichier local.
+
+Exemples:
+  python benchmarks/quantization_report.py Test_Vid/extrait.wav --model small
+  python benchmarks/quantization_report.py Test_Vid/extrait.wav --random --seconds 30
+"""
+
+import sys
+import json
+import copy
+import argparse
+import logging
+from pathlib import Path
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from transcription.audio_cache import SAMPLE_RATE, load_audio
+from transcription.backends import get_backend
+from transcription.quantization import quantize_model, compare_quantized
+from transcription.stub_models import random_tiny_model
+
+
+def main():
+    """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Bilan vitesse/mémoire/précision de la quantification int8")
+    parser.add_argument("fixture", help="Fichier audio/vidéo de référence")
+    parser.add_argument("--model", "-m", default="tiny", help="Modèle Whisper (défaut: tiny)")
+    parser.add_argument("--random", action="store_true", help="Modèle tiny initialisé aléatoirement (sans téléchargement)")
+    parser.add_argument("--language", "-l", default="French", help="Langue du contenu (défaut: French)")
+    parser.add_argument("--seconds", type=float, default=0, help="Limiter l'audio aux N premières secondes")
+    parser.add_argument("--repeats", type=int, default=1, help="Transcriptions par modèle (meilleur temps retenu)")
+    parser.add_argument("--json", help="Écrire le bilan dans ce fichier JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    audio = load_audio(args.fixture)
+    if args.seconds:
+        audio = audio[:int(args.seconds * SAMPLE_RATE)]
+
+    if args.random:
+        fp32_model = random_tiny_model()
+    else:
+        fp32_model = get_backend("whisper").load(args.model, "cpu")
+    int8_model = quantize_model(copy.deepcopy(fp32_model), "int8")
+
+    options = {"language": args.language}
+    if args.random:
+        # Un modèle aléatoire ne produit que du bruit : borner le décodage
+        options.update({"temperature": 0.0, "condition_on_previous_text": False, "sample_len": 32})
+    report = compare_quantized(fp32_model, int8_model, audio, repeats=args.repeats, **options)
+    report["model"] = "random-tiny" if args.random else args.model
+
+    print(f"\n📊 Quantification int8 — modèle {report['model']}, {report['duration']:.1f}s d'audio")
+    for name in ("fp32", "int8"):
+        stats = report[name]
+        print(f"  {name}: {stats['seconds']:.2f}s (facteur temps réel {stats['rtf']:.3f}), {stats['size_mb']:.0f} Mo")
+    print(f"  Accélération: x{report['speedup']:.2f}")
+    print(f"  WER int8 / fp32: {report['wer_vs_fp32']:.1%}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Bilan écrit: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
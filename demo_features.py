@@ -68,7 +68,7 @@ def demo_formats(result, video_path):
     logger.info("=" * 50)
     
     try:
-        whisper_handler = WhisperHandler()
+        whisper_handler = WhisperHandler(model_name="tiny")
         converter = FormatConverter()
         
         base_name = video_path.replace('.mp4', '')
@@ -124,7 +124,7 @@ def demo_timecodes(video_path):
     logger.info("=" * 50)
     
     try:
-        whisper_handler = WhisperHandler()
+        whisper_handler = WhisperHandler(model_name="tiny")
         
         # Récupérer le timecode LTC
         ltc_timecode = whisper_handler._get_ltc_timecode(video_path)
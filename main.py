@@ -4,15 +4,33 @@ Point d'entrée principal de l'application JJ Caption.
 """
 
 import argparse
+import glob
 import logging
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 # Ajouter le répertoire src au path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from transcription.whisper_handler import WhisperHandler
+from transcription.backends import DEFAULT_BACKEND, available_backends
+from transcription.postprocess import DEFAULT_STAGES
+from transcription.segment_table import SegmentTable
+from transcription.timing import reflow
+from transcription.media_info import get_duration
+from transcription.ffmpeg_tools import set_tool_path
+from transcription.pipeline import PrefetchPipeline
+from profiling import enable_profiling, disable_profiling
+from transcription.cpu_budget import parse_cpu_list, plan_workers, split_cpus, claim_cpu_set
+from transcription.batch import (
+    SUPPORTED_EXTENSIONS, STATUS_COMPLETED, STATUS_FAILED,
+    JobManifest, expand_inputs, format_throughput
+)
 from conversion.format_converter import FormatConverter
 
 
@@ -54,10 +72,9 @@ def validate_input_file(file_path: str) -> bool:
         return False
     
     # Vérifier l'extension
-    supported_extensions = {'.mp4', '.mkv', '.mov', '.avi', '.wmv', '.mp3', '.wav', '.m4a', '.flac'}
-    if path.suffix.lower() not in supported_extensions:
+    if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
         print(f"❌ Erreur: Format de fichier non supporté: {path.suffix}")
-        print(f"Formats supportés: {', '.join(supported_extensions)}")
+        print(f"Formats supportés: {', '.join(SUPPORTED_EXTENSIONS)}")
         return False
     
     return True
@@ -85,8 +102,362 @@ def get_output_path(input_path: str, output_format: str, output_dir: Optional[st
         return str(input_path.parent / f"{input_path.stem}.{output_format}")
 
 
-def main():
-    """Fonction principale."""
+def create_handler(args: argparse.Namespace) -> WhisperHandler:
+    """
+    Crée le gestionnaire Whisper à partir des options de la ligne de commande.
+    
+    Args:
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        Gestionnaire Whisper
+    """
+    return WhisperHandler(
+        model_name=args.model,
+        use_result_cache=not args.no_cache,
+        refresh_cache=args.refresh,
+        use_vad=args.vad,
+        # Détection rapide de la langue seulement si elle n'est pas imposée
+        language_model=None if args.language else args.language_model,
+        quantize=args.quantize,
+        backend=args.backend,
+        num_threads=args.threads,
+        cpu_affinity=args.cpu_affinity,
+        corrections=args.corrections,
+        post_process_stages=args.post_process_stages.split(",") if args.post_process_stages else None
+    )
+
+
+def process_file(
+    whisper_handler: WhisperHandler,
+    converter: FormatConverter,
+    input_path: str,
+    args: argparse.Namespace
+) -> List[str]:
+    """
+    Transcrit un fichier et génère ses formats de sortie.
+    
+    Args:
+        whisper_handler: Gestionnaire Whisper (modèle réutilisé d'un fichier à l'autre)
+        converter: Convertisseur de formats
+        input_path: Fichier à traiter
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        Chemins des fichiers générés
+    """
+    logger = logging.getLogger(__name__)
+    output_formats = [fmt.strip() for fmt in args.output.split(",")]
+    
+    # Transcription
+    logger.info(f"🎬 Transcription de: {input_path}")
+    if args.stream or args.long_form:
+        # Écriture incrémentale : les fichiers se remplissent pendant le décodage
+        outputs = {}
+        for output_format in output_formats:
+            if output_format in ["srt", "vtt", "txt"]:
+                outputs[output_format] = get_output_path(input_path, output_format, args.output_dir)
+            else:
+                logger.warning(f"⚠️ Format non supporté en mode flux ignoré: {output_format}")
+        
+        segments = whisper_handler.transcribe_iter(
+            input_path=input_path,
+            language=args.language,
+            task=args.task,
+            bounded_memory=args.long_form
+        )
+        if args.post_process:
+            # Post-traitement au fil du flux, pendant la transcription
+            segments = whisper_handler.post_process_stream(segments)
+        if timing_rules(args):
+            logger.warning("⚠️ Options de minutage ignorées en mode flux")
+        count = whisper_handler.save_stream(segments, outputs, input_path)
+        logger.info(f"✅ {count} segments écrits")
+        return [path for path in outputs.values() if Path(path).exists()]
+    
+    if args.draft_model:
+        result = whisper_handler.transcribe_cascade(
+            input_path=input_path,
+            language=args.language,
+            task=args.task,
+            draft_model=args.draft_model
+        )
+    elif args.chunk_minutes > 0:
+        result = whisper_handler.transcribe_chunked(
+            input_path=input_path,
+            language=args.language,
+            task=args.task,
+            chunk_minutes=args.chunk_minutes,
+            workers=args.workers
+        )
+    else:
+        result = whisper_handler.transcribe(
+            input_path=input_path,
+            language=args.language,
+            task=args.task
+        )
+    
+    return write_outputs(whisper_handler, converter, input_path, result, args)
+
+
+def timing_rules(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Règles de minutage demandées sur la ligne de commande.
+    
+    Args:
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        Arguments de timing.reflow (vide si aucune règle)
+    """
+    rules = {
+        "merge_under": args.merge_under,
+        "max_chars": args.max_chars,
+        "max_cps": args.max_cps,
+        "min_duration": args.min_display,
+        "max_gap": args.max_gap,
+    }
+    rules = {name: value for name, value in rules.items() if value is not None}
+    if rules:
+        rules["min_gap"] = args.min_gap
+    return rules
+
+
+def write_outputs(
+    whisper_handler: WhisperHandler,
+    converter: FormatConverter,
+    input_path: str,
+    result: Dict[str, Any],
+    args: argparse.Namespace
+) -> List[str]:
+    """
+    Génère les formats de sortie d'un résultat de transcription.
+    
+    Args:
+        whisper_handler: Gestionnaire Whisper
+        converter: Convertisseur de formats
+        input_path: Fichier source
+        result: Résultat de la transcription
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        Chemins des fichiers générés
+    """
+    logger = logging.getLogger(__name__)
+    output_formats = [fmt.strip() for fmt in args.output.split(",")]
+    
+    # Représentation en colonnes partagée par le post-traitement et les writers
+    table = SegmentTable.from_result(result)
+    if args.post_process:
+        table = whisper_handler.post_process_transcription(table)
+    rules = timing_rules(args)
+    if rules:
+        table = reflow(table, **rules)
+        logger.info(f"⏱️ Minutage recalculé: {len(table)} segments")
+    
+    # Génération des formats de sortie
+    generated = []
+    for output_format in output_formats:
+        output_path = get_output_path(input_path, output_format, args.output_dir)
+        
+        logger.info(f"💾 Sauvegarde au format {output_format.upper()}: {output_path}")
+        
+        if output_format == "srt":
+            whisper_handler.save_srt(table, output_path)
+        elif output_format == "vtt":
+            whisper_handler.save_vtt(table, output_path)
+        elif output_format == "txt":
+            whisper_handler.save_txt(table, output_path, input_path)
+        elif output_format == "json":
+            whisper_handler.save_json(table, output_path)
+        elif output_format in ["scc", "ass"]:
+            # Sauvegarder d'abord en SRT temporaire
+            temp_srt = get_output_path(input_path, "srt", args.output_dir)
+            whisper_handler.save_srt(table, temp_srt)
+            
+            # Convertir vers le format cible
+            if output_format == "scc":
+                converter.srt_to_scc(temp_srt, output_path)
+            elif output_format == "ass":
+                converter.srt_to_ass(temp_srt, output_path)
+            
+            # Supprimer le fichier temporaire
+            Path(temp_srt).unlink(missing_ok=True)
+        else:
+            logger.warning(f"⚠️ Format non supporté ignoré: {output_format}")
+            continue
+        
+        if Path(output_path).exists():
+            generated.append(output_path)
+    
+    return generated
+
+
+# Composants propres à chaque processus du lot (un modèle par processus)
+_batch_components = None
+
+
+def _init_batch_worker(args: argparse.Namespace, slot=None, cpu_sets: Optional[List[List[int]]] = None) -> None:
+    """Initialise un processus du lot : logging, cœurs attribués et gestionnaire Whisper."""
+    global _batch_components
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper()),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    if slot is not None:
+        args = argparse.Namespace(**{**vars(args), "cpu_affinity": claim_cpu_set(slot, cpu_sets)})
+    _batch_components = (create_handler(args), FormatConverter(), args)
+
+
+def _run_batch_job(input_path: str) -> Dict[str, Any]:
+    """Traite un fichier du lot et retourne son bilan."""
+    whisper_handler, converter, args = _batch_components
+    return run_job(whisper_handler, converter, input_path, args)
+
+
+def run_job(
+    whisper_handler: WhisperHandler,
+    converter: FormatConverter,
+    input_path: str,
+    args: argparse.Namespace
+) -> Dict[str, Any]:
+    """
+    Traite un fichier sans interrompre le lot en cas d'erreur.
+    
+    Args:
+        whisper_handler: Gestionnaire Whisper
+        converter: Convertisseur de formats
+        input_path: Fichier à traiter
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        Bilan (path, status, outputs, duration, elapsed, error)
+    """
+    start = time.perf_counter()
+    try:
+        outputs = process_file(whisper_handler, converter, input_path, args)
+        status, error = STATUS_COMPLETED, None
+    except Exception as e:
+        logging.getLogger(__name__).error(f"❌ Erreur lors du traitement de {input_path}: {e}")
+        outputs, status, error = [], STATUS_FAILED, str(e)
+    
+    return {
+        "path": input_path,
+        "status": status,
+        "outputs": outputs,
+        "duration": get_duration(input_path) or 0.0,
+        "elapsed": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def run_batch(files: List[str], args: argparse.Namespace) -> bool:
+    """
+    Traite un lot de fichiers avec reprise via le manifeste.
+    
+    Args:
+        files: Fichiers du lot
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        True si tous les fichiers ont été traités avec succès
+    """
+    logger = logging.getLogger(__name__)
+    
+    manifest_path = args.manifest or os.path.join(args.output_dir or ".", "jj_caption_manifest.json")
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+    manifest = JobManifest(manifest_path)
+    pending = manifest.add(files)
+    
+    skipped = len(files) - len(pending)
+    if skipped:
+        logger.info(f"⏭️ {skipped} fichier(s) déjà traité(s), ignoré(s)")
+    
+    # Répartition des cœurs entre processus et threads (--jobs 0 : automatique)
+    jobs = args.jobs
+    if jobs != 1:
+        jobs, threads = plan_workers(len(pending), args.jobs or None, args.threads, cpus=args.cpu_affinity)
+        if jobs > 1:
+            args = argparse.Namespace(**{**vars(args), "threads": threads})
+    logger.info(f"📦 Lot de {len(pending)} fichier(s) à traiter avec {jobs} processus")
+    
+    wall_start = time.perf_counter()
+    reports = []
+    
+    def record(report: Dict[str, Any]) -> None:
+        reports.append(report)
+        manifest.mark(
+            report["path"], report["status"],
+            outputs=report["outputs"], duration=report["duration"],
+            elapsed=round(report["elapsed"], 2), error=report["error"]
+        )
+        icon = "✅" if report["status"] == STATUS_COMPLETED else "❌"
+        print(f"  {icon} [{len(reports)}/{len(pending)}] {report['path']} ({report['elapsed']:.1f}s)")
+    
+    streaming = args.stream or args.long_form
+    if jobs <= 1 and args.prefetch > 0 and not streaming and args.chunk_minutes <= 0 and not args.draft_model:
+        # Décodage des fichiers suivants et écriture des sorties en arrière-plan,
+        # pendant que le modèle transcrit le fichier courant
+        whisper_handler = create_handler(args)
+        converter = FormatConverter()
+        pipeline = PrefetchPipeline(whisper_handler, prefetch=args.prefetch)
+        
+        def writer(input_path: str, result: Dict[str, Any]) -> List[str]:
+            return write_outputs(whisper_handler, converter, input_path, result, args)
+        
+        last = time.perf_counter()
+        for input_path, outputs, error in pipeline.run(pending, args.language, args.task, writer=writer):
+            now = time.perf_counter()
+            record({
+                "path": input_path,
+                "status": STATUS_FAILED if error else STATUS_COMPLETED,
+                "outputs": outputs or [],
+                "duration": get_duration(input_path) or 0.0,
+                "elapsed": now - last,
+                "error": str(error) if error else None,
+            })
+            last = now
+    elif jobs <= 1:
+        # Un seul gestionnaire : le modèle est chargé une fois pour tout le lot
+        whisper_handler = create_handler(args)
+        converter = FormatConverter()
+        for input_path in pending:
+            record(run_job(whisper_handler, converter, input_path, args))
+    else:
+        # Un modèle par processus, réutilisé pour tous les fichiers qu'il traite
+        logger.info(f"🧵 {args.threads} thread(s) par processus")
+        context = get_context("spawn")
+        cpu_sets = split_cpus(args.cpu_affinity, jobs, args.threads) if args.cpu_affinity else None
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=context,
+            initializer=_init_batch_worker,
+            initargs=(args, context.Value("i", 0), cpu_sets)
+        ) as executor:
+            futures = [executor.submit(_run_batch_job, input_path) for input_path in pending]
+            for future in as_completed(futures):
+                record(future.result())
+    
+    wall_seconds = time.perf_counter() - wall_start
+    completed = [r for r in reports if r["status"] == STATUS_COMPLETED]
+    failed = [r for r in reports if r["status"] == STATUS_FAILED]
+    
+    print("\n📊 Bilan du lot:")
+    print(format_throughput(len(completed), wall_seconds, sum(r["duration"] for r in completed)))
+    print(f"Terminés: {len(completed)} | Échecs: {len(failed)} | Manifeste: {manifest_path}")
+    for report in failed:
+        print(f"  ❌ {report['path']}: {report['error']}")
+    
+    return not failed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Construit l'analyseur des arguments de la ligne de commande.
+    
+    Returns:
+        Analyseur argparse
+    """
     parser = argparse.ArgumentParser(
         description="JJ Caption - Générateur de sous-titres automatique",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -95,18 +466,38 @@ Exemples d'utilisation:
   python main.py video.mp4 --language French --output srt
   python main.py video.mp4 --language French --output vtt,scc,ass
   python main.py video.mp4 --model medium --output-dir ./subtitles
+  python main.py video.mp4 --model medium --quantize int8
+  python main.py video.mp4 --language auto --language-model base
+  python main.py video.mp4 --output vtt --refresh
+  python main.py episode.mp4 --chunk-minutes 5 --workers 4
+  python main.py episode.mp4 --output srt,txt --stream
+  python main.py episode.mp4 --output srt,txt --stream --post-process --corrections boquilla.txt
+  python main.py episode.mp4 --output srt --max-cps 17 --max-chars 84 --min-display 1 --max-gap 0.5 --min-gap 0.08
+  python main.py evenement_4h.mp4 --output srt,txt --long-form
+  python main.py episode.mp4 --model medium --draft-model tiny
+  python main.py ./episodes "archives/**/*.mp4" --jobs 2 --output-dir ./subtitles
+  python main.py ./episodes --jobs 0 --cpu-affinity 0-15 --output-dir ./subtitles
+  python main.py video.mp4 --output srt,txt --profile --profile-json profil.json
         """
     )
     
     parser.add_argument(
         "input",
-        help="Chemin vers le fichier vidéo/audio"
+        nargs="+",
+        help="Fichier(s) vidéo/audio, répertoire(s) ou motif(s) glob"
     )
     
     parser.add_argument(
         "--language", "-l",
         default="French",
-        help="Langue du contenu (défaut: French)"
+        help="Langue du contenu, ou \"auto\" pour la détecter (défaut: French)"
+    )
+    
+    parser.add_argument(
+        "--language-model",
+        default="tiny",
+        choices=["tiny", "base", "small"],
+        help="Modèle utilisé pour détecter la langue avec --language auto (défaut: tiny)"
     )
     
     parser.add_argument(
@@ -116,6 +507,19 @@ Exemples d'utilisation:
         help="Modèle Whisper à utiliser (défaut: medium)"
     )
     
+    parser.add_argument(
+        "--backend",
+        default=DEFAULT_BACKEND,
+        choices=available_backends(),
+        help="Moteur d'inférence (défaut: whisper ; fake = modèle factice déterministe pour les tests)"
+    )
+    
+    parser.add_argument(
+        "--quantize",
+        choices=["int8"],
+        help="Quantification dynamique du modèle pour l'inférence CPU (moins de mémoire, plus rapide)"
+    )
+    
     parser.add_argument(
         "--output", "-o",
         default="srt",
@@ -134,6 +538,177 @@ Exemples d'utilisation:
         help="Type de tâche (défaut: transcribe)"
     )
     
+    parser.add_argument(
+        "--chunk-minutes",
+        type=float,
+        default=0,
+        help="Découpe l'audio en morceaux de N minutes transcrits en parallèle (défaut: désactivé)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Nombre de processus pour la transcription par morceaux (défaut: selon les cœurs)"
+    )
+    
+    parser.add_argument(
+        "--draft-model",
+        choices=["tiny", "base", "small", "medium"],
+        help="Cascade : brouillon avec ce modèle, puis reprise des segments peu fiables avec --model"
+    )
+    
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Écrit les sous-titres (srt, vtt, txt) au fur et à mesure de la transcription"
+    )
+    
+    parser.add_argument(
+        "--long-form",
+        action="store_true",
+        help="Fichiers de plusieurs heures : audio lu par blocs, mémoire constante (implique --stream)"
+    )
+    
+    parser.add_argument(
+        "--post-process",
+        action="store_true",
+        help="Corrige les erreurs connues, la ponctuation et fusionne les segments trop courts"
+    )
+    
+    parser.add_argument(
+        "--post-process-stages",
+        help=f"Étapes du post-traitement dans l'ordre (défaut: {','.join(DEFAULT_STAGES)})"
+    )
+    
+    parser.add_argument(
+        "--corrections",
+        action="append",
+        metavar="FICHIER",
+        help="Dictionnaire de corrections propre à l'émission (JSON ou 'erreur => correction', répétable)"
+    )
+    
+    parser.add_argument(
+        "--merge-under",
+        type=float,
+        metavar="SECONDES",
+        help="Minutage : fusionne les segments plus courts avec les suivants"
+    )
+    
+    parser.add_argument(
+        "--max-chars",
+        type=int,
+        help="Minutage : découpe les segments de plus de N caractères"
+    )
+    
+    parser.add_argument(
+        "--max-cps",
+        type=float,
+        help="Minutage : vitesse de lecture maximale (caractères par seconde)"
+    )
+    
+    parser.add_argument(
+        "--min-display",
+        type=float,
+        metavar="SECONDES",
+        help="Minutage : durée d'affichage minimale d'un segment"
+    )
+    
+    parser.add_argument(
+        "--max-gap",
+        type=float,
+        metavar="SECONDES",
+        help="Minutage : comble les intervalles entre segments jusqu'à cette durée"
+    )
+    
+    parser.add_argument(
+        "--min-gap",
+        type=float,
+        default=0.0,
+        metavar="SECONDES",
+        help="Minutage : intervalle conservé entre deux segments (défaut: 0)"
+    )
+    
+    parser.add_argument(
+        "--vad",
+        action="store_true",
+        help="Ignore les passages sans parole (musique, silence) avant la transcription"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Désactive le cache des résultats de transcription"
+    )
+    
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recalcule la transcription et met à jour le cache"
+    )
+    
+    parser.add_argument(
+        "--ffmpeg",
+        metavar="CHEMIN",
+        help="Chemin de l'exécutable ffmpeg (défaut: JJ_CAPTION_FFMPEG, sinon recherche automatique)"
+    )
+    
+    parser.add_argument(
+        "--ffprobe",
+        metavar="CHEMIN",
+        help="Chemin de l'exécutable ffprobe (défaut: JJ_CAPTION_FFPROBE, sinon recherche automatique)"
+    )
+    
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Nombre de fichiers traités en parallèle en mode lot (0 = selon les cœurs, défaut: 1)"
+    )
+    
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Threads PyTorch par processus (défaut: cœurs disponibles répartis entre les processus)"
+    )
+    
+    parser.add_argument(
+        "--cpu-affinity",
+        type=parse_cpu_list,
+        default=None,
+        help="Cœurs utilisables, ex: 0-7,16-23 (répartis entre les processus du lot ou des morceaux)"
+    )
+    
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=2,
+        help="Nombre de fichiers décodés à l'avance en mode lot (0 pour désactiver, défaut: 2)"
+    )
+    
+    parser.add_argument(
+        "--manifest",
+        help="Manifeste de reprise du lot (défaut: <output-dir>/jj_caption_manifest.json)"
+    )
+    
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Affiche le temps passé dans chaque étape (découverte ffmpeg, décodage, inférence, écriture...)"
+    )
+    
+    parser.add_argument(
+        "--profile-json",
+        help="Écrit le profil des étapes dans ce fichier JSON (implique --profile)"
+    )
+    
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Ajoute au profil les pics d'allocation Python (tracemalloc, plus lent ; implique --profile)"
+    )
+    
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -141,74 +716,99 @@ Exemples d'utilisation:
         help="Niveau de logging (défaut: INFO)"
     )
     
+    return parser
+
+
+def main():
+    """Fonction principale."""
+    parser = build_parser()
     args = parser.parse_args()
+    if args.language.lower() == "auto":
+        args.language = None
     
     # Configuration du logging
     setup_logging(args.log_level)
-    logger = logging.getLogger(__name__)
     
+    # Chemins imposés de ffmpeg/ffprobe (hérités par les processus de travail)
+    if args.ffmpeg:
+        set_tool_path("ffmpeg", args.ffmpeg)
+    if args.ffprobe:
+        set_tool_path("ffprobe", args.ffprobe)
+    
+    # Profilage des étapes (aucune mesure sans --profile)
+    if args.profile or args.profile_json or args.profile_memory:
+        enable_profiling(trace_memory=args.profile_memory)
+    try:
+        run(args)
+    finally:
+        report_profile(args)
+
+
+def report_profile(args: argparse.Namespace) -> None:
+    """
+    Affiche (et enregistre si demandé) le bilan du profilage.
+    
+    Args:
+        args: Arguments de la ligne de commande
+    """
+    profiler = disable_profiling()
+    if profiler is None:
+        return
+    
+    print("\n⏱️ Profil par étape:")
+    if args.jobs != 1:
+        print("(les processus parallèles du lot ne sont pas inclus)")
+    print(profiler.format_table())
+    if args.profile_json:
+        profiler.save_json(args.profile_json)
+        print(f"📄 Profil JSON: {args.profile_json}")
+
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Traite le ou les fichiers demandés.
+    
+    Args:
+        args: Arguments de la ligne de commande
+    """
+    logger = logging.getLogger(__name__)
     logger.info("🚀 Démarrage de JJ Caption")
     
+    # Mode lot : répertoires, motifs glob ou plusieurs fichiers
+    batch_mode = len(args.input) > 1 or Path(args.input[0]).is_dir() or glob.has_magic(args.input[0])
+    
+    if batch_mode:
+        files = [path for path in expand_inputs(args.input) if validate_input_file(path)]
+        if not files:
+            print("❌ Erreur: Aucun fichier à traiter")
+            sys.exit(1)
+        try:
+            success = run_batch(files, args)
+        except KeyboardInterrupt:
+            logger.info("⏹️ Lot interrompu : relancez la même commande pour reprendre")
+            sys.exit(1)
+        sys.exit(0 if success else 1)
+    
+    input_path = args.input[0]
+    
     # Validation du fichier d'entrée
-    if not validate_input_file(args.input):
+    if not validate_input_file(input_path):
         sys.exit(1)
     
     try:
         # Initialisation des composants
         logger.info(f"📝 Initialisation du modèle Whisper: {args.model}")
-        whisper_handler = WhisperHandler(model_name=args.model)
-        
+        whisper_handler = create_handler(args)
         converter = FormatConverter()
         
-        # Transcription
-        logger.info(f"🎬 Transcription de: {args.input}")
-        result = whisper_handler.transcribe(
-            input_path=args.input,
-            language=args.language,
-            task=args.task
-        )
-        
-        # Génération des formats de sortie
-        output_formats = [fmt.strip() for fmt in args.output.split(",")]
-        
-        for output_format in output_formats:
-            output_path = get_output_path(args.input, output_format, args.output_dir)
-            
-            logger.info(f"💾 Sauvegarde au format {output_format.upper()}: {output_path}")
-            
-            if output_format == "srt":
-                whisper_handler.save_srt(result, output_path)
-            elif output_format == "vtt":
-                whisper_handler.save_vtt(result, output_path)
-            elif output_format == "txt":
-                whisper_handler.save_txt(result, output_path, args.input)
-            elif output_format == "json":
-                whisper_handler.save_json(result, output_path)
-            elif output_format in ["scc", "ass"]:
-                # Sauvegarder d'abord en SRT temporaire
-                temp_srt = get_output_path(args.input, "srt", args.output_dir)
-                whisper_handler.save_srt(result, temp_srt)
-                
-                # Convertir vers le format cible
-                if output_format == "scc":
-                    converter.srt_to_scc(temp_srt, output_path)
-                elif output_format == "ass":
-                    converter.srt_to_ass(temp_srt, output_path)
-                
-                # Supprimer le fichier temporaire
-                Path(temp_srt).unlink(missing_ok=True)
-            else:
-                logger.warning(f"⚠️ Format non supporté ignoré: {output_format}")
+        generated = process_file(whisper_handler, converter, input_path, args)
         
         logger.info("✅ Traitement terminé avec succès!")
         
         # Afficher les fichiers générés
         print("\n📁 Fichiers générés:")
-        for output_format in output_formats:
-            if output_format in ["srt", "vtt", "txt", "json", "scc", "ass"]:
-                output_path = get_output_path(args.input, output_format, args.output_dir)
-                if Path(output_path).exists():
-                    print(f"  ✅ {output_path}")
+        for output_path in generated:
+            print(f"  ✅ {output_path}")
         
     except KeyboardInterrupt:
         logger.info("⏹️ Traitement interrompu par l'utilisateur")
@@ -219,4 +819,4 @@ Exemples d'utilisation:
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -8,8 +8,12 @@ import json
 import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+import numpy as np
 from pycaption import SRTReader, SCCWriter, WebVTTReader, DFXPReader
 
+from profiling import profiled
+from transcription.segment_table import SegmentTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +33,7 @@ class FormatConverter:
             'json': 'JSON'
         }
     
+    @profiled("convert.vtt")
     def srt_to_vtt(self, input_path: str, output_path: str) -> None:
         """
         Convertit un fichier SRT en VTT.
@@ -65,6 +70,7 @@ class FormatConverter:
             logger.error(f"Erreur lors de la conversion SRT vers VTT: {e}")
             raise
     
+    @profiled("convert.scc")
     def srt_to_scc(self, input_path: str, output_path: str) -> None:
         """
         Convertit un fichier SRT en SCC.
@@ -95,6 +101,7 @@ class FormatConverter:
             logger.error(f"Erreur lors de la conversion SRT vers SCC: {e}")
             raise
     
+    @profiled("convert.ass")
     def srt_to_ass(self, input_path: str, output_path: str) -> None:
         """
         Convertit un fichier SRT en ASS.
@@ -106,31 +113,7 @@ class FormatConverter:
         try:
             logger.info(f"Conversion SRT vers ASS: {input_path} -> {output_path}")
             
-            # Lire le fichier SRT
-            segments = self._parse_srt(input_path)
-            
-            # Écrire en format ASS
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("[Script Info]\n")
-                f.write("Title: Generated Subtitles\n")
-                f.write("ScriptType: v4.00+\n")
-                f.write("WrapStyle: 0\n")
-                f.write("ScaledBorderAndShadow: yes\n")
-                f.write("YCbCr Matrix: TV.601\n\n")
-                
-                f.write("[V4+ Styles]\n")
-                f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
-                f.write("Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,2,2,10,10,10,1\n\n")
-                
-                f.write("[Events]\n")
-                f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-                
-                for segment in segments:
-                    start_time = self._format_timestamp_ass(segment['start'])
-                    end_time = self._format_timestamp_ass(segment['end'])
-                    text = segment['text'].replace('\n', '\\N')
-                    
-                    f.write(f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{text}\n")
+            self.table_to_ass(self.read_srt(input_path), output_path)
             
             logger.info("Conversion SRT vers ASS terminée")
             
@@ -138,6 +121,38 @@ class FormatConverter:
             logger.error(f"Erreur lors de la conversion SRT vers ASS: {e}")
             raise
     
+    def table_to_ass(self, table: SegmentTable, output_path: str) -> None:
+        """
+        Écrit une table de segments au format ASS.
+        
+        Args:
+            table: Segments en colonnes
+            output_path: Chemin de sortie ASS
+        """
+        starts = self._format_timestamps_ass(table.start)
+        ends = self._format_timestamps_ass(table.end)
+        
+        # Écrire en format ASS
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("[Script Info]\n")
+            f.write("Title: Generated Subtitles\n")
+            f.write("ScriptType: v4.00+\n")
+            f.write("WrapStyle: 0\n")
+            f.write("ScaledBorderAndShadow: yes\n")
+            f.write("YCbCr Matrix: TV.601\n\n")
+            
+            f.write("[V4+ Styles]\n")
+            f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
+            f.write("Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,2,2,10,10,10,1\n\n")
+            
+            f.write("[Events]\n")
+            f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
+            
+            for start_time, end_time, text in zip(starts, ends, table.text):
+                text = text.replace('\n', '\\N')
+                f.write(f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{text}\n")
+    
+    @profiled("convert.txt")
     def srt_to_txt(self, input_path: str, output_path: str) -> None:
         """
         Convertit un fichier SRT en TXT (texte simple).
@@ -149,11 +164,7 @@ class FormatConverter:
         try:
             logger.info(f"Conversion SRT vers TXT: {input_path} -> {output_path}")
             
-            segments = self._parse_srt(input_path)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for segment in segments:
-                    f.write(f"{segment['text']}\n")
+            self.table_to_txt(self.read_srt(input_path), output_path)
             
             logger.info("Conversion SRT vers TXT terminée")
             
@@ -161,6 +172,18 @@ class FormatConverter:
             logger.error(f"Erreur lors de la conversion SRT vers TXT: {e}")
             raise
     
+    def table_to_txt(self, table: SegmentTable, output_path: str) -> None:
+        """
+        Écrit le texte d'une table de segments, un segment par ligne.
+        
+        Args:
+            table: Segments en colonnes
+            output_path: Chemin de sortie TXT
+        """
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{text}\n" for text in table.text)
+    
+    @profiled("convert.json")
     def srt_to_json(self, input_path: str, output_path: str) -> None:
         """
         Convertit un fichier SRT en JSON.
@@ -172,15 +195,7 @@ class FormatConverter:
         try:
             logger.info(f"Conversion SRT vers JSON: {input_path} -> {output_path}")
             
-            segments = self._parse_srt(input_path)
-            
-            data = {
-                "format": "srt",
-                "segments": segments
-            }
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.table_to_json(self.read_srt(input_path), output_path)
             
             logger.info("Conversion SRT vers JSON terminée")
             
@@ -188,18 +203,34 @@ class FormatConverter:
             logger.error(f"Erreur lors de la conversion SRT vers JSON: {e}")
             raise
     
-    def _parse_srt(self, file_path: str) -> List[Dict[str, Any]]:
+    def table_to_json(self, table: SegmentTable, output_path: str, source_format: str = "srt") -> None:
         """
-        Parse un fichier SRT et retourne les segments.
+        Écrit une table de segments au format JSON.
+        
+        Args:
+            table: Segments en colonnes
+            output_path: Chemin de sortie JSON
+            source_format: Format d'origine indiqué dans le fichier
+        """
+        data = {
+            "format": source_format,
+            "segments": table.to_segments()
+        }
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    
+    @profiled("convert.parse_srt")
+    def read_srt(self, file_path: str) -> SegmentTable:
+        """
+        Lit un fichier SRT en table de segments.
         
         Args:
             file_path: Chemin du fichier SRT
             
         Returns:
-            Liste des segments avec start, end, text
+            Table des segments (index, start, end, text)
         """
-        segments = []
-        
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
@@ -207,20 +238,25 @@ class FormatConverter:
         pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n([\s\S]*?)(?=\n\n|\n\d+\n|$)'
         matches = re.findall(pattern, content)
         
-        for match in matches:
-            index = int(match[0])
-            start_time = self._parse_timestamp(match[1])
-            end_time = self._parse_timestamp(match[2])
-            text = match[3].strip()
-            
-            segments.append({
-                'index': index,
-                'start': start_time,
-                'end': end_time,
-                'text': text
-            })
+        return SegmentTable(
+            self._parse_timestamps([match[1] for match in matches]),
+            self._parse_timestamps([match[2] for match in matches]),
+            [match[3].strip() for match in matches],
+            columns={"index": np.fromiter((int(match[0]) for match in matches), dtype=np.int64, count=len(matches))},
+            keys=['index', 'start', 'end', 'text']
+        )
+    
+    def _parse_srt(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Parse un fichier SRT et retourne les segments.
         
-        return segments
+        Args:
+            file_path: Chemin du fichier SRT
+            
+        Returns:
+            Liste des segments avec index, start, end, text
+        """
+        return self.read_srt(file_path).to_segments()
     
     def _parse_timestamp(self, timestamp: str) -> float:
         """
@@ -238,6 +274,31 @@ class FormatConverter:
         
         return hours * 3600 + minutes * 60 + seconds + millisecs / 1000
     
+    def _parse_timestamps(self, timestamps: List[str]) -> np.ndarray:
+        """
+        Parse des timestamps SRT en secondes, en une fois (même calcul que _parse_timestamp).
+        
+        Args:
+            timestamps: Timestamps au format HH:MM:SS,mmm (largeur fixe)
+            
+        Returns:
+            Temps en secondes
+        """
+        try:
+            raw = "".join(timestamps).encode("ascii")
+        except UnicodeEncodeError:
+            # Chiffres non ASCII (acceptés par \d) : conversion une à une
+            return np.array([self._parse_timestamp(timestamp) for timestamp in timestamps], dtype=np.float64)
+        
+        # Chiffres de chaque timestamp lus directement dans un tampon d'octets
+        digits = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 12).astype(np.int64) - 48
+        hours = digits[:, 0] * 10 + digits[:, 1]
+        minutes = digits[:, 3] * 10 + digits[:, 4]
+        seconds = digits[:, 6] * 10 + digits[:, 7]
+        millisecs = digits[:, 9] * 100 + digits[:, 10] * 10 + digits[:, 11]
+        
+        return hours * 3600 + minutes * 60 + seconds + millisecs / 1000
+    
     def _format_timestamp_vtt(self, seconds: float) -> str:
         """
         Formate un timestamp en format VTT.
@@ -272,6 +333,23 @@ class FormatConverter:
         
         return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
     
+    def _format_timestamps_ass(self, seconds: np.ndarray) -> List[str]:
+        """
+        Formate un tableau de temps au format ASS (même calcul que _format_timestamp_ass).
+        
+        Args:
+            seconds: Temps en secondes
+            
+        Returns:
+            Timestamps formatés
+        """
+        hours = (seconds // 3600).astype(np.int64).tolist()
+        minutes = ((seconds % 3600) // 60).astype(np.int64).tolist()
+        secs = (seconds % 60).astype(np.int64).tolist()
+        centisecs = ((seconds % 1) * 100).astype(np.int64).tolist()
+        
+        return [f"{h}:{m:02d}:{s:02d}.{cs:02d}" for h, m, s, cs in zip(hours, minutes, secs, centisecs)]
+    
     def get_supported_formats(self) -> Dict[str, str]:
         """
         Retourne les formats supportés.
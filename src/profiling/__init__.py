@@ -0,0 +1,7 @@
+"""
+Module de mesure du temps et de la mémoire par étape de traitement.
+"""
+
+from .profiler import Profiler, enable_profiling, disable_profiling, get_profiler, profile_stage, profiled, record_stage
+
+__all__ = ['Profiler', 'enable_profiling', 'disable_profiling', 'get_profiler', 'profile_stage', 'profiled', 'record_stage']
\ No newline at end of file
@@ -0,0 +1,242 @@
+"""
+Instrumentation légère des étapes de traitement.
+
+Les étapes sont marquées par le décorateur @profiled ou le gestionnaire de
+contexte profile_stage. Tant qu'aucun profileur n'est activé, ces marques se
+réduisent à un test sur une variable globale : aucune mesure n'est prise.
+"""
+
+import json
+import time
+import logging
+import threading
+import functools
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_active: Optional["Profiler"] = None
+_null_context = nullcontext()
+
+
+class Profiler:
+    """
+    Agrège, par étape, le nombre d'appels, le temps total et le pic mémoire.
+
+    Les étapes peuvent s'imbriquer (le temps d'une étape inclut celui de ses
+    sous-étapes) et s'exécuter depuis plusieurs threads.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        Initialise le profileur.
+
+        Args:
+            trace_memory: Mesurer les pics d'allocation Python (tracemalloc, plus coûteux)
+        """
+        self.trace_memory = trace_memory
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started = time.perf_counter()
+
+    def start(self) -> None:
+        """Démarre les mesures (et tracemalloc si demandé)."""
+        self._started = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self) -> None:
+        """Arrête tracemalloc s'il a été démarré."""
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Mesure une étape.
+
+        Args:
+            name: Nom de l'étape (ex: "inference", "save.srt")
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        frame = {"peak": 0, "base": 0}
+        if self.trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # Le pic global est remis à zéro : le reporter d'abord sur les étapes englobantes
+            for parent in stack:
+                parent["peak"] = max(parent["peak"], peak)
+            tracemalloc.reset_peak()
+            frame["base"] = current
+        stack.append(frame)
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            peak_bytes = 0
+            if self.trace_memory and tracemalloc.is_tracing():
+                _, peak = tracemalloc.get_traced_memory()
+                frame["peak"] = max(frame["peak"], peak)
+                for parent in stack:
+                    parent["peak"] = max(parent["peak"], frame["peak"])
+                peak_bytes = max(0, frame["peak"] - frame["base"])
+            self._record(name, elapsed, peak_bytes)
+
+    def _record(self, name: str, elapsed: float, peak_bytes: int) -> None:
+        """Ajoute une mesure aux statistiques de l'étape."""
+        with self._lock:
+            stats = self.stats.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0, "peak_memory": 0})
+            stats["calls"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+            stats["peak_memory"] = max(stats["peak_memory"], peak_bytes)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Retourne le bilan des mesures.
+
+        Returns:
+            Dictionnaire (wall, trace_memory, stages) ; les étapes sont triées
+            par temps total décroissant
+        """
+        with self._lock:
+            stages = [
+                {"stage": name, **stats, "mean": stats["total"] / stats["calls"]}
+                for name, stats in self.stats.items()
+            ]
+        stages.sort(key=lambda stage: stage["total"], reverse=True)
+        return {
+            "wall": time.perf_counter() - self._started,
+            "trace_memory": self.trace_memory,
+            "stages": stages,
+        }
+
+    def format_table(self) -> str:
+        """
+        Formate le bilan sous forme de tableau texte.
+
+        Returns:
+            Tableau (étape, appels, total, moyenne, max, part du temps réel, pic mémoire)
+        """
+        report = self.report()
+        wall = report["wall"] or 1.0
+        width = max([len("Étape")] + [len(stage["stage"]) for stage in report["stages"]])
+
+        header = f"{'Étape':<{width}}  {'Appels':>7}  {'Total (s)':>10}  {'Moy. (s)':>9}  {'Max (s)':>9}  {'%':>6}"
+        if self.trace_memory:
+            header += f"  {'Pic (Mo)':>9}"
+        lines = [header, "-" * len(header)]
+        for stage in report["stages"]:
+            line = (
+                f"{stage['stage']:<{width}}  {stage['calls']:>7}  {stage['total']:>10.3f}  "
+                f"{stage['mean']:>9.4f}  {stage['max']:>9.3f}  {stage['total'] / wall:>6.1%}"
+            )
+            if self.trace_memory:
+                line += f"  {stage['peak_memory'] / (1024 * 1024):>9.1f}"
+            lines.append(line)
+        lines.append(f"Temps total: {report['wall']:.2f}s")
+        return "\n".join(lines)
+
+    def save_json(self, output_path: str) -> None:
+        """
+        Écrit le bilan au format JSON.
+
+        Args:
+            output_path: Chemin de sortie
+        """
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        logger.info(f"Profil écrit: {output_path}")
+
+
+def enable_profiling(trace_memory: bool = False) -> Profiler:
+    """
+    Active le profileur du processus.
+
+    Args:
+        trace_memory: Mesurer aussi les pics mémoire (tracemalloc)
+
+    Returns:
+        Profileur actif
+    """
+    global _active
+    if _active is not None:
+        _active.stop()
+    _active = Profiler(trace_memory)
+    _active.start()
+    return _active
+
+
+def disable_profiling() -> Optional[Profiler]:
+    """
+    Désactive le profileur du processus.
+
+    Returns:
+        Profileur qui était actif (pour lire son bilan), ou None
+    """
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Retourne le profileur actif, ou None."""
+    return _active
+
+
+def record_stage(name: str, elapsed: float) -> None:
+    """
+    Ajoute une durée mesurée par l'appelant si le profilage est actif.
+
+    Utile quand une étape ne s'exécute pas d'un seul tenant (étape d'un
+    générateur, par exemple) : le temps est cumulé puis enregistré en une fois.
+
+    Args:
+        name: Nom de l'étape
+        elapsed: Durée en secondes
+    """
+    if _active is not None:
+        _active._record(name, elapsed, 0)
+
+
+def profile_stage(name: str):
+    """
+    Gestionnaire de contexte mesurant une étape si le profilage est actif.
+
+    Args:
+        name: Nom de l'étape
+
+    Returns:
+        Contexte de mesure, ou contexte vide si le profilage est désactivé
+    """
+    if _active is None:
+        return _null_context
+    return _active.stage(name)
+
+
+def profiled(name: str) -> Callable:
+    """
+    Décorateur mesurant chaque appel d'une fonction si le profilage est actif.
+
+    Args:
+        name: Nom de l'étape
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,7 +1,33 @@
 """
 Module de transcription audio/vidéo avec Whisper.
+
+Les noms publics sont importés à leur première utilisation : importer un
+sous-module léger (segment_table, timing, ffmpeg_tools...) ne charge ni
+WhisperHandler ni ses dépendances.
 """
 
-from .whisper_handler import WhisperHandler
+import importlib
+from typing import Any
+
+# Nom public -> sous-module qui le définit
+_EXPORTS = {
+    'WhisperHandler': '.whisper_handler',
+    'ModelRegistry': '.model_registry',
+    'get_model_registry': '.model_registry',
+    'InferenceBackend': '.backends',
+    'get_backend': '.backends',
+    'register_backend': '.backends',
+    'available_backends': '.backends',
+    'SegmentTable': '.segment_table',
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = ['WhisperHandler'] 
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Importe un nom public à sa première utilisation."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,202 @@
+"""
+Décodage audio unique vers un cache NumPy mappé en mémoire.
+
+La piste audio est décodée une seule fois par ffmpeg en mono 16 kHz float32
+(format attendu par Whisper) et stockée dans un fichier .npy indexé par le
+hash du contenu du fichier source. Les exécutions suivantes relisent ce
+fichier par mmap au lieu de redécoder le conteneur.
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+import subprocess
+import threading
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .cache import file_signature, get_cache_dir
+from .ffmpeg_tools import get_ffmpeg_path
+from profiling import profiled
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+_hash_cache: Dict[tuple, str] = {}
+_lock = threading.Lock()
+
+
+def content_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Calcule le hash du contenu d'un fichier (mémorisé par chemin, taille et mtime).
+
+    Args:
+        file_path: Chemin du fichier
+        chunk_size: Taille des blocs de lecture
+
+    Returns:
+        Hash hexadécimal (BLAKE2b, 128 bits)
+    """
+    signature = file_signature(file_path)
+    with _lock:
+        if signature in _hash_cache:
+            return _hash_cache[signature]
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    value = digest.hexdigest()
+
+    with _lock:
+        _hash_cache[signature] = value
+    return value
+
+
+def decode_audio(file_path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Décode la première piste audio d'un fichier en mono float32.
+
+    Args:
+        file_path: Chemin du fichier audio/vidéo
+        sample_rate: Fréquence d'échantillonnage de sortie
+
+    Returns:
+        Signal audio normalisé entre -1 et 1
+    """
+    cmd = _decode_command(file_path, sample_rate)
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Impossible de décoder l'audio: {e.stderr.decode(errors='ignore')}") from e
+
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+def stream_audio(file_path: str, block_seconds: float = 30.0, sample_rate: int = SAMPLE_RATE) -> Iterator[np.ndarray]:
+    """
+    Décode la première piste audio par blocs de taille fixe.
+
+    Seul le bloc courant est en mémoire : la consommation ne dépend pas de la
+    durée du fichier. Fermer le générateur arrête ffmpeg.
+
+    Args:
+        file_path: Chemin du fichier audio/vidéo
+        block_seconds: Durée d'un bloc
+        sample_rate: Fréquence d'échantillonnage de sortie
+
+    Yields:
+        Blocs du signal audio mono float32 normalisé entre -1 et 1
+    """
+    block_bytes = max(1, int(block_seconds * sample_rate)) * 2
+    cmd = _decode_command(file_path, sample_rate)
+
+    # stderr dans un fichier temporaire : un tube plein bloquerait ffmpeg
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        completed = False
+        try:
+            while True:
+                data = process.stdout.read(block_bytes)
+                if not data:
+                    break
+                data = data[:len(data) - len(data) % 2]
+                yield np.frombuffer(data, np.int16).astype(np.float32) / 32768.0
+            completed = True
+        finally:
+            process.stdout.close()
+            if process.poll() is None and not completed:
+                process.kill()
+            returncode = process.wait()
+
+        if completed and returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"Impossible de décoder l'audio: {stderr.read().decode(errors='ignore')}")
+
+
+def _decode_command(file_path: str, sample_rate: int) -> List[str]:
+    """Construit la commande ffmpeg de décodage en PCM 16 bits mono."""
+    ffmpeg_path = get_ffmpeg_path()
+    if not ffmpeg_path:
+        raise RuntimeError("FFmpeg est requis pour décoder l'audio")
+
+    return [
+        ffmpeg_path, "-nostdin", "-threads", "0",
+        "-i", file_path,
+        "-map", "0:a:0", "-vn", "-sn", "-dn",
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate),
+        "-"
+    ]
+
+
+def get_audio_cache_path(file_path: str, sample_rate: int = SAMPLE_RATE) -> str:
+    """
+    Retourne le chemin du cache .npy d'un fichier.
+
+    Args:
+        file_path: Chemin du fichier source
+        sample_rate: Fréquence d'échantillonnage
+
+    Returns:
+        Chemin du fichier .npy
+    """
+    return str(get_cache_dir("audio") / f"{content_hash(file_path)}_{sample_rate}.npy")
+
+
+@profiled("audio.decode")
+def load_audio(file_path: str, sample_rate: int = SAMPLE_RATE, use_cache: bool = True) -> np.ndarray:
+    """
+    Retourne l'audio d'un fichier, depuis le cache si possible.
+
+    Args:
+        file_path: Chemin du fichier audio/vidéo
+        sample_rate: Fréquence d'échantillonnage
+        use_cache: Lire/écrire le cache disque
+
+    Returns:
+        Signal audio float32 (mappé en mémoire si issu du cache)
+    """
+    if not use_cache:
+        return decode_audio(file_path, sample_rate)
+
+    cache_path = get_audio_cache_path(file_path, sample_rate)
+    if os.path.exists(cache_path):
+        try:
+            audio = np.load(cache_path, mmap_mode="r")
+            logger.info(f"Audio chargé depuis le cache: {cache_path}")
+            return audio
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache audio illisible, nouveau décodage: {e}")
+
+    logger.info(f"Décodage audio: {file_path}")
+    audio = decode_audio(file_path, sample_rate)
+
+    # Écriture atomique pour ne jamais exposer un cache partiel
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.save(f, audio)
+        os.replace(tmp_path, cache_path)
+        return np.load(cache_path, mmap_mode="r")
+    except OSError as e:
+        logger.warning(f"Impossible d'écrire le cache audio: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return audio
+
+
+def get_audio_duration(audio: np.ndarray, sample_rate: Optional[int] = None) -> float:
+    """
+    Retourne la durée d'un signal audio en secondes.
+
+    Args:
+        audio: Signal audio
+        sample_rate: Fréquence d'échantillonnage (défaut: 16 kHz)
+
+    Returns:
+        Durée en secondes
+    """
+    return len(audio) / float(sample_rate or SAMPLE_RATE)
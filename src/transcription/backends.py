@@ -0,0 +1,237 @@
+"""
+Moteurs d'inférence utilisés par WhisperHandler.
+
+Un moteur sait charger un modèle, détecter la langue d'une fenêtre et
+transcrire un signal décodé ; le reste du pipeline (cache, VAD,
+fenêtrage, post-traitement, écriture) n'en dépend pas. Deux moteurs sont
+fournis :
+- whisper : openai-whisper (PyTorch) ;
+- fake : modèle factice déterministe (tests et benchmarks, sans poids).
+
+Les processus parallèles recréent le moteur par son nom : un moteur tiers
+doit être enregistré avec register_backend.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = "whisper"
+
+_UNSET = object()
+
+
+class InferenceBackend:
+    """
+    Interface d'un moteur d'inférence.
+
+    Les modèles chargés par load() sont conservés par le registre partagé ;
+    les autres méthodes reçoivent le modèle à utiliser.
+    """
+
+    name = ""
+    # Le modèle accepte la quantification dynamique PyTorch (quantize_model)
+    supports_quantize = False
+
+    def prepare(self, ffmpeg_path: Optional[str]) -> None:
+        """
+        Prépare l'environnement du moteur avant le décodage d'un fichier.
+
+        Appelée avant chaque lecture de fichier : l'implémentation doit être
+        peu coûteuse une fois la configuration faite.
+
+        Args:
+            ffmpeg_path: Chemin de ffmpeg résolu (None s'il est introuvable)
+        """
+
+    def load(self, model_name: str, device: str) -> Any:
+        """
+        Charge un modèle.
+
+        Args:
+            model_name: Nom du modèle (tiny, base, small, medium, large)
+            device: Device pour l'inférence
+
+        Returns:
+            Modèle chargé
+        """
+        raise NotImplementedError
+
+    def detect_language(self, model: Any, window: np.ndarray) -> Dict[str, float]:
+        """
+        Calcule la probabilité de chaque langue sur une fenêtre d'au plus 30 secondes.
+
+        Args:
+            model: Modèle chargé par load()
+            window: Signal audio mono 16 kHz float32
+
+        Returns:
+            Probabilité de chaque code de langue
+        """
+        raise NotImplementedError
+
+    def transcribe_window(self, model: Any, audio: np.ndarray, **options) -> Dict[str, Any]:
+        """
+        Transcrit un signal en mémoire.
+
+        Args:
+            model: Modèle chargé par load()
+            audio: Signal audio mono 16 kHz float32
+            **options: Options de décodage au format Whisper
+
+        Returns:
+            Résultat au format Whisper (text, segments, language)
+        """
+        raise NotImplementedError
+
+
+class OpenAIWhisperBackend(InferenceBackend):
+    """Moteur openai-whisper (PyTorch)."""
+
+    name = "whisper"
+    supports_quantize = True
+
+    # Chemin de ffmpeg déjà communiqué à Whisper (une seule configuration par processus)
+    _configured_ffmpeg: Any = _UNSET
+    _lock = threading.Lock()
+
+    def prepare(self, ffmpeg_path: Optional[str]) -> None:
+        """
+        Rend ffmpeg accessible à Whisper.
+
+        Whisper appelle "ffmpeg" par son nom : le répertoire de l'exécutable
+        résolu est donc ajouté au PATH si nécessaire.
+        """
+        cls = OpenAIWhisperBackend
+        if cls._configured_ffmpeg == ffmpeg_path:
+            return
+
+        with cls._lock:
+            if cls._configured_ffmpeg == ffmpeg_path:
+                return
+            if ffmpeg_path:
+                import whisper.audio
+                whisper.audio.ffmpeg_path = ffmpeg_path
+
+                ffmpeg_dir = os.path.dirname(ffmpeg_path)
+                path_entries = os.environ.get('PATH', '').split(os.pathsep)
+                if ffmpeg_dir and ffmpeg_dir not in path_entries:
+                    os.environ['PATH'] = ffmpeg_dir + os.pathsep + os.environ.get('PATH', '')
+                    logger.info(f"Répertoire FFmpeg ajouté au PATH: {ffmpeg_dir}")
+            else:
+                logger.warning("FFmpeg non trouvé, Whisper utilisera sa configuration par défaut")
+            cls._configured_ffmpeg = ffmpeg_path
+
+    def load(self, model_name: str, device: str) -> Any:
+        import whisper
+
+        try:
+            logger.info(f"Chargement du modèle Whisper: {model_name}")
+
+            # Charger le modèle avec des options spécifiques pour éviter les erreurs
+            model = whisper.load_model(
+                model_name,
+                device=device,
+                download_root=None,
+                in_memory=False
+            )
+            logger.info("Modèle chargé avec succès")
+            return model
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement du modèle: {e}")
+            # Essayer avec des options de fallback
+            try:
+                logger.info("Tentative de chargement avec options de fallback...")
+                model = whisper.load_model(model_name, device="cpu")
+                logger.info("Modèle chargé avec succès (fallback)")
+                return model
+            except Exception as e2:
+                logger.error(f"Erreur lors du chargement de fallback: {e2}")
+                raise
+
+    def detect_language(self, model: Any, window: np.ndarray) -> Dict[str, float]:
+        import whisper
+
+        n_mels = getattr(getattr(model, "dims", None), "n_mels", 80)
+        mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(window), n_mels).to(model.device)
+        _, probs = model.detect_language(mel)
+        return {code: float(prob) for code, prob in probs.items()}
+
+    def transcribe_window(self, model: Any, audio: np.ndarray, **options) -> Dict[str, Any]:
+        return model.transcribe(audio, **options)
+
+
+class FakeBackend(InferenceBackend):
+    """
+    Moteur factice déterministe (voir stub_models.FakeWhisperModel).
+
+    Le résultat ne dépend que de la durée du signal : utile pour tester le
+    pipeline complet sans modèle ni PyTorch.
+    """
+
+    name = "fake"
+
+    def __init__(self, **model_options):
+        """
+        Initialise le moteur factice.
+
+        Args:
+            **model_options: Options de FakeWhisperModel (script, segment_seconds,
+                language, realtime_factor)
+        """
+        self.model_options = model_options
+
+    def load(self, model_name: str, device: str) -> Any:
+        from .stub_models import FakeWhisperModel
+
+        logger.info(f"Modèle factice utilisé à la place de {model_name}")
+        return FakeWhisperModel(**self.model_options)
+
+    def detect_language(self, model: Any, window: np.ndarray) -> Dict[str, float]:
+        _, probs = model.detect_language(window)
+        return dict(probs)
+
+    def transcribe_window(self, model: Any, audio: np.ndarray, **options) -> Dict[str, Any]:
+        return model.transcribe(audio, **options)
+
+
+_backends: Dict[str, Callable[[], InferenceBackend]] = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FakeBackend.name: FakeBackend,
+}
+
+
+def register_backend(name: str, factory: Callable[[], InferenceBackend]) -> None:
+    """
+    Enregistre un moteur d'inférence.
+
+    Args:
+        name: Nom du moteur (option --backend)
+        factory: Fonction sans argument créant le moteur
+    """
+    _backends[name] = factory
+
+
+def available_backends() -> List[str]:
+    """Retourne les noms des moteurs enregistrés."""
+    return list(_backends)
+
+
+def get_backend(name: str = DEFAULT_BACKEND) -> InferenceBackend:
+    """
+    Crée le moteur d'inférence demandé.
+
+    Args:
+        name: Nom du moteur
+
+    Returns:
+        Moteur d'inférence
+    """
+    if name not in _backends:
+        raise ValueError(f"Moteur d'inférence inconnu: {name} (choix: {', '.join(_backends)})")
+    return _backends[name]()
@@ -0,0 +1,181 @@
+"""
+Outils pour le traitement par lots : sélection des fichiers et manifeste de reprise.
+"""
+
+import os
+import glob
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = {'.mp4', '.mkv', '.mov', '.avi', '.wmv', '.mp3', '.wav', '.m4a', '.flac'}
+
+STATUS_PENDING = "pending"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+
+def expand_inputs(inputs: Iterable[str], extensions: Optional[set] = None) -> List[str]:
+    """
+    Développe une liste de fichiers, répertoires et motifs glob.
+
+    Args:
+        inputs: Chemins de fichiers, répertoires ou motifs (ex: "saison1/*.mp4")
+        extensions: Extensions retenues dans les répertoires et motifs
+
+    Returns:
+        Liste triée et dédoublonnée des fichiers trouvés
+    """
+    extensions = extensions or SUPPORTED_EXTENSIONS
+    files = []
+
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = sorted(
+                os.path.join(root, name)
+                for root, _, names in os.walk(item)
+                for name in names
+            )
+        elif glob.has_magic(item):
+            candidates = sorted(glob.glob(item, recursive=True))
+        else:
+            # Fichier explicite : conservé tel quel (validé plus tard)
+            files.append(item)
+            continue
+
+        files.extend(
+            path for path in candidates
+            if os.path.isfile(path) and os.path.splitext(path)[1].lower() in extensions
+        )
+
+    seen = set()
+    unique = []
+    for path in files:
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+class JobManifest:
+    """
+    Manifeste JSON des fichiers d'un lot (terminés, en échec, en attente).
+
+    Le manifeste est réécrit après chaque fichier : un lot interrompu reprend
+    là où il s'était arrêté. Un fichier modifié depuis son traitement est
+    traité de nouveau.
+    """
+
+    def __init__(self, path: str):
+        """
+        Charge (ou crée) le manifeste.
+
+        Args:
+            path: Chemin du fichier manifeste
+        """
+        self.path = path
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.jobs = json.load(f).get("jobs", {})
+                logger.info(f"Manifeste chargé: {path} ({len(self.jobs)} fichiers)")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Manifeste illisible, nouveau lot: {e}")
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+
+    @staticmethod
+    def _signature(file_path: str) -> Dict[str, Any]:
+        stat = os.stat(file_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def add(self, files: Iterable[str]) -> List[str]:
+        """
+        Enregistre les fichiers du lot et retourne ceux restant à traiter.
+
+        Args:
+            files: Fichiers du lot
+
+        Returns:
+            Fichiers en attente ou en échec (dans l'ordre d'entrée)
+        """
+        pending = []
+        with self._lock:
+            for file_path in files:
+                key = self._key(file_path)
+                job = self.jobs.get(key)
+                try:
+                    signature = self._signature(file_path)
+                except OSError:
+                    signature = {}
+
+                if job and job.get("status") == STATUS_COMPLETED and job.get("signature") == signature:
+                    continue
+
+                self.jobs[key] = {"status": STATUS_PENDING, "signature": signature}
+                pending.append(file_path)
+            self._save()
+        return pending
+
+    def mark(self, file_path: str, status: str, **details) -> None:
+        """
+        Met à jour l'état d'un fichier et réécrit le manifeste.
+
+        Args:
+            file_path: Fichier concerné
+            status: Nouvel état (completed, failed, pending)
+            **details: Informations complémentaires (erreur, durée, sorties...)
+        """
+        with self._lock:
+            job = self.jobs.setdefault(self._key(file_path), {})
+            job.update(details)
+            job["status"] = status
+            job["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            self._save()
+
+    def counts(self) -> Dict[str, int]:
+        """Retourne le nombre de fichiers par état."""
+        counts = {STATUS_PENDING: 0, STATUS_COMPLETED: 0, STATUS_FAILED: 0}
+        for job in self.jobs.values():
+            status = job.get("status", STATUS_PENDING)
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    def _save(self) -> None:
+        """Écrit le manifeste de façon atomique."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"jobs": self.jobs}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def format_throughput(files_done: int, wall_seconds: float, media_seconds: float) -> str:
+    """
+    Résume le débit d'un lot.
+
+    Args:
+        files_done: Nombre de fichiers traités
+        wall_seconds: Durée réelle du lot
+        media_seconds: Durée totale des médias traités
+
+    Returns:
+        Texte du résumé (fichiers/heure et facteur temps réel)
+    """
+    files_per_hour = files_done / (wall_seconds / 3600) if wall_seconds > 0 else 0.0
+    lines = [
+        f"Fichiers traités: {files_done} en {wall_seconds:.1f}s",
+        f"Débit: {files_per_hour:.1f} fichiers/heure",
+    ]
+    if media_seconds > 0:
+        lines.append(f"Audio traité: {media_seconds / 60:.1f} min (facteur temps réel: {wall_seconds / media_seconds:.3f})")
+    return "\n".join(lines)
@@ -0,0 +1,39 @@
+"""
+Emplacements des caches disque de JJ Caption.
+"""
+
+import os
+from pathlib import Path
+
+# Répertoire racine des caches, surchargeable par variable d'environnement
+CACHE_ENV_VAR = "JJ_CAPTION_CACHE_DIR"
+
+
+def get_cache_dir(subdir: str = "") -> Path:
+    """
+    Retourne (et crée si besoin) un répertoire de cache.
+
+    Args:
+        subdir: Sous-répertoire (media, audio, results...)
+
+    Returns:
+        Chemin du répertoire de cache
+    """
+    root = os.environ.get(CACHE_ENV_VAR) or os.path.join(os.path.expanduser("~"), ".cache", "jj_caption")
+    path = Path(root) / subdir if subdir else Path(root)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def file_signature(file_path: str) -> tuple:
+    """
+    Retourne la signature (chemin absolu, taille, mtime) d'un fichier.
+
+    Args:
+        file_path: Chemin du fichier
+
+    Returns:
+        Tuple (chemin absolu, taille en octets, mtime en nanosecondes)
+    """
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
@@ -0,0 +1,144 @@
+"""
+Cascade de modèles : brouillon rapide puis reprise des segments peu fiables.
+
+Un petit modèle transcrit tout le fichier ; seuls les segments dont les
+indicateurs de confiance Whisper (avg_logprob, compression_ratio,
+no_speech_prob) sortent des seuils sont retranscrits par le grand modèle,
+puis réinsérés dans le brouillon.
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLDS = {
+    "logprob_threshold": -0.8,
+    "compression_ratio_threshold": 2.4,
+    "no_speech_threshold": 0.6,
+}
+
+
+def find_low_confidence(segments: List[Dict[str, Any]], thresholds: Dict[str, float] = None) -> np.ndarray:
+    """
+    Repère les segments à retranscrire.
+
+    Args:
+        segments: Segments du brouillon
+        thresholds: Seuils (logprob_threshold, compression_ratio_threshold, no_speech_threshold)
+
+    Returns:
+        Masque booléen des segments peu fiables
+    """
+    thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    if not segments:
+        return np.zeros(0, dtype=bool)
+
+    avg_logprob = np.array([seg.get("avg_logprob", 0.0) for seg in segments], dtype=np.float64)
+    compression = np.array([seg.get("compression_ratio", 0.0) for seg in segments], dtype=np.float64)
+    no_speech = np.array([seg.get("no_speech_prob", 0.0) for seg in segments], dtype=np.float64)
+
+    return (
+        (avg_logprob < thresholds["logprob_threshold"])
+        | (compression > thresholds["compression_ratio_threshold"])
+        | (no_speech > thresholds["no_speech_threshold"])
+    )
+
+
+def plan_ranges(
+    segments: List[Dict[str, Any]],
+    flagged: np.ndarray,
+    total_duration: float,
+    padding: float = 0.5
+) -> List[Tuple[int, int, float, float]]:
+    """
+    Regroupe les segments peu fiables consécutifs en plages à retranscrire.
+
+    Chaque plage est élargie de `padding` secondes sans empiéter sur les
+    segments fiables voisins, qui sont conservés.
+
+    Args:
+        segments: Segments du brouillon
+        flagged: Masque des segments peu fiables
+        total_duration: Durée totale de l'audio
+        padding: Marge ajoutée de part et d'autre
+
+    Returns:
+        Liste de (premier index, dernier index exclu, début, fin)
+    """
+    if not flagged.any():
+        return []
+
+    padded = np.concatenate(([False], flagged, [False]))
+    changes = np.flatnonzero(padded[1:] != padded[:-1])
+    ranges = []
+    for first, last in zip(changes[0::2], changes[1::2]):
+        previous_end = segments[first - 1]["end"] if first > 0 else 0.0
+        next_start = segments[last]["start"] if last < len(segments) else total_duration
+        start = max(previous_end, segments[first]["start"] - padding, 0.0)
+        end = min(next_start, segments[last - 1]["end"] + padding, total_duration)
+        ranges.append((int(first), int(last), float(start), float(max(end, start))))
+    return ranges
+
+
+def splice(
+    draft: List[Dict[str, Any]],
+    ranges: List[Tuple[int, int, float, float]],
+    replacements: List[List[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """
+    Remplace les segments peu fiables du brouillon par leur nouvelle transcription.
+
+    Args:
+        draft: Segments du brouillon
+        ranges: Plages issues de plan_ranges
+        replacements: Segments retranscrits (timeline d'origine) pour chaque plage
+
+    Returns:
+        Segments fusionnés, renumérotés
+    """
+    merged = []
+    position = 0
+    for (first, last, _, _), new_segments in zip(ranges, replacements):
+        merged.extend(draft[position:first])
+        merged.extend(new_segments)
+        position = last
+    merged.extend(draft[position:])
+
+    for i, segment in enumerate(merged):
+        segment["id"] = i
+    return merged
+
+
+def cascade_report(
+    ranges: List[Tuple[int, int, float, float]],
+    flagged: np.ndarray,
+    total_duration: float,
+    draft_model: str,
+    final_model: str
+) -> Dict[str, Any]:
+    """
+    Résume la part de l'audio passée par le grand modèle.
+
+    Args:
+        ranges: Plages retranscrites
+        flagged: Masque des segments peu fiables
+        total_duration: Durée totale de l'audio
+        draft_model: Modèle du brouillon
+        final_model: Modèle de reprise
+
+    Returns:
+        Dictionnaire du bilan
+    """
+    retranscribed = float(sum(end - start for _, _, start, end in ranges))
+    return {
+        "draft_model": draft_model,
+        "final_model": final_model,
+        "segments": int(len(flagged)),
+        "flagged_segments": int(flagged.sum()),
+        "total": total_duration,
+        "retranscribed": retranscribed,
+        "retranscribed_ratio": retranscribed / total_duration if total_duration else 0.0,
+    }
@@ -0,0 +1,293 @@
+"""
+Transcription par morceaux en parallèle.
+
+Le signal audio est découpé en morceaux de N minutes sur des zones de silence,
+transcrit dans un pool de processus (un modèle par processus), puis les
+segments sont recollés dans un résultat unique au format Whisper.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .audio_cache import SAMPLE_RATE
+from .backends import DEFAULT_BACKEND
+from .cpu_budget import plan_workers, split_cpus, claim_cpu_set
+
+logger = logging.getLogger(__name__)
+
+# Fenêtre d'analyse de l'énergie (secondes)
+FRAME_SECONDS = 0.02
+
+_worker_handler = None
+
+
+def frame_energy(audio: np.ndarray, sample_rate: int = SAMPLE_RATE, frame_seconds: float = FRAME_SECONDS) -> np.ndarray:
+    """
+    Calcule l'énergie RMS par trame.
+
+    Args:
+        audio: Signal audio mono
+        sample_rate: Fréquence d'échantillonnage
+        frame_seconds: Durée d'une trame
+
+    Returns:
+        Énergie RMS de chaque trame complète
+    """
+    frame = max(1, int(sample_rate * frame_seconds))
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = np.asarray(audio[:n_frames * frame], dtype=np.float32).reshape(n_frames, frame)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+
+def find_split_points(
+    audio: np.ndarray,
+    chunk_seconds: float,
+    sample_rate: int = SAMPLE_RATE,
+    search_seconds: float = 15.0
+) -> List[int]:
+    """
+    Choisit les points de coupe les plus silencieux autour de chaque frontière cible.
+
+    Args:
+        audio: Signal audio mono
+        chunk_seconds: Durée cible d'un morceau
+        sample_rate: Fréquence d'échantillonnage
+        search_seconds: Marge de recherche autour de chaque frontière
+
+    Returns:
+        Indices d'échantillons des points de coupe (hors début et fin)
+    """
+    total = len(audio)
+    chunk = int(chunk_seconds * sample_rate)
+    if chunk <= 0 or total <= chunk:
+        return []
+
+    energy = frame_energy(audio, sample_rate)
+    frame = max(1, int(sample_rate * FRAME_SECONDS))
+    search = int(search_seconds / FRAME_SECONDS)
+
+    points = []
+    previous = 0
+    for target in range(chunk, total - chunk // 4, chunk):
+        center = target // frame
+        lo = max(previous // frame + 1, center - search)
+        hi = min(len(energy), center + search + 1)
+        if lo >= hi:
+            split = target
+        else:
+            split = (lo + int(np.argmin(energy[lo:hi]))) * frame
+        if split > previous:
+            points.append(split)
+            previous = split
+    return points
+
+
+def split_audio(audio: np.ndarray, chunk_seconds: float, sample_rate: int = SAMPLE_RATE) -> List[Tuple[int, int]]:
+    """
+    Découpe le signal en morceaux délimités par des silences.
+
+    Args:
+        audio: Signal audio mono
+        chunk_seconds: Durée cible d'un morceau
+        sample_rate: Fréquence d'échantillonnage
+
+    Returns:
+        Liste de bornes (début, fin) en échantillons
+    """
+    bounds = [0] + find_split_points(audio, chunk_seconds, sample_rate) + [len(audio)]
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i + 1] > bounds[i]]
+
+
+def stream_windows(
+    blocks: Iterable[np.ndarray],
+    window_seconds: float,
+    sample_rate: int = SAMPLE_RATE,
+    search_seconds: float = 15.0
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Regroupe un flux de blocs audio en fenêtres coupées sur les silences.
+
+    Même découpe que split_audio, mais sans jamais garder plus d'une fenêtre
+    (plus la marge de recherche et un bloc) en mémoire.
+
+    Args:
+        blocks: Blocs successifs du signal audio mono
+        window_seconds: Durée cible d'une fenêtre
+        sample_rate: Fréquence d'échantillonnage
+        search_seconds: Marge de recherche du silence autour de la frontière cible
+
+    Yields:
+        Tuples (indice d'échantillon de début, fenêtre)
+    """
+    window = int(window_seconds * sample_rate)
+    search = int(search_seconds * sample_rate)
+    frame = max(1, int(sample_rate * FRAME_SECONDS))
+
+    pending: List[np.ndarray] = []
+    pending_length = 0
+    offset = 0
+    for block in blocks:
+        pending.append(block)
+        pending_length += len(block)
+        while pending_length >= window + search:
+            buffer = np.concatenate(pending)
+            lo = max(frame, window - search)
+            energy = frame_energy(buffer[lo:window + search], sample_rate)
+            if len(energy):
+                # Trame la plus silencieuse, la plus proche de la frontière cible en cas d'égalité
+                quietest = np.flatnonzero(energy <= energy.min() + 1e-6)
+                split = lo + int(quietest[np.argmin(np.abs(quietest * frame + lo - window))]) * frame
+            else:
+                split = window
+            yield offset, buffer[:split]
+            pending = [buffer[split:]]
+            pending_length = len(pending[0])
+            offset += split
+
+    if pending_length:
+        yield offset, np.concatenate(pending)
+
+
+def stitch_results(results: List[Dict[str, Any]], offsets: List[float]) -> Dict[str, Any]:
+    """
+    Recolle des résultats Whisper partiels en un résultat unique.
+
+    Args:
+        results: Résultats de chaque morceau, dans l'ordre
+        offsets: Décalage temporel (secondes) de chaque morceau
+
+    Returns:
+        Résultat au format Whisper (text, segments, language)
+    """
+    segments = []
+    for result, offset in zip(results, offsets):
+        for segment in result.get("segments", []):
+            shifted = dict(segment)
+            shifted["id"] = len(segments)
+            shifted["start"] = segment["start"] + offset
+            shifted["end"] = segment["end"] + offset
+            if "seek" in segment:
+                shifted["seek"] = segment["seek"] + int(round(offset * 100))
+            if "words" in segment:
+                shifted["words"] = [
+                    dict(word, start=word["start"] + offset, end=word["end"] + offset)
+                    for word in segment["words"]
+                ]
+            segments.append(shifted)
+
+    language = next((r.get("language") for r in results if r.get("language")), None)
+    return {
+        "text": "".join(result.get("text", "") for result in results),
+        "segments": segments,
+        "language": language,
+    }
+
+
+def _init_worker(
+    model_name: str,
+    device: str,
+    num_threads: Optional[int],
+    use_vad: bool = False,
+    quantize: Optional[str] = None,
+    slot=None,
+    cpu_sets: Optional[List[List[int]]] = None,
+    backend: str = DEFAULT_BACKEND
+) -> None:
+    """Charge le modèle une fois par processus du pool."""
+    global _worker_handler
+    from .whisper_handler import WhisperHandler
+    _worker_handler = WhisperHandler(
+        model_name=model_name, device=device, use_audio_cache=False, use_vad=use_vad, quantize=quantize,
+        num_threads=num_threads, cpu_affinity=claim_cpu_set(slot, cpu_sets) if slot is not None else None,
+        backend=backend
+    )
+    _worker_handler.warmup()
+
+
+def _transcribe_chunk(job: Tuple[Any, int, int, Optional[str], str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Transcrit un morceau dans un processus du pool."""
+    source, start, end, language, task, options = job
+    if isinstance(source, str):
+        # Cache .npy : relu par mmap plutôt que transmis par pickle
+        audio = np.load(source, mmap_mode="r")[start:end]
+    else:
+        audio = source
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    return _worker_handler._transcribe_with_config(audio, language, task, **options)
+
+
+def transcribe_in_chunks(
+    audio: np.ndarray,
+    model_name: str,
+    device: str = "cpu",
+    language: Optional[str] = None,
+    task: str = "transcribe",
+    chunk_minutes: float = 10.0,
+    workers: Optional[int] = None,
+    use_vad: bool = False,
+    quantize: Optional[str] = None,
+    backend: str = DEFAULT_BACKEND,
+    num_threads: Optional[int] = None,
+    cpu_affinity: Optional[List[int]] = None,
+    **options
+) -> Dict[str, Any]:
+    """
+    Transcrit un signal audio par morceaux dans un pool de processus.
+
+    Args:
+        audio: Signal audio mono 16 kHz float32
+        model_name: Nom du modèle Whisper
+        device: Device pour l'inférence
+        language: Langue du contenu (auto-détection si None)
+        task: Type de tâche (transcribe ou translate)
+        chunk_minutes: Durée cible d'un morceau en minutes
+        workers: Nombre de processus (défaut: planifié selon les cœurs, borné au nombre de morceaux)
+        use_vad: Appliquer la VAD dans chaque processus
+        quantize: Quantification des modèles des processus ("int8")
+        backend: Nom du moteur d'inférence des processus
+        num_threads: Threads PyTorch par processus (défaut: planifié selon les cœurs)
+        cpu_affinity: Cœurs à répartir entre les processus (None = pas d'épinglage)
+        **options: Options de décodage transmises à Whisper
+
+    Returns:
+        Résultat recollé au format Whisper
+    """
+    bounds = split_audio(audio, chunk_minutes * 60)
+    if not bounds:
+        return {"text": "", "segments": [], "language": language}
+
+    workers, num_threads = plan_workers(len(bounds), workers, num_threads, cpus=cpu_affinity)
+    logger.info(f"Transcription en {len(bounds)} morceaux sur {workers} processus ({num_threads} threads chacun)")
+
+    # Un signal issu du cache .npy est relu par chaque processus plutôt que copié
+    source = getattr(audio, "filename", None)
+    if source and np.load(source, mmap_mode="r").shape != audio.shape:
+        source = None
+
+    jobs = []
+    for start, end in bounds:
+        if source:
+            jobs.append((source, start, end, language, task, options))
+        else:
+            chunk = np.ascontiguousarray(audio[start:end], dtype=np.float32)
+            jobs.append((chunk, 0, len(chunk), language, task, options))
+
+    # "spawn" évite d'hériter de l'état des threads PyTorch du processus parent
+    context = multiprocessing.get_context("spawn")
+    cpu_sets = split_cpus(cpu_affinity, workers, num_threads) if cpu_affinity else None
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(model_name, device, num_threads, use_vad, quantize, context.Value("i", 0), cpu_sets, backend)
+    ) as executor:
+        results = list(executor.map(_transcribe_chunk, jobs))
+
+    offsets = [start / SAMPLE_RATE for start, _ in bounds]
+    return stitch_results(results, offsets)
@@ -0,0 +1,249 @@
+"""
+Correction des erreurs de transcription récurrentes, en une seule passe.
+
+Le dictionnaire (erreur -> correction) est compilé en une expression
+régulière unique, factorisée en arbre des préfixes : chaque segment est
+parcouru une seule fois, quelle que soit la taille du dictionnaire. Seuls les
+mots entiers sont remplacés ("page" ne modifie pas "pages"), et l'entrée la
+plus longue l'emporte ("hébrigette" plutôt que "brigette").
+
+Des dictionnaires propres à une émission peuvent compléter (ou redéfinir) le
+dictionnaire par défaut :
+- JSON : objet {"erreur": "correction", ...} ;
+- texte : une entrée "erreur => correction" par ligne, "#" pour les commentaires.
+
+Les dictionnaires compilés sont conservés en mémoire et recompilés seulement
+si l'un des fichiers change.
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Erreurs de transcription françaises communes
+DEFAULT_CORRECTIONS: Dict[str, str] = {
+    "awe vi": "au revoir",
+    "brigette": "Brigitte",
+    "j'en amie": "Jean-Mi",
+    "ma tête": "matin",
+    "racker": "raquer",
+    "t'as barouette": "tabarouette",
+    "colombe": "Colombie",
+    "sèillés": "séries",
+    "singlé": "cinglées",
+    "vivrent": "vivre un",
+    "entraînement": "entre amis",
+    "coïnce": "convalescence",
+    "convallé sens": "convalescence",
+    "hébrigette": "Brigitte",
+    "boquillard": "Boquilla",
+    "pirelles": "pirogues",
+    "paix": "pêche",
+    "maix": "mer",
+    "t'explique": "typique",
+    "entriez": "intriguez",
+    "gure": "prêt",
+    "joviterrement": "majoritairement",
+    "afro-colorbienne": "afro-colombienne",
+    "haute haute": "communautaire",
+    "vitra-ditionnel": "vie traditionnel",
+    "ancestral": "ancestrales",
+    "Ronnaie": "Rony",
+    "attuyer": "capturer",
+    "crabeurs": "crabes",
+    "parles": "paroles",
+    "médé brûlée": "méditation",
+    "vacimmants": "investissements",
+    "balkille": "Boquilla",
+    "plache": "plage",
+    "élégion": "population",
+    "capaixeur": "capable",
+    "décès d'érestir": "défis d'exister",
+    "blessier": "plaisir",
+    "page": "pêche",
+    "lycier": "pêche",
+    "main grave": "mangrove",
+    "pêcher les": "pêcher des",
+    "Réder": "Rony",
+    "salez traille": "sale travail",
+    "soquies": "soucis",
+    "contre": "compte",
+    "grand-t-blom": "grand problème",
+    "égrés": "égratignures",
+    "matre": "matière",
+}
+
+_engines: Dict[Tuple[Tuple[str, int, int], ...], "CorrectionEngine"] = {}
+_lock = threading.Lock()
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Construit une alternative factorisée par préfixes communs.
+
+    Args:
+        words: Mots ou expressions à reconnaître
+
+    Returns:
+        Expression régulière (sans ancres) reconnaissant exactement ces mots
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Fin de mot possible : la suite est facultative (la plus longue est tentée d'abord)
+            return body + "?" if len(branches) == 1 and len(body) == 1 else f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class CorrectionEngine:
+    """Dictionnaire de corrections compilé en une expression régulière unique."""
+
+    def __init__(self, corrections: Dict[str, str]):
+        """
+        Compile le dictionnaire.
+
+        Args:
+            corrections: Dictionnaire erreur -> correction
+        """
+        # Les entrées identiques (erreur == correction) n'ont pas d'effet
+        self.corrections = {error: fix for error, fix in corrections.items() if error and error != fix}
+        self._pattern = None
+        if self.corrections:
+            self._pattern = re.compile(r"(?<!\w)" + _trie_pattern(self.corrections) + r"(?!\w)")
+
+    def __len__(self) -> int:
+        return len(self.corrections)
+
+    def apply(self, text: str) -> str:
+        """
+        Corrige un texte en une seule passe.
+
+        Args:
+            text: Texte à corriger
+
+        Returns:
+            Texte corrigé
+        """
+        if self._pattern is None:
+            return text
+        corrections = self.corrections
+        return self._pattern.sub(lambda match: corrections[match.group(0)], text)
+
+    def correct_stream(self, segments: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Corrige le texte de chaque segment au fil du flux (segments modifiés sur place).
+
+        Args:
+            segments: Segments au format Whisper
+
+        Yields:
+            Les mêmes segments, corrigés
+        """
+        if self._pattern is None:
+            yield from segments
+            return
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for segment in segments:
+            text = segment.get('text', '')
+            corrected = self.apply(text)
+            if corrected != text:
+                segment['text'] = corrected
+                if debug:
+                    logger.debug(f"Correction: '{text}' -> '{corrected}'")
+            yield segment
+
+    def correct_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Corrige le texte de chaque segment (les segments sont modifiés).
+
+        Args:
+            segments: Segments au format Whisper
+
+        Returns:
+            Liste des segments corrigés
+        """
+        return list(self.correct_stream(segments))
+
+
+def load_corrections(path: str) -> Dict[str, str]:
+    """
+    Lit un dictionnaire de corrections (JSON ou texte "erreur => correction").
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Dictionnaire erreur -> correction
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.lower().endswith(".json"):
+            data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError(f"Dictionnaire de corrections invalide (objet JSON attendu): {path}")
+            return {str(error): str(fix) for error, fix in data.items()}
+
+        corrections = {}
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=>" not in line:
+                raise ValueError(f"Ligne invalide (format 'erreur => correction'): {path}:{number}")
+            error, fix = line.split("=>", 1)
+            corrections[error.strip()] = fix.strip()
+        return corrections
+
+
+def get_correction_engine(paths: Optional[Iterable[str]] = None, include_defaults: bool = True) -> CorrectionEngine:
+    """
+    Retourne le moteur compilé pour le dictionnaire par défaut et les fichiers donnés.
+
+    Les fichiers sont appliqués dans l'ordre : une entrée d'un fichier
+    redéfinit celle du dictionnaire par défaut ou d'un fichier précédent.
+
+    Args:
+        paths: Dictionnaires propres à l'émission
+        include_defaults: Inclure DEFAULT_CORRECTIONS
+
+    Returns:
+        Moteur de correction (partagé tant que les fichiers ne changent pas)
+    """
+    paths = [str(path) for path in paths or []]
+    key = [("<défaut>", 0, 0)] if include_defaults else []
+    for path in paths:
+        stat = os.stat(path)
+        key.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+    key = tuple(key)
+
+    with _lock:
+        engine = _engines.get(key)
+    if engine is not None:
+        return engine
+
+    corrections = dict(DEFAULT_CORRECTIONS) if include_defaults else {}
+    for path in paths:
+        corrections.update(load_corrections(path))
+    engine = CorrectionEngine(corrections)
+    if paths:
+        logger.info(f"Dictionnaire de corrections compilé: {len(engine)} entrées ({len(paths)} fichier(s))")
+
+    with _lock:
+        _engines[key] = engine
+    return engine
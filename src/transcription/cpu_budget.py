@@ -0,0 +1,196 @@
+"""
+Répartition des cœurs CPU entre processus d'inférence et threads PyTorch.
+
+Par défaut, chaque processus PyTorch crée autant de threads que de cœurs :
+avec plusieurs processus sur la même machine, les threads se disputent les
+cœurs et le débit s'effondre. Le planificateur découpe les cœurs disponibles
+en (processus x threads) et peut attribuer à chaque processus son propre
+groupe de cœurs.
+"""
+
+import os
+import sys
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Au-delà, un processus supplémentaire rapporte plus que des threads supplémentaires
+DEFAULT_MAX_THREADS_PER_WORKER = int(os.environ.get("JJ_CAPTION_MAX_THREADS_PER_WORKER", "4"))
+
+
+def available_cpus() -> List[int]:
+    """
+    Retourne les cœurs utilisables par le processus courant.
+
+    Returns:
+        Identifiants des cœurs (affinité du processus si disponible)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def parse_cpu_list(text: str) -> List[int]:
+    """
+    Analyse une liste de cœurs au format "0-3,8,10-11".
+
+    Args:
+        text: Liste de cœurs
+
+    Returns:
+        Identifiants des cœurs, triés et dédoublonnés
+    """
+    cpus = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    if not cpus:
+        raise ValueError(f"Liste de cœurs vide: {text!r}")
+    return sorted(cpus)
+
+
+def plan_workers(
+    tasks: int,
+    workers: Optional[int] = None,
+    num_threads: Optional[int] = None,
+    cpus: Optional[Sequence[int]] = None,
+    max_threads_per_worker: int = DEFAULT_MAX_THREADS_PER_WORKER
+) -> Tuple[int, int]:
+    """
+    Répartit les cœurs entre processus et threads par processus.
+
+    Les valeurs fournies sont respectées ; les autres sont déduites pour
+    occuper tous les cœurs sans les sursouscrire.
+
+    Args:
+        tasks: Nombre de tâches indépendantes (borne le nombre de processus)
+        workers: Nombre de processus imposé (None = automatique)
+        num_threads: Threads par processus imposés (None = automatique)
+        cpus: Cœurs disponibles (défaut: available_cpus())
+        max_threads_per_worker: Threads maximum par processus en mode automatique
+
+    Returns:
+        Tuple (processus, threads par processus)
+    """
+    cpu_count = len(cpus) if cpus else len(available_cpus())
+    tasks = max(1, tasks)
+
+    if workers is None:
+        if num_threads:
+            workers = cpu_count // num_threads
+        else:
+            workers = -(-cpu_count // max(1, max_threads_per_worker))
+    workers = max(1, min(workers, tasks))
+
+    if not num_threads:
+        num_threads = cpu_count // workers
+    num_threads = max(1, num_threads)
+
+    if workers * num_threads > cpu_count:
+        logger.warning(
+            f"{workers} processus x {num_threads} threads pour {cpu_count} cœurs : sursouscription probable"
+        )
+    return workers, num_threads
+
+
+def split_cpus(cpus: Sequence[int], workers: int, num_threads: int) -> List[List[int]]:
+    """
+    Attribue à chaque processus un groupe de cœurs contigus.
+
+    Args:
+        cpus: Cœurs disponibles
+        workers: Nombre de processus
+        num_threads: Threads par processus
+
+    Returns:
+        Un groupe de cœurs par processus (groupes partagés si les cœurs manquent)
+    """
+    cpus = list(cpus)
+    if len(cpus) < workers * num_threads:
+        # Pas assez de cœurs pour des groupes disjoints : répartition circulaire
+        return [[cpus[(i * num_threads + j) % len(cpus)] for j in range(num_threads)] for i in range(workers)]
+    return [cpus[i * num_threads:(i + 1) * num_threads] for i in range(workers)]
+
+
+def apply_thread_settings(num_threads: Optional[int] = None, cpu_affinity: Optional[Sequence[int]] = None) -> None:
+    """
+    Applique le nombre de threads et l'affinité CPU au processus courant.
+
+    Ces réglages valent pour tout le processus. Le pool inter-opérations est
+    réduit à un thread : une inférence Whisper n'exécute qu'un graphe à la fois.
+
+    Args:
+        num_threads: Threads intra-opération PyTorch (None = défaut de la bibliothèque)
+        cpu_affinity: Cœurs autorisés (None = inchangé)
+    """
+    if cpu_affinity:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, set(cpu_affinity))
+            logger.info(f"Affinité CPU: {format_cpu_list(cpu_affinity)}")
+        else:
+            logger.warning("Affinité CPU non supportée sur ce système, ignorée")
+
+    if not num_threads:
+        return
+
+    if "torch" not in sys.modules:
+        # Pris en compte par OpenMP/MKL si PyTorch n'est pas encore chargé
+        os.environ["OMP_NUM_THREADS"] = str(num_threads)
+        os.environ["MKL_NUM_THREADS"] = str(num_threads)
+    try:
+        import torch
+    except ImportError:
+        return
+
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Déjà fixé, ou du travail parallèle a déjà démarré dans ce processus
+        pass
+    logger.info(f"Threads PyTorch: {num_threads}")
+
+
+def claim_cpu_set(slot, cpu_sets: Sequence[Sequence[int]]) -> Optional[List[int]]:
+    """
+    Attribue un groupe de cœurs à un processus du pool.
+
+    Args:
+        slot: multiprocessing.Value partagé, incrémenté à chaque processus démarré
+        cpu_sets: Groupes de cœurs issus de split_cpus
+
+    Returns:
+        Groupe de cœurs du processus (None si aucun groupe)
+    """
+    if not cpu_sets:
+        return None
+    with slot.get_lock():
+        index = slot.value
+        slot.value += 1
+    return list(cpu_sets[index % len(cpu_sets)])
+
+
+def format_cpu_list(cpus: Sequence[int]) -> str:
+    """
+    Formate une liste de cœurs au format "0-3,8".
+
+    Args:
+        cpus: Identifiants des cœurs
+
+    Returns:
+        Liste compacte
+    """
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
@@ -0,0 +1,125 @@
+"""
+Résolution des exécutables FFmpeg/FFprobe.
+
+Les chemins sont recherchés une seule fois par processus puis mis en cache.
+Ils peuvent être imposés par variable d'environnement (JJ_CAPTION_FFMPEG,
+JJ_CAPTION_FFPROBE) ou par les options --ffmpeg/--ffprobe de main.py, via
+set_tool_path().
+"""
+
+import os
+import shutil
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from profiling import profiled
+
+logger = logging.getLogger(__name__)
+
+# Variables d'environnement permettant d'imposer un chemin
+ENV_OVERRIDES = {
+    "ffmpeg": "JJ_CAPTION_FFMPEG",
+    "ffprobe": "JJ_CAPTION_FFPROBE",
+}
+
+_WINGET_BIN = r"~\AppData\Local\Microsoft\WinGet\Packages\Gyan.FFmpeg_Microsoft.Winget.Source_8wekyb3d8bbwe\ffmpeg-7.1.1-full_build\bin"
+
+_resolved: Dict[str, Optional[str]] = {}
+_lock = threading.Lock()
+
+
+def _candidate_paths(name: str) -> List[str]:
+    """Retourne les emplacements connus d'un exécutable FFmpeg."""
+    return [
+        rf"C:\Program Files\ffmpeg\bin\{name}.exe",
+        os.path.expanduser(_WINGET_BIN + rf"\{name}.exe"),
+    ]
+
+
+def _is_executable(path: str) -> bool:
+    """Vérifie qu'un chemin désigne un fichier exécutable."""
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+@profiled("ffmpeg.discovery")
+def _search(name: str) -> Optional[str]:
+    """Recherche un exécutable sans lancer de sous-processus."""
+    override = os.environ.get(ENV_OVERRIDES.get(name, ""), "")
+    if override:
+        found = shutil.which(override) or (override if _is_executable(override) else None)
+        if found:
+            return found
+        logger.warning(f"Chemin {name} configuré introuvable: {override}")
+
+    found = shutil.which(name)
+    if found:
+        return found
+
+    for path in _candidate_paths(name):
+        if _is_executable(path):
+            return path
+
+    return None
+
+
+def resolve_tool(name: str) -> Optional[str]:
+    """
+    Retourne le chemin d'un exécutable FFmpeg (ffmpeg, ffprobe).
+
+    Args:
+        name: Nom de l'outil
+
+    Returns:
+        Chemin de l'exécutable ou None s'il est introuvable
+    """
+    if name in _resolved:
+        return _resolved[name]
+
+    with _lock:
+        if name not in _resolved:
+            path = _search(name)
+            if path:
+                logger.info(f"{name} trouvé: {path}")
+            else:
+                logger.warning(f"{name} introuvable")
+            _resolved[name] = path
+        return _resolved[name]
+
+
+def set_tool_path(name: str, path: Optional[str]) -> None:
+    """
+    Impose le chemin d'un outil (prioritaire sur la recherche automatique).
+
+    Le chemin est placé dans la variable d'environnement de l'outil : les
+    processus de travail lancés ensuite (lot, découpage) l'utilisent aussi.
+
+    Args:
+        name: Nom de l'outil (ffmpeg, ffprobe)
+        path: Chemin de l'exécutable (None pour revenir à la recherche automatique)
+    """
+    if name not in ENV_OVERRIDES:
+        raise ValueError(f"Outil inconnu: {name} (choix: {', '.join(ENV_OVERRIDES)})")
+    with _lock:
+        if path:
+            os.environ[ENV_OVERRIDES[name]] = path
+        else:
+            os.environ.pop(ENV_OVERRIDES[name], None)
+        _resolved.pop(name, None)
+
+
+def reset_tool_cache() -> None:
+    """Oublie les chemins résolus (ils seront recherchés de nouveau)."""
+    with _lock:
+        _resolved.clear()
+
+
+def get_ffmpeg_path() -> Optional[str]:
+    """Retourne le chemin de ffmpeg."""
+    return resolve_tool("ffmpeg")
+
+
+def get_ffprobe_path() -> Optional[str]:
+    """Retourne le chemin de ffprobe."""
+    return resolve_tool("ffprobe")
+
@@ -0,0 +1,151 @@
+"""
+Détection rapide de la langue sur quelques fenêtres de 30 secondes.
+
+Les fenêtres sont choisies parmi les plus riches en parole (pour éviter les
+génériques musicaux), analysées par un petit modèle, et le résultat est mis
+en cache par fichier. Le modèle principal est ensuite lancé avec la langue
+fixée.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .audio_cache import SAMPLE_RATE
+from .backends import InferenceBackend, get_backend
+from .cache import get_cache_dir
+from .chunking import frame_energy
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 30.0
+
+_memory_cache: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def select_windows(audio: np.ndarray, count: int = 3, window_seconds: float = WINDOW_SECONDS) -> List[int]:
+    """
+    Choisit les fenêtres contenant le plus de parole.
+
+    Args:
+        audio: Signal audio mono 16 kHz
+        count: Nombre de fenêtres
+        window_seconds: Durée d'une fenêtre
+
+    Returns:
+        Indices d'échantillons de début des fenêtres retenues (ordre chronologique)
+    """
+    window = int(window_seconds * SAMPLE_RATE)
+    n_windows = max(1, int(np.ceil(len(audio) / window)))
+    if n_windows <= count:
+        return [i * window for i in range(n_windows)]
+
+    # Part de trames actives (au-dessus du plancher de bruit + 12 dB) par fenêtre
+    energy = frame_energy(audio, SAMPLE_RATE, 0.03)
+    db = 20.0 * np.log10(np.maximum(energy, 1e-10))
+    active = db > max(float(np.percentile(db, 10)) + 12.0, -50.0)
+    frames_per_window = max(1, int(window_seconds / 0.03))
+    padded = np.zeros(n_windows * frames_per_window, dtype=bool)
+    padded[:min(len(active), len(padded))] = active[:len(padded)]
+    scores = padded.reshape(n_windows, frames_per_window).mean(axis=1)
+
+    best = np.argsort(-scores, kind="stable")[:count]
+    return sorted(int(i) * window for i in best)
+
+
+def detect_language_probs(
+    model: Any,
+    audio: np.ndarray,
+    starts: List[int],
+    backend: Optional[InferenceBackend] = None
+) -> Dict[str, float]:
+    """
+    Calcule la distribution moyenne des langues sur les fenêtres données.
+
+    Args:
+        model: Modèle chargé par le moteur
+        audio: Signal audio mono 16 kHz
+        starts: Débuts (échantillons) des fenêtres
+        backend: Moteur d'inférence (défaut: openai-whisper)
+
+    Returns:
+        Probabilité moyenne de chaque langue
+    """
+    backend = backend or get_backend()
+    totals: Dict[str, float] = {}
+    for start in starts:
+        window = np.ascontiguousarray(audio[start:start + int(WINDOW_SECONDS * SAMPLE_RATE)], dtype=np.float32)
+        probs = backend.detect_language(model, window)
+        for code, prob in probs.items():
+            totals[code] = totals.get(code, 0.0) + float(prob) / len(starts)
+    return totals
+
+
+def _load_cached(key: str) -> Optional[Dict[str, Any]]:
+    """Cherche une détection dans les caches mémoire et disque."""
+    with _lock:
+        if key in _memory_cache:
+            return _memory_cache[key]
+    try:
+        with open(get_cache_dir("language") / f"{key}.json", "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    with _lock:
+        _memory_cache[key] = cached
+    return cached
+
+
+def _store_cached(key: str, detection: Dict[str, Any]) -> None:
+    """Enregistre une détection dans les caches mémoire et disque."""
+    with _lock:
+        _memory_cache[key] = detection
+    try:
+        with open(get_cache_dir("language") / f"{key}.json", "w", encoding="utf-8") as f:
+            json.dump(detection, f)
+    except OSError as e:
+        logger.debug(f"Impossible d'écrire le cache de langue: {e}")
+
+
+def detect_language(
+    model: Any,
+    audio: np.ndarray,
+    model_name: str,
+    content_key: Optional[str] = None,
+    windows: int = 3,
+    backend: Optional[InferenceBackend] = None
+) -> Dict[str, Any]:
+    """
+    Détecte la langue d'un signal (résultat mis en cache par fichier).
+
+    Args:
+        model: Petit modèle Whisper utilisé pour la détection
+        audio: Signal audio mono 16 kHz
+        model_name: Nom du modèle (fait partie de la clé de cache)
+        content_key: Hash du contenu du fichier source (None = pas de cache)
+        windows: Nombre de fenêtres analysées
+        backend: Moteur d'inférence (défaut: openai-whisper)
+
+    Returns:
+        Dictionnaire (language, probability, model)
+    """
+    key = f"{content_key}_{model_name}_{windows}" if content_key else None
+    if key:
+        cached = _load_cached(key)
+        if cached is not None:
+            logger.info(f"Langue chargée depuis le cache: {cached['language']}")
+            return cached
+
+    starts = select_windows(audio, windows)
+    probs = detect_language_probs(model, audio, starts, backend)
+    language = max(probs, key=probs.get)
+    detection = {"language": language, "probability": probs[language], "model": model_name}
+    logger.info(f"Langue détectée: {language} ({probs[language]:.0%}, modèle {model_name}, {len(starts)} fenêtres)")
+
+    if key:
+        _store_cached(key, detection)
+    return detection
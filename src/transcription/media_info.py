@@ -0,0 +1,219 @@
+"""
+Métadonnées des fichiers média (une seule passe ffprobe par fichier).
+
+Le résultat est mis en cache en mémoire et dans un fichier JSON sur disque,
+indexé par chemin, taille et date de modification du fichier source.
+"""
+
+import json
+import hashlib
+import logging
+import subprocess
+import threading
+from typing import Any, Dict, Optional
+
+from .cache import file_signature, get_cache_dir
+from .ffmpeg_tools import get_ffprobe_path
+from profiling import profiled
+
+logger = logging.getLogger(__name__)
+
+# Version du format du sidecar (à incrémenter si les champs changent)
+SIDECAR_VERSION = 1
+
+_memory_cache: Dict[tuple, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def _parse_rate(rate: Optional[str]) -> Optional[float]:
+    """Convertit un taux ffprobe ("30000/1001") en float."""
+    if not rate or rate == "0/0":
+        return None
+    try:
+        if "/" in rate:
+            num, den = rate.split("/")
+            return float(num) / float(den) if float(den) else None
+        return float(rate)
+    except ValueError:
+        return None
+
+
+def _sidecar_path(signature: tuple):
+    """Retourne le chemin du sidecar pour une signature de fichier."""
+    digest = hashlib.sha1(signature[0].encode("utf-8")).hexdigest()
+    return get_cache_dir("media") / f"{digest}.json"
+
+
+def _summarize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extrait les champs utiles de la sortie JSON de ffprobe."""
+    fmt = data.get("format", {})
+    streams = data.get("streams", [])
+
+    info: Dict[str, Any] = {
+        "duration": float(fmt["duration"]) if fmt.get("duration") else None,
+        "format_name": fmt.get("format_name"),
+        "bit_rate": int(fmt["bit_rate"]) if fmt.get("bit_rate") else None,
+        "streams": [],
+        "audio": None,
+        "video": None,
+        "timecode": None,
+    }
+
+    for stream in streams:
+        codec_type = stream.get("codec_type")
+        summary = {
+            "index": stream.get("index"),
+            "codec_type": codec_type,
+            "codec_name": stream.get("codec_name"),
+        }
+
+        if codec_type == "audio":
+            summary.update({
+                "sample_rate": int(stream["sample_rate"]) if stream.get("sample_rate") else None,
+                "channels": stream.get("channels"),
+                "channel_layout": stream.get("channel_layout"),
+            })
+            if info["audio"] is None:
+                info["audio"] = summary
+        elif codec_type == "video":
+            summary.update({
+                "width": stream.get("width"),
+                "height": stream.get("height"),
+                "frame_rate": _parse_rate(stream.get("r_frame_rate")),
+                "r_frame_rate": stream.get("r_frame_rate"),
+                "field_order": stream.get("field_order"),
+            })
+            if info["video"] is None:
+                info["video"] = summary
+
+        tags = stream.get("tags", {})
+        if info["timecode"] is None and "timecode" in tags:
+            info["timecode"] = tags["timecode"]
+
+        if info["duration"] is None and stream.get("duration"):
+            info["duration"] = float(stream["duration"])
+
+        info["streams"].append(summary)
+
+    # Chercher dans les tags du format
+    if info["timecode"] is None:
+        info["timecode"] = fmt.get("tags", {}).get("timecode")
+
+    return info
+
+
+def _run_ffprobe(file_path: str) -> Optional[Dict[str, Any]]:
+    """Lance ffprobe une fois et retourne sa sortie JSON."""
+    ffprobe_path = get_ffprobe_path()
+    if not ffprobe_path:
+        return None
+
+    result = subprocess.run(
+        [ffprobe_path, "-v", "quiet", "-print_format", "json", "-show_format", "-show_streams", file_path],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout) if result.stdout else None
+
+
+@profiled("media.probe")
+def probe_media(file_path: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Retourne les métadonnées d'un fichier média.
+
+    Args:
+        file_path: Chemin du fichier
+        use_cache: Utiliser les caches mémoire et disque
+
+    Returns:
+        Dictionnaire (duration, streams, audio, video, timecode...) ou None
+    """
+    try:
+        signature = file_signature(file_path)
+    except OSError as e:
+        logger.warning(f"Impossible de lire le fichier {file_path}: {e}")
+        return None
+
+    if use_cache:
+        with _lock:
+            if signature in _memory_cache:
+                return _memory_cache[signature]
+
+        sidecar = _sidecar_path(signature)
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if (cached.get("version") == SIDECAR_VERSION
+                    and cached.get("size") == signature[1]
+                    and cached.get("mtime_ns") == signature[2]):
+                info = cached["info"]
+                with _lock:
+                    _memory_cache[signature] = info
+                return info
+        except (OSError, ValueError, KeyError):
+            pass
+
+    try:
+        data = _run_ffprobe(file_path)
+    except Exception as e:
+        logger.warning(f"Impossible d'analyser le fichier avec ffprobe: {e}")
+        return None
+
+    if data is None:
+        return None
+
+    info = _summarize(data)
+    logger.debug(f"Métadonnées de {file_path}: {info}")
+
+    with _lock:
+        _memory_cache[signature] = info
+
+    try:
+        with open(_sidecar_path(signature), "w", encoding="utf-8") as f:
+            json.dump({
+                "version": SIDECAR_VERSION,
+                "path": signature[0],
+                "size": signature[1],
+                "mtime_ns": signature[2],
+                "info": info,
+            }, f, ensure_ascii=False)
+    except OSError as e:
+        logger.debug(f"Impossible d'écrire le cache des métadonnées: {e}")
+
+    return info
+
+
+def get_duration(file_path: str) -> Optional[float]:
+    """
+    Retourne la durée d'un fichier média en secondes.
+
+    Args:
+        file_path: Chemin du fichier
+
+    Returns:
+        Durée en secondes ou None
+    """
+    info = probe_media(file_path)
+    return info.get("duration") if info else None
+
+
+def get_broadcast_rate(info: Optional[Dict[str, Any]], default: str = "30d") -> str:
+    """
+    Retourne le champ "Rate" du fichier TXT de diffusion.
+
+    Args:
+        info: Métadonnées du fichier (probe_media)
+        default: Valeur si la cadence est inconnue
+
+    Returns:
+        Cadence au format de diffusion (24, 25, 30, 30d...)
+    """
+    video = (info or {}).get("video") or {}
+    frame_rate = video.get("frame_rate")
+    if not frame_rate:
+        return default
+
+    nominal = int(round(frame_rate))
+    # Cadences NTSC (29.97, 59.94) : drop-frame
+    if abs(frame_rate - nominal) > 0.01 and nominal in (30, 60):
+        return f"{nominal}d"
+    return str(nominal)
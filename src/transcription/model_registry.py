@@ -0,0 +1,170 @@
+"""
+Registre partagé des modèles Whisper chargés en mémoire.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Budget mémoire par défaut (en Mo), surchargeable par variable d'environnement
+DEFAULT_MEMORY_BUDGET_MB = int(os.environ.get("JJ_CAPTION_MODEL_MEMORY_MB", "8192"))
+
+
+def estimate_model_size(model: Any) -> int:
+    """
+    Estime la taille mémoire d'un modèle PyTorch.
+
+    Args:
+        model: Modèle chargé
+
+    Returns:
+        Taille estimée en octets (0 si inconnue)
+    """
+    try:
+        size = 0
+        for param in model.parameters():
+            size += param.numel() * param.element_size()
+        for buffer in model.buffers():
+            size += buffer.numel() * buffer.element_size()
+        # Poids des couches quantifiées (hors parameters())
+        for module in model.modules():
+            packed = getattr(module, "_packed_params", None)
+            if hasattr(packed, "_weight_bias"):
+                for tensor in packed._weight_bias():
+                    if tensor is not None:
+                        size += tensor.numel() * tensor.element_size()
+        return size
+    except Exception:
+        return 0
+
+
+class ModelRegistry:
+    """
+    Registre thread-safe des modèles chargés, indexé par (model_name, device).
+
+    Les modèles sont partagés entre les instances de WhisperHandler. Lorsque le
+    budget mémoire est dépassé, les modèles les moins récemment utilisés sont
+    retirés du registre.
+    """
+
+    def __init__(self, memory_budget_mb: Optional[int] = None):
+        """
+        Initialise le registre.
+
+        Args:
+            memory_budget_mb: Budget mémoire en Mo (None = valeur par défaut)
+        """
+        if memory_budget_mb is None:
+            memory_budget_mb = DEFAULT_MEMORY_BUDGET_MB
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self._models: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.RLock()
+        self._loading_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def get(
+        self,
+        model_name: str,
+        device: str,
+        loader: Callable[[str, str], Any],
+        variant: Optional[str] = None
+    ) -> Any:
+        """
+        Retourne le modèle demandé, en le chargeant si nécessaire.
+
+        Args:
+            model_name: Nom du modèle Whisper
+            device: Device d'inférence
+            loader: Fonction appelée avec (model_name, device) pour charger le modèle
+            variant: Variante du modèle (ex: "int8"), enregistrée sous une clé distincte
+
+        Returns:
+            Modèle chargé
+        """
+        key = (f"{model_name}:{variant}" if variant else model_name, device)
+
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                logger.info(f"Modèle {key[0]} ({device}) réutilisé depuis le registre")
+                return self._models[key]
+            loading_lock = self._loading_locks.setdefault(key, threading.Lock())
+
+        # Un seul chargement par clé, sans bloquer les autres modèles
+        with loading_lock:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    return self._models[key]
+
+            model = loader(model_name, device)
+            size = estimate_model_size(model)
+
+            with self._lock:
+                self._models[key] = model
+                self._sizes[key] = size
+                self._evict(keep=key)
+                self._loading_locks.pop(key, None)
+
+        return model
+
+    def _evict(self, keep: Tuple[str, str]) -> None:
+        """Retire les modèles les moins récemment utilisés pour respecter le budget."""
+        while self.total_size() > self.memory_budget and len(self._models) > 1:
+            oldest = next(iter(self._models))
+            if oldest == keep:
+                break
+            self._models.pop(oldest)
+            size = self._sizes.pop(oldest, 0)
+            logger.info(f"Modèle {oldest[0]} ({oldest[1]}) retiré du registre ({size / (1024 * 1024):.0f} Mo)")
+
+    def total_size(self) -> int:
+        """Retourne la taille totale estimée des modèles en mémoire (octets)."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def set_memory_budget(self, memory_budget_mb: int) -> None:
+        """
+        Modifie le budget mémoire et applique l'éviction si nécessaire.
+
+        Args:
+            memory_budget_mb: Nouveau budget en Mo
+        """
+        with self._lock:
+            self.memory_budget = memory_budget_mb * 1024 * 1024
+            if self._models:
+                self._evict(keep=next(reversed(self._models)))
+
+    def loaded_models(self) -> List[Tuple[str, str]]:
+        """Retourne les clés (model_name, device) des modèles chargés, du plus ancien au plus récent."""
+        with self._lock:
+            return list(self._models.keys())
+
+    def clear(self) -> None:
+        """Vide le registre."""
+        with self._lock:
+            self._models.clear()
+            self._sizes.clear()
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Retourne le registre de modèles partagé par le processus.
+
+    Returns:
+        Instance unique de ModelRegistry
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
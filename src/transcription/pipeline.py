@@ -0,0 +1,128 @@
+"""
+Pipeline producteur/consommateur pour les traitements par lots.
+
+Pendant que le modèle transcrit un fichier, des threads en arrière-plan
+préparent les fichiers suivants (cache, métadonnées, décodage et
+rééchantillonnage de l'audio) dans une file bornée, et écrivent
+éventuellement les sorties des fichiers déjà transcrits. Les entrées/sorties
+et le décodage sont ainsi masqués derrière le calcul du modèle.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchPipeline:
+    """
+    Enchaîne préparation (threads), inférence (thread courant) et écriture (threads).
+    """
+
+    def __init__(
+        self,
+        handler,
+        prefetch: int = 2,
+        decode_workers: int = 1,
+        write_workers: int = 1
+    ):
+        """
+        Initialise le pipeline.
+
+        Args:
+            handler: WhisperHandler utilisé pour toutes les étapes
+            prefetch: Nombre maximal de fichiers préparés à l'avance
+            decode_workers: Threads de préparation/décodage
+            write_workers: Threads d'écriture des sorties
+        """
+        self.handler = handler
+        self.prefetch = max(1, prefetch)
+        self.decode_workers = max(1, decode_workers)
+        self.write_workers = max(1, write_workers)
+
+    def run(
+        self,
+        files: Iterable[str],
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        writer: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+        **kwargs
+    ) -> Iterator[Tuple[str, Any, Optional[BaseException]]]:
+        """
+        Transcrit une suite de fichiers en recouvrant décodage, inférence et écriture.
+
+        Args:
+            files: Fichiers à traiter, dans l'ordre
+            language: Langue du contenu (auto-détection si None)
+            task: Type de tâche (transcribe ou translate)
+            writer: Fonction (chemin, résultat) exécutée en arrière-plan ; sa
+                valeur de retour est produite à la place du résultat
+            **kwargs: Options de décodage transmises à Whisper
+
+        Yields:
+            Tuples (chemin, résultat ou valeur du writer, exception ou None),
+            dans l'ordre de fin d'écriture
+        """
+        options = self.handler._build_options(language, task, kwargs)
+        files = iter(files)
+        prepared: "deque[Tuple[str, Future]]" = deque()
+        writes: "deque[Tuple[str, Future]]" = deque()
+
+        with ThreadPoolExecutor(self.decode_workers, thread_name_prefix="jj-decode") as decoder, \
+                ThreadPoolExecutor(self.write_workers, thread_name_prefix="jj-write") as writer_pool:
+
+            def fill_queue() -> None:
+                # File bornée : au plus `prefetch` fichiers préparés en mémoire
+                while len(prepared) < self.prefetch:
+                    path = next(files, None)
+                    if path is None:
+                        return
+                    prepared.append((path, decoder.submit(self.handler._prepare_input, path, options)))
+
+            fill_queue()
+            while prepared:
+                path, future = prepared.popleft()
+                try:
+                    item = future.result()
+                except Exception as e:
+                    logger.error(f"Erreur lors de la préparation de {path}: {e}")
+                    fill_queue()
+                    yield path, None, e
+                    continue
+
+                # Le fichier suivant se décode pendant l'inférence de celui-ci
+                fill_queue()
+                try:
+                    if item["cached"] is not None:
+                        result = item["cached"]
+                    else:
+                        result = self.handler._run_inference(item, options)
+                except Exception as e:
+                    logger.error(f"Erreur lors de la transcription de {path}: {e}")
+                    yield path, None, e
+                    continue
+                finally:
+                    # Libérer l'audio dès la fin de l'inférence
+                    item["audio"] = None
+
+                if writer is None:
+                    yield path, result, None
+                    continue
+
+                writes.append((path, writer_pool.submit(writer, path, result)))
+                while writes and writes[0][1].done():
+                    yield self._collect(*writes.popleft())
+
+            while writes:
+                yield self._collect(*writes.popleft())
+
+    @staticmethod
+    def _collect(path: str, future: Future) -> Tuple[str, Any, Optional[BaseException]]:
+        """Attend la fin d'une écriture et retourne son bilan."""
+        try:
+            return path, future.result(), None
+        except Exception as e:
+            logger.error(f"Erreur lors de l'écriture des sorties de {path}: {e}")
+            return path, None, e
@@ -0,0 +1,242 @@
+"""
+Post-traitement des segments en flux.
+
+Chaque étape est un générateur (segments -> segments) : les segments
+traversent toute la chaîne en une seule passe, modifiés sur place, sans liste
+intermédiaire. La chaîne peut donc consommer directement la sortie de
+transcribe_iter et alimenter les écritures incrémentales.
+
+Étapes disponibles (ordre par défaut) :
+- correct_errors : dictionnaire de corrections (voir corrections.py) ;
+- punctuation : points d'interrogation/exclamation, majuscule initiale ;
+- merge_short : fusion des segments plus courts que la durée minimale ;
+- context : continuité des phrases coupées entre deux segments.
+
+Le temps propre de chaque étape est mesuré (compteurs du PostProcessor et
+profileur actif).
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .corrections import CorrectionEngine, get_correction_engine
+from .segment_table import SegmentTable
+from profiling import record_stage
+
+logger = logging.getLogger(__name__)
+
+Segment = Dict[str, Any]
+Stage = Callable[[Iterable[Segment]], Iterator[Segment]]
+
+QUESTION_WORDS = ('quoi', 'comment', 'pourquoi', 'quand', 'où', 'qui', 'combien')
+EXCLAMATION_WORDS = ('oh', 'ah', 'wow', 'super', 'génial', 'parfait')
+
+DEFAULT_STAGES = ("correct_errors", "punctuation", "merge_short", "context")
+
+
+def improve_punctuation(segments: Iterable[Segment]) -> Iterator[Segment]:
+    """Ajoute points d'interrogation/exclamation et majuscule initiale."""
+    for segment in segments:
+        text = segment.get('text', '').strip()
+        lower = text.lower()
+
+        # Ajouter des points d'interrogation pour les questions
+        if any(word in lower for word in QUESTION_WORDS) and not text.endswith('?'):
+            text += '?'
+
+        # Ajouter des points d'exclamation pour les exclamations
+        if any(word in lower for word in EXCLAMATION_WORDS) and not text.endswith('!'):
+            text += '!'
+
+        # Capitaliser le début des phrases
+        if text and not text[0].isupper():
+            text = text[0].upper() + text[1:]
+
+        segment['text'] = text
+        yield segment
+
+
+def merge_short_segments(segments: Iterable[Segment], min_duration: float = 1.0) -> Iterator[Segment]:
+    """
+    Fusionne chaque segment trop court avec le suivant.
+
+    Un seul segment est retenu à la fois : il est produit dès que sa durée
+    atteint min_duration (ou à la fin du flux).
+    """
+    iterator = iter(segments)
+    current = next(iterator, None)
+    if current is None:
+        return
+
+    for segment in iterator:
+        if current.get('end', 0) - current.get('start', 0) < min_duration:
+            current_text = current.get('text', '').strip()
+            next_text = segment.get('text', '').strip()
+
+            # Fusionner les textes
+            if current_text and next_text:
+                current['text'] = current_text + ' ' + next_text
+            elif next_text:
+                current['text'] = next_text
+
+            # Mettre à jour la fin
+            current['end'] = segment.get('end', current.get('end', 0))
+        else:
+            yield current
+            current = segment
+
+    yield current
+
+
+def improve_context(segments: Iterable[Segment]) -> Iterator[Segment]:
+    """Traite un segment commençant par une minuscule comme la suite de la phrase précédente."""
+    previous_text = None
+    for segment in segments:
+        current_text = segment.get('text', '').strip()
+
+        # Si le segment commence par une minuscule et le précédent ne se termine pas par un point
+        if (previous_text and current_text and current_text[0].islower() and
+                not previous_text.endswith(('.', '!', '?'))):
+            # C'est probablement une continuation de phrase
+            segment['text'] = current_text[0].lower() + current_text[1:]
+
+        yield segment
+        # Lu après le passage du segment dans les étapes suivantes
+        previous_text = segment.get('text', '').strip()
+
+
+def _timed(iterable: Iterable[Segment], totals: List[float], index: int) -> Iterator[Segment]:
+    """Cumule dans totals[index] le temps passé à produire les éléments."""
+    clock = time.perf_counter
+    elapsed = 0.0
+    try:
+        start = clock()
+        for item in iterable:
+            elapsed += clock() - start
+            yield item
+            start = clock()
+        elapsed += clock() - start
+    finally:
+        totals[index] += elapsed
+
+
+class PostProcessor:
+    """
+    Chaîne configurable d'étapes de post-traitement.
+    """
+
+    def __init__(
+        self,
+        stages: Optional[Sequence[Union[str, Stage]]] = None,
+        corrections: Optional[CorrectionEngine] = None,
+        min_duration: float = 1.0
+    ):
+        """
+        Initialise la chaîne.
+
+        Args:
+            stages: Étapes dans l'ordre d'application : noms (voir DEFAULT_STAGES)
+                ou générateurs (segments -> segments)
+            corrections: Dictionnaire compilé de l'étape correct_errors
+                (défaut: dictionnaire par défaut)
+            min_duration: Durée minimale d'un segment pour l'étape merge_short
+        """
+        self.corrections = corrections or get_correction_engine()
+        self.min_duration = min_duration
+        self.stages = [self._resolve(stage) for stage in (DEFAULT_STAGES if stages is None else stages)]
+        # Temps propre cumulé par étape (secondes)
+        self.timings: Dict[str, float] = {name: 0.0 for name, _ in self.stages}
+        self._lock = threading.Lock()
+
+    def _resolve(self, stage: Union[str, Stage]) -> tuple:
+        """Retourne (nom, générateur) pour une étape donnée par nom ou par fonction."""
+        if callable(stage):
+            return getattr(stage, "__name__", "custom"), stage
+        if stage == "correct_errors":
+            return stage, self.corrections.correct_stream
+        if stage == "punctuation":
+            return stage, improve_punctuation
+        if stage == "merge_short":
+            min_duration = self.min_duration
+            return stage, lambda segments: merge_short_segments(segments, min_duration)
+        if stage == "context":
+            return stage, improve_context
+        raise ValueError(f"Étape de post-traitement inconnue: {stage} (choix: {', '.join(DEFAULT_STAGES)})")
+
+    @property
+    def stage_names(self) -> List[str]:
+        """Noms des étapes, dans l'ordre."""
+        return [name for name, _ in self.stages]
+
+    def process(self, segments: Iterable[Segment]) -> Iterator[Segment]:
+        """
+        Fait traverser la chaîne aux segments, au fil du flux.
+
+        Les segments sont modifiés sur place ; les temps des étapes sont
+        enregistrés quand le flux est épuisé (ou abandonné).
+
+        Args:
+            segments: Segments au format Whisper (liste ou générateur)
+
+        Yields:
+            Segments post-traités
+        """
+        # totals[0] : production des segments d'entrée ; totals[i] : étape i, amont compris
+        totals = [0.0] * (len(self.stages) + 1)
+        stream = _timed(segments, totals, 0)
+        for index, (_, stage) in enumerate(self.stages, 1):
+            stream = _timed(stage(stream), totals, index)
+
+        try:
+            yield from stream
+        finally:
+            self._record(totals)
+
+    def _record(self, totals: List[float]) -> None:
+        """Ajoute le temps propre de chaque étape aux compteurs et au profileur."""
+        with self._lock:
+            for index, (name, _) in enumerate(self.stages, 1):
+                elapsed = max(0.0, totals[index] - totals[index - 1])
+                self.timings[name] = self.timings.get(name, 0.0) + elapsed
+                record_stage(f"post_process.{name}", elapsed)
+
+    def run_table(self, table: SegmentTable) -> SegmentTable:
+        """
+        Applique la chaîne à une table de segments.
+
+        Seuls start, end et text traversent les étapes ; les autres colonnes
+        (tokens compris) suivent le segment conservé lors d'une fusion.
+
+        Args:
+            table: Segments en colonnes
+
+        Returns:
+            Nouvelle table post-traitée
+        """
+        rows = (
+            {"start": start, "end": end, "text": text, "row": row}
+            for row, (start, end, text) in enumerate(zip(table.start.tolist(), table.end.tolist(), table.text))
+        )
+        segments = list(self.process(rows))
+
+        processed = table.take([segment["row"] for segment in segments])
+        processed.start = np.fromiter((segment["start"] for segment in segments), dtype=np.float64, count=len(segments))
+        processed.end = np.fromiter((segment["end"] for segment in segments), dtype=np.float64, count=len(segments))
+        processed.text = [segment["text"] for segment in segments]
+        return processed
+
+    def run(self, segments: Iterable[Segment]) -> List[Segment]:
+        """
+        Applique la chaîne à tous les segments.
+
+        Args:
+            segments: Segments au format Whisper
+
+        Returns:
+            Liste des segments post-traités
+        """
+        return list(self.process(segments))
@@ -0,0 +1,138 @@
+"""
+Quantification dynamique int8 des modèles Whisper pour l'inférence CPU.
+
+Les poids des couches linéaires (projections d'attention et MLP, l'essentiel
+des paramètres) sont stockés en int8 et les activations quantifiées à la
+volée : le modèle occupe environ quatre fois moins de mémoire et les
+produits matriciels profitent des noyaux int8 du CPU.
+"""
+
+import time
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .model_registry import estimate_model_size
+
+logger = logging.getLogger(__name__)
+
+QUANTIZE_MODES = ("int8",)
+
+
+def validate_quantize(quantize: Optional[str]) -> Optional[str]:
+    """
+    Vérifie le mode de quantification demandé.
+
+    Args:
+        quantize: Mode de quantification (None ou "int8")
+
+    Returns:
+        Le mode validé
+    """
+    if quantize is not None and quantize not in QUANTIZE_MODES:
+        raise ValueError(f"Mode de quantification non supporté: {quantize} (choix: {', '.join(QUANTIZE_MODES)})")
+    return quantize
+
+
+def quantize_model(model: Any, quantize: str = "int8") -> Any:
+    """
+    Applique la quantification dynamique aux couches linéaires d'un modèle.
+
+    Whisper utilise une sous-classe de torch.nn.Linear (conversion de type au
+    forward, sans effet en fp32) que torch ne sait pas quantifier : ces couches
+    sont d'abord ramenées à torch.nn.Linear.
+
+    Args:
+        model: Modèle Whisper fp32 (CPU)
+        quantize: Mode de quantification
+
+    Returns:
+        Modèle quantifié (le modèle d'origine est modifié)
+    """
+    import torch
+
+    validate_quantize(quantize)
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+            module.__class__ = torch.nn.Linear
+
+    size_before = estimate_model_size(model)
+    quantized = torch.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    size_after = estimate_model_size(quantized)
+    logger.info(
+        f"Modèle quantifié en {quantize}: {size_before / (1024 * 1024):.0f} Mo -> {size_after / (1024 * 1024):.0f} Mo"
+    )
+    return quantized
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    Taux d'erreur en mots entre deux transcriptions.
+
+    Args:
+        reference: Texte de référence
+        hypothesis: Texte à évaluer
+
+    Returns:
+        Distance d'édition en mots rapportée à la longueur de la référence
+    """
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    if not ref:
+        return float(bool(hyp))
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def compare_quantized(
+    fp32_model: Any,
+    int8_model: Any,
+    audio: np.ndarray,
+    repeats: int = 1,
+    **options
+) -> Dict[str, Any]:
+    """
+    Compare vitesse, taille et transcription d'un modèle fp32 et de sa version int8.
+
+    Args:
+        fp32_model: Modèle de référence
+        int8_model: Modèle quantifié
+        audio: Signal audio mono 16 kHz float32
+        repeats: Nombre de transcriptions par modèle (meilleur temps retenu)
+        **options: Options de décodage transmises à Whisper
+
+    Returns:
+        Dictionnaire du bilan (temps, facteurs temps réel, tailles, WER int8/fp32)
+    """
+    options = {"verbose": None, "fp16": False, **options}
+    duration = len(audio) / 16000
+    report: Dict[str, Any] = {"duration": duration}
+
+    texts = {}
+    for name, model in (("fp32", fp32_model), ("int8", int8_model)):
+        timings = []
+        for _ in range(max(1, repeats)):
+            start = time.perf_counter()
+            result = model.transcribe(audio, **options)
+            timings.append(time.perf_counter() - start)
+        texts[name] = result.get("text", "")
+        report[name] = {
+            "seconds": min(timings),
+            "rtf": min(timings) / duration if duration else 0.0,
+            "size_mb": estimate_model_size(model) / (1024 * 1024),
+        }
+
+    report["speedup"] = report["fp32"]["seconds"] / report["int8"]["seconds"] if report["int8"]["seconds"] else 0.0
+    report["wer_vs_fp32"] = word_error_rate(texts["fp32"], texts["int8"])
+    return report
@@ -0,0 +1,148 @@
+"""
+Cache persistant des résultats de transcription.
+
+Chaque résultat est indexé par le hash du contenu du fichier source, le
+modèle et l'ensemble des options de décodage. La taille totale du cache est
+bornée : les entrées les moins récemment utilisées sont supprimées en premier.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from .cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Taille maximale par défaut (en Mo), surchargeable par variable d'environnement
+DEFAULT_MAX_SIZE_MB = int(os.environ.get("JJ_CAPTION_RESULT_CACHE_MB", "512"))
+
+
+def make_cache_key(content_hash: str, model_name: str, options: Dict[str, Any]) -> str:
+    """
+    Construit la clé de cache d'une transcription.
+
+    Args:
+        content_hash: Hash du contenu du fichier source
+        model_name: Nom du modèle Whisper
+        options: Options de transcription (tâche, langue, options de décodage)
+
+    Returns:
+        Clé hexadécimale
+    """
+    payload = json.dumps(
+        {"content": content_hash, "model": model_name, "options": options},
+        sort_keys=True, default=str, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Cache disque des résultats de transcription, avec éviction LRU par taille.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size_mb: Optional[int] = None):
+        """
+        Initialise le cache.
+
+        Args:
+            cache_dir: Répertoire du cache (défaut: <cache>/results)
+            max_size_mb: Taille maximale en Mo (défaut: JJ_CAPTION_RESULT_CACHE_MB)
+        """
+        self.cache_dir = cache_dir or str(get_cache_dir("results"))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if max_size_mb is None:
+            max_size_mb = DEFAULT_MAX_SIZE_MB
+        self.max_size = max_size_mb * 1024 * 1024
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        """Retourne le chemin du fichier associé à une clé."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne le résultat associé à une clé.
+
+        Args:
+            key: Clé de cache
+
+        Returns:
+            Résultat de transcription ou None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Marquer l'entrée comme récemment utilisée
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Enregistre un résultat puis applique l'éviction.
+
+        Args:
+            key: Clé de cache
+            result: Résultat de transcription
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Impossible d'écrire dans le cache des résultats: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Supprime les entrées les moins récemment utilisées au-delà de la taille maximale."""
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_size:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    logger.debug(f"Entrée retirée du cache des résultats: {path}")
+                except OSError:
+                    continue
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        continue
@@ -0,0 +1,235 @@
+"""
+Représentation en colonnes d'une liste de segments.
+
+Les segments Whisper voyagent sous forme de dictionnaires (un par segment,
+avec la liste de leurs tokens) : pour un fichier de plusieurs heures, cela
+représente des centaines de milliers d'objets Python. SegmentTable stocke :
+- start, end : tableaux NumPy float64 ;
+- text : liste de chaînes ;
+- les champs numériques (id, seek, avg_logprob...) : un tableau par champ ;
+- les tokens : un tableau int32 unique et les bornes de chaque segment ;
+- les autres champs (mots horodatés, etc.) : une liste par champ.
+
+Les adaptateurs from_segments/from_result et to_segments/to_result
+convertissent depuis et vers le format dictionnaire, dans l'ordre d'origine
+des clés.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Valeur absente d'un champ facultatif (champ non présent sur tous les segments)
+_MISSING = object()
+
+
+class SegmentTable:
+    """
+    Segments stockés en colonnes (voir le docstring du module).
+    """
+
+    def __init__(
+        self,
+        start: Union[np.ndarray, Sequence[float]],
+        end: Union[np.ndarray, Sequence[float]],
+        text: List[str],
+        columns: Optional[Dict[str, np.ndarray]] = None,
+        objects: Optional[Dict[str, List[Any]]] = None,
+        tokens: Optional[np.ndarray] = None,
+        token_offsets: Optional[np.ndarray] = None,
+        keys: Optional[List[str]] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialise la table.
+
+        Args:
+            start: Débuts des segments (secondes)
+            end: Fins des segments (secondes)
+            text: Textes des segments
+            columns: Champs numériques, un tableau par champ
+            objects: Autres champs, une liste par champ
+            tokens: Tokens de tous les segments, bout à bout
+            token_offsets: Bornes des tokens de chaque segment (len(table) + 1 valeurs)
+            keys: Ordre des clés des segments reconstitués
+            meta: Champs du résultat hors segments (text, language...), dans l'ordre
+        """
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.text = list(text)
+        if not len(self.start) == len(self.end) == len(self.text):
+            raise ValueError("Colonnes start, end et text de longueurs différentes")
+        self.columns = columns or {}
+        self.objects = objects or {}
+        self.tokens = tokens
+        self.token_offsets = token_offsets
+        self.keys = keys or ["start", "end", "text"]
+        self.meta = meta if meta is not None else {"segments": None}
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"SegmentTable({len(self)} segments, champs: {', '.join(self.keys)})"
+
+    @property
+    def duration(self) -> np.ndarray:
+        """Durée de chaque segment."""
+        return self.end - self.start
+
+    @property
+    def language(self) -> Optional[str]:
+        """Langue du résultat."""
+        return self.meta.get("language")
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Dict[str, Any]], meta: Optional[Dict[str, Any]] = None) -> "SegmentTable":
+        """
+        Construit une table depuis des segments au format dictionnaire.
+
+        Args:
+            segments: Segments (start, end, text et champs facultatifs)
+            meta: Champs du résultat hors segments
+
+        Returns:
+            Table des segments
+        """
+        segments = segments if isinstance(segments, list) else list(segments)
+        count = len(segments)
+        start = np.fromiter((segment.get("start", 0.0) for segment in segments), dtype=np.float64, count=count)
+        end = np.fromiter((segment.get("end", 0.0) for segment in segments), dtype=np.float64, count=count)
+        text = [segment.get("text", "") for segment in segments]
+
+        # Ordre des clés : celui du premier segment, puis les clés rencontrées ensuite
+        keys: Dict[str, None] = dict.fromkeys(("start", "end", "text"))
+        if segments:
+            keys = dict.fromkeys(segments[0])
+            for key in ("start", "end", "text"):
+                keys.setdefault(key)
+            for segment in segments:
+                if segment.keys() != keys.keys():
+                    for key in segment:
+                        keys.setdefault(key)
+
+        columns: Dict[str, np.ndarray] = {}
+        objects: Dict[str, List[Any]] = {}
+        tokens = token_offsets = None
+        for key in keys:
+            if key in ("start", "end", "text"):
+                continue
+            values = [segment.get(key, _MISSING) for segment in segments]
+
+            if key == "tokens" and all(isinstance(value, list) for value in values):
+                lengths = np.fromiter((len(value) for value in values), dtype=np.int64, count=count)
+                token_offsets = np.zeros(count + 1, dtype=np.int64)
+                np.cumsum(lengths, out=token_offsets[1:])
+                tokens = np.fromiter(
+                    (token for value in values for token in value), dtype=np.int32, count=int(token_offsets[-1])
+                )
+                continue
+
+            kinds = {type(value) for value in values}
+            if kinds and kinds <= {int}:
+                columns[key] = np.array(values, dtype=np.int64)
+            elif kinds and kinds <= {float}:
+                columns[key] = np.array(values, dtype=np.float64)
+            else:
+                objects[key] = values
+
+        return cls(
+            start, end, text, columns=columns, objects=objects, tokens=tokens, token_offsets=token_offsets,
+            keys=list(keys), meta=dict(meta) if meta is not None else None
+        )
+
+    @classmethod
+    def from_result(cls, result: Union[Dict[str, Any], "SegmentTable"]) -> "SegmentTable":
+        """
+        Construit une table depuis un résultat de transcription (inchangée si c'est déjà une table).
+
+        Args:
+            result: Résultat Whisper (text, segments, language) ou SegmentTable
+
+        Returns:
+            Table des segments
+        """
+        if isinstance(result, SegmentTable):
+            return result
+        meta = {key: (None if key == "segments" else value) for key, value in result.items()}
+        meta.setdefault("segments", None)
+        return cls.from_segments(result.get("segments", []), meta)
+
+    def iter_segments(self) -> Iterator[Dict[str, Any]]:
+        """
+        Reconstitue les segments au format dictionnaire, un par un.
+
+        Yields:
+            Segments, clés dans l'ordre d'origine
+        """
+        values: Dict[str, List[Any]] = {"start": self.start.tolist(), "end": self.end.tolist(), "text": self.text}
+        for key, column in self.columns.items():
+            values[key] = column.tolist()
+        values.update(self.objects)
+        if self.tokens is not None:
+            tokens = self.tokens.tolist()
+            offsets = self.token_offsets.tolist()
+            values["tokens"] = [tokens[offsets[i]:offsets[i + 1]] for i in range(len(self))]
+
+        columns = [(key, values[key]) for key in self.keys if key in values]
+        for i in range(len(self)):
+            segment = {}
+            for key, column in columns:
+                value = column[i]
+                if value is not _MISSING:
+                    segment[key] = value
+            yield segment
+
+    def to_segments(self) -> List[Dict[str, Any]]:
+        """Reconstitue la liste des segments au format dictionnaire."""
+        return list(self.iter_segments())
+
+    def to_result(self) -> Dict[str, Any]:
+        """
+        Reconstitue le résultat de transcription.
+
+        Returns:
+            Résultat au format Whisper (champs dans l'ordre d'origine)
+        """
+        segments = self.to_segments()
+        return {key: (segments if key == "segments" else value) for key, value in self.meta.items()}
+
+    def take(self, rows: Union[np.ndarray, Sequence[int]]) -> "SegmentTable":
+        """
+        Sélectionne des segments.
+
+        Args:
+            rows: Indices des segments retenus, dans l'ordre voulu
+
+        Returns:
+            Nouvelle table
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        row_list = rows.tolist()
+        tokens = token_offsets = None
+        if self.tokens is not None:
+            lengths = self.token_offsets[rows + 1] - self.token_offsets[rows]
+            token_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=token_offsets[1:])
+            # Position source de chaque token retenu : début de son segment + rang dans le segment
+            shift = np.repeat(self.token_offsets[rows] - token_offsets[:-1], lengths)
+            tokens = self.tokens[shift + np.arange(int(token_offsets[-1]), dtype=np.int64)]
+        return SegmentTable(
+            self.start[rows], self.end[rows], [self.text[i] for i in row_list],
+            columns={key: column[rows] for key, column in self.columns.items()},
+            objects={key: [values[i] for i in row_list] for key, values in self.objects.items()},
+            tokens=tokens, token_offsets=token_offsets, keys=list(self.keys), meta=dict(self.meta)
+        )
+
+    def copy(self) -> "SegmentTable":
+        """Copie de la table (colonnes copiées, valeurs des champs objets partagées)."""
+        return self.take(np.arange(len(self)))
+
+    def segment_tokens(self, index: int) -> List[int]:
+        """Tokens d'un segment (liste vide si la table n'en contient pas)."""
+        if self.tokens is None:
+            return []
+        return self.tokens[self.token_offsets[index]:self.token_offsets[index + 1]].tolist()
@@ -0,0 +1,292 @@
+"""
+Écriture incrémentale des sous-titres.
+
+Chaque writer reçoit les segments un par un et les écrit immédiatement, ce
+qui permet de produire les fichiers pendant que la transcription continue.
+Les méthodes save_* de WhisperHandler s'appuient sur ces mêmes writers.
+"""
+
+import os
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .media_info import probe_media, get_broadcast_rate
+from .segment_table import SegmentTable
+from .timecode import DEFAULT_RATE, FrameRate, TimecodeFormatter
+
+logger = logging.getLogger(__name__)
+
+# Segments formatés ensemble par write_table (borne la taille des chaînes intermédiaires)
+TABLE_BLOCK = 10000
+
+
+def format_timestamps(seconds: np.ndarray, separator: str = ",") -> List[str]:
+    """
+    Formate un tableau de temps en HH:MM:SS,mmm (même calcul que WhisperHandler._format_timestamp).
+
+    Args:
+        seconds: Temps en secondes
+        separator: Séparateur des millisecondes ("," pour SRT, "." pour VTT)
+
+    Returns:
+        Timestamps formatés
+    """
+    hours = (seconds // 3600).astype(np.int64).tolist()
+    minutes = ((seconds % 3600) // 60).astype(np.int64).tolist()
+    secs = (seconds % 60).astype(np.int64).tolist()
+    millisecs = ((seconds % 1) * 1000).astype(np.int64).tolist()
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}{separator}{ms:03d}"
+        for h, m, s, ms in zip(hours, minutes, secs, millisecs)
+    ]
+
+
+class SegmentWriter:
+    """
+    Writer de base : ouvre le fichier, écrit l'en-tête puis chaque segment.
+    """
+
+    def __init__(self, handler, output_path: str, flush: bool = True):
+        """
+        Initialise le writer.
+
+        Args:
+            handler: WhisperHandler fournissant les fonctions de formatage
+            output_path: Chemin de sortie
+            flush: Vider le tampon après chaque segment (lecture en direct)
+        """
+        self.handler = handler
+        self.output_path = output_path
+        self.flush = flush
+        self.count = 0
+        self._file = open(output_path, 'w', encoding='utf-8')
+        self.write_header()
+
+    def write_header(self) -> None:
+        """Écrit l'en-tête du fichier."""
+
+    def write_segment(self, segment: Dict[str, Any]) -> None:
+        """Écrit un segment (à implémenter par les sous-classes)."""
+        raise NotImplementedError
+
+    def write(self, segment: Dict[str, Any]) -> None:
+        """
+        Ajoute un segment au fichier.
+
+        Args:
+            segment: Segment Whisper (start, end, text)
+        """
+        self.count += 1
+        self.write_segment(segment)
+        if self.flush:
+            self._file.flush()
+
+    def write_all(self, segments: Iterable[Dict[str, Any]]) -> None:
+        """
+        Ajoute une suite de segments.
+
+        Args:
+            segments: Segments Whisper
+        """
+        for segment in segments:
+            self.write(segment)
+
+    def write_table(self, table: SegmentTable) -> None:
+        """
+        Ajoute tous les segments d'une table.
+
+        Args:
+            table: Segments en colonnes
+        """
+        self.write_all(table.iter_segments())
+
+    def close(self) -> None:
+        """Termine et ferme le fichier."""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class SRTWriter(SegmentWriter):
+    """Writer incrémental au format SRT."""
+
+    def write_segment(self, segment: Dict[str, Any]) -> None:
+        start_time = self.handler._format_timestamp(segment["start"])
+        end_time = self.handler._format_timestamp(segment["end"])
+        text = segment["text"].strip()
+
+        self._file.write(f"{self.count}\n")
+        self._file.write(f"{start_time} --> {end_time}\n")
+        self._file.write(f"{text}\n\n")
+
+    def write_table(self, table: SegmentTable) -> None:
+        # Timestamps formatés par blocs depuis les colonnes start/end
+        for lo in range(0, len(table), TABLE_BLOCK):
+            hi = min(lo + TABLE_BLOCK, len(table))
+            starts = format_timestamps(table.start[lo:hi], ",")
+            ends = format_timestamps(table.end[lo:hi], ",")
+            first = self.count + 1
+            self._file.write("".join(
+                f"{index}\n{start} --> {end}\n{text.strip()}\n\n"
+                for index, start, end, text in zip(range(first, first + hi - lo), starts, ends, table.text[lo:hi])
+            ))
+            self.count += hi - lo
+        if self.flush:
+            self._file.flush()
+
+
+class VTTWriter(SegmentWriter):
+    """Writer incrémental au format WebVTT."""
+
+    def write_header(self) -> None:
+        self._file.write("WEBVTT\n\n")
+
+    def write_segment(self, segment: Dict[str, Any]) -> None:
+        start_time = self.handler._format_timestamp_vtt(segment["start"])
+        end_time = self.handler._format_timestamp_vtt(segment["end"])
+        text = segment["text"].strip()
+
+        self._file.write(f"{start_time} --> {end_time}\n")
+        self._file.write(f"{text}\n\n")
+
+    def write_table(self, table: SegmentTable) -> None:
+        for lo in range(0, len(table), TABLE_BLOCK):
+            hi = min(lo + TABLE_BLOCK, len(table))
+            starts = format_timestamps(table.start[lo:hi], ".")
+            ends = format_timestamps(table.end[lo:hi], ".")
+            self._file.write("".join(
+                f"{start} --> {end}\n{text.strip()}\n\n" for start, end, text in zip(starts, ends, table.text[lo:hi])
+            ))
+            self.count += hi - lo
+        if self.flush:
+            self._file.flush()
+
+
+class BroadcastTXTWriter(SegmentWriter):
+    """
+    Writer incrémental au format TXT de diffusion (timecodes LTC).
+
+    Les timecodes sont exacts à l'image près, à la cadence de la vidéo source
+    (29.97 drop-frame par défaut) ; le timecode de départ est lu une seule
+    fois. La pause entre deux segments dépend du début du segment suivant :
+    elle est donc écrite à l'arrivée de celui-ci.
+    """
+
+    def __init__(self, handler, output_path: str, input_path: Optional[str] = None, flush: bool = True):
+        """
+        Initialise le writer.
+
+        Args:
+            handler: WhisperHandler fournissant les fonctions de formatage
+            output_path: Chemin de sortie
+            input_path: Chemin du fichier vidéo source (pour timecodes LTC)
+            flush: Vider le tampon après chaque segment
+        """
+        self.input_path = input_path
+        self.codes = handler._get_broadcast_codes()
+        self.ltc_start = None
+        self.rate = DEFAULT_RATE
+        media_info = probe_media(input_path) if input_path else None
+        if media_info:
+            self.ltc_start = media_info.get("timecode")
+            self.rate = get_broadcast_rate(media_info)
+        self.frame_rate = FrameRate.from_media(media_info, self.rate)
+
+        # Timecodes relatifs au départ LTC ajusté du fichier, sinon au début du média
+        start = handler._adjust_start_time(self.ltc_start, self.frame_rate) if self.ltc_start else None
+        self.timecodes = TimecodeFormatter(self.frame_rate, start)
+        self._previous_start = None
+        super().__init__(handler, output_path, flush)
+
+    def _timecode(self, seconds: float) -> str:
+        """Convertit un temps en timecode LTC (avec ajustement du départ)."""
+        return self.timecodes.format_one(seconds)
+
+    def write_header(self) -> None:
+        f = self._file
+        f.write("'**************************************************\n\n")
+        f.write("\\ Title: " + os.path.basename(self.output_path) + "\n\n")
+        f.write("\\ Version: 1.0\n")
+        f.write("\\ Channel: F1C1\n")
+        f.write("\\ Rate: " + self.rate + "\n")
+        f.write("\\ Type: LTC\n\n")
+        f.write("\\ Generated By: JJ Caption\n")
+        f.write("\\ CaptionFile: " + self.output_path + "\n")
+        f.write("\\ MediaFile: " + (self.input_path or "Unknown") + "\n\n")
+        f.write("\\ Author: JJ Caption\n")
+        f.write("\\ Owner: \n\n")
+        f.write("\\ Date: " + self.handler._get_current_date() + "\n")
+        f.write("\\ Time: " + self.handler._get_current_time() + "\n\n")
+        f.write("'**************************************************\n\n\n")
+
+        # Timecode de départ avec format professionnel
+        start = self.timecodes.start if self.ltc_start else self.handler._adjust_start_time(None, self.frame_rate)
+        f.write("\\ TC:  " + start + " " + self.codes["clear"] + "\n")
+
+    def write_segment(self, segment: Dict[str, Any]) -> None:
+        codes = self.codes
+        start_time = segment["start"]
+        text = segment["text"].strip()
+        text_segments = self.handler._segment_text_for_broadcast(text)
+
+        # Pause après le segment précédent (plus de 2 secondes d'écart)
+        pause = self._previous_start is not None and start_time - self._previous_start > 2.0
+        times = [self._previous_start + 1.0] if pause else []
+        self._previous_start = start_time
+
+        # Segmenter le texte pour la diffusion (0.5 seconde entre sous-segments)
+        times.extend(start_time + j * 0.5 for j in range(len(text_segments)))
+        timecodes = self.timecodes.format(times)
+        if pause:
+            self._file.write("\\ TC:  " + timecodes[0] + " " + codes["clear"] + "\n")
+        for ltc_time, text_segment in zip(timecodes[1 if pause else 0:], text_segments):
+            self._file.write("\\ TC:  " + ltc_time + " " + codes["text_start"] + text_segment + codes["text_end"] + "\n")
+
+    def write_table(self, table: SegmentTable) -> None:
+        codes = self.codes
+        clear = " " + codes["clear"] + "\n"
+        text_start, text_end = " " + codes["text_start"], codes["text_end"] + "\n"
+        for lo in range(0, len(table), TABLE_BLOCK):
+            hi = min(lo + TABLE_BLOCK, len(table))
+            starts = table.start[lo:hi]
+            lines = [self.handler._segment_text_for_broadcast(text.strip()) for text in table.text[lo:hi]]
+            counts = np.fromiter(map(len, lines), dtype=np.int64, count=hi - lo)
+
+            # Pause avant un segment commençant plus de 2 secondes après le précédent
+            previous = np.concatenate(([np.nan if self._previous_start is None else self._previous_start], starts[:-1]))
+            pauses = starts - previous > 2.0
+
+            # Temps de toutes les lignes du bloc, dans l'ordre : pause éventuelle puis sous-segments
+            per_segment = counts + pauses
+            first = np.cumsum(per_segment) - per_segment
+            rank = np.arange(int(per_segment.sum())) - np.repeat(first + pauses, per_segment)
+            times = np.repeat(starts, per_segment) + rank * 0.5
+            times[first[pauses]] = previous[pauses] + 1.0
+            timecodes = iter(self.timecodes.format(times))
+
+            out = []
+            for pause, segment_lines in zip(pauses.tolist(), lines):
+                if pause:
+                    out.append("\\ TC:  " + next(timecodes) + clear)
+                for text_segment in segment_lines:
+                    out.append("\\ TC:  " + next(timecodes) + text_start + text_segment + text_end)
+            self._file.write("".join(out))
+            self._previous_start = float(starts[-1])
+            self.count += hi - lo
+        if self.flush:
+            self._file.flush()
+
+
+WRITERS = {
+    "srt": SRTWriter,
+    "vtt": VTTWriter,
+    "txt": BroadcastTXTWriter,
+}
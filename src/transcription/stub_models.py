@@ -0,0 +1,125 @@
+"""
+Modèles de substitution pour mesurer le pipeline sans télécharger de poids.
+
+- FakeWhisperModel : produit des segments scriptés, déterministes, avec un
+  temps de calcul simulé optionnel ;
+- random_tiny_model : vrai modèle Whisper aux dimensions de "tiny", initialisé
+  aléatoirement (coût de calcul réaliste, texte sans signification).
+"""
+
+import time
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+from .audio_cache import SAMPLE_RATE
+
+SCRIPT = (
+    "Bonjour et bienvenue dans cette émission.",
+    "Aujourd'hui nous partons à la rencontre des pêcheurs du village.",
+    "La mer est calme ce matin.",
+    "Comment se passe la saison cette année?",
+    "Super, les prises sont bonnes!",
+    "Merci de nous avoir suivis, au revoir.",
+)
+
+
+class FakeWhisperModel:
+    """
+    Imitation déterministe de whisper.Whisper (transcribe, detect_language).
+
+    Un segment de `segment_seconds` secondes est produit pour chaque tranche du
+    signal, avec le texte suivant du script. Le résultat ne dépend que de la
+    durée du signal et des options.
+    """
+
+    device = "cpu"
+
+    def __init__(
+        self,
+        script: Sequence[str] = SCRIPT,
+        segment_seconds: float = 3.0,
+        language: str = "fr",
+        realtime_factor: float = 0.0
+    ):
+        """
+        Initialise le modèle factice.
+
+        Args:
+            script: Phrases produites, dans l'ordre et en boucle
+            segment_seconds: Durée de chaque segment
+            language: Langue « détectée »
+            realtime_factor: Temps de calcul simulé par seconde d'audio (0 = instantané)
+        """
+        self.script = list(script)
+        self.segment_seconds = segment_seconds
+        self.language = language
+        self.realtime_factor = realtime_factor
+
+    def transcribe(self, audio: Any, **options) -> Dict[str, Any]:
+        """
+        Transcrit un signal mono 16 kHz (même format de résultat que Whisper).
+
+        Args:
+            audio: Signal audio float32
+            **options: Options Whisper (language est repris tel quel)
+
+        Returns:
+            Résultat (text, segments, language)
+        """
+        duration = len(audio) / SAMPLE_RATE
+        if self.realtime_factor:
+            time.sleep(duration * self.realtime_factor)
+
+        segments = []
+        starts = np.arange(0.0, duration, self.segment_seconds)
+        for i, start in enumerate(starts.tolist()):
+            end = min(start + self.segment_seconds, duration)
+            if end - start < 0.2:
+                continue
+            text = " " + self.script[i % len(self.script)]
+            segments.append({
+                "id": len(segments),
+                "seek": int(start * 100),
+                "start": round(start, 3),
+                "end": round(end, 3),
+                "text": text,
+                "tokens": [],
+                "temperature": 0.0,
+                "avg_logprob": -0.2,
+                "compression_ratio": 1.2,
+                "no_speech_prob": 0.01,
+            })
+
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": options.get("language") or self.language,
+        }
+
+    def detect_language(self, mel: Any) -> tuple:
+        """Retourne toujours la langue configurée (certitude maximale)."""
+        return None, {self.language: 1.0}
+
+
+def random_tiny_model(seed: int = 0) -> Any:
+    """
+    Construit un modèle Whisper aux dimensions de "tiny", initialisé aléatoirement.
+
+    Utile pour mesurer vitesse et mémoire sans télécharger de poids.
+
+    Args:
+        seed: Graine aléatoire
+
+    Returns:
+        Modèle Whisper fp32 sur CPU
+    """
+    import torch
+    from whisper.model import ModelDimensions, Whisper
+
+    torch.manual_seed(seed)
+    dims = ModelDimensions(
+        n_mels=80, n_audio_ctx=1500, n_audio_state=384, n_audio_head=6, n_audio_layer=4,
+        n_vocab=51865, n_text_ctx=448, n_text_state=384, n_text_head=6, n_text_layer=4,
+    )
+    return Whisper(dims).eval()
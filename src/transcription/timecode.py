@@ -0,0 +1,233 @@
+"""
+Timecodes SMPTE exacts à l'image près.
+
+Un timecode est manipulé comme un nombre entier d'images depuis 00:00:00:00 ;
+les libellés HH:MM:SS:FF n'apparaissent qu'à la lecture du timecode de départ
+et à l'écriture. Cadences prises en charge : 23.976, 24, 25, 29.97 (drop-frame
+ou non), 30, 50, 59.94 (drop-frame) et 60.
+
+En drop-frame, les libellés des images 0 et 1 (0 à 3 à 59.94) sont sautés
+au début de chaque minute, sauf les minutes multiples de 10 : le timecode
+reste ainsi aligné sur l'heure réelle. Le séparateur des images est ";" en
+drop-frame et ":" sinon.
+"""
+
+import re
+from fractions import Fraction
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Cadence -> (numérateur, dénominateur, drop-frame) ; "30d" est la notation du fichier TXT de diffusion
+NAMED_RATES = {
+    "23.976": (24000, 1001, False),
+    "24": (24, 1, False),
+    "25": (25, 1, False),
+    "29.97": (30000, 1001, True),
+    "29.97ndf": (30000, 1001, False),
+    "30d": (30000, 1001, True),
+    "30": (30, 1, False),
+    "50": (50, 1, False),
+    "59.94": (60000, 1001, True),
+    "60d": (60000, 1001, True),
+    "60": (60, 1, False),
+}
+
+# Autres notations acceptées
+RATE_ALIASES = {"23.98": "23.976", "29.97df": "29.97", "30df": "30d", "59.94df": "59.94", "60df": "60d"}
+
+DEFAULT_RATE = "30d"
+
+# Début de programme conventionnel en diffusion
+PROGRAM_START = "10:00:00:00"
+
+_TIMECODE_RE = re.compile(r"^\s*(\d{1,2}):(\d{2}):(\d{2})(?:([:;.,])(\d{2}))?\s*$")
+
+
+class FrameRate:
+    """
+    Cadence d'images d'un timecode.
+    """
+
+    def __init__(self, numerator: int, denominator: int = 1, drop_frame: bool = False):
+        """
+        Initialise la cadence.
+
+        Args:
+            numerator: Numérateur de la cadence réelle (30000 pour 29.97)
+            denominator: Dénominateur de la cadence réelle (1001 pour 29.97)
+            drop_frame: Numérotation drop-frame (29.97 et 59.94 seulement)
+        """
+        self.fps = Fraction(numerator, denominator)
+        # Images par seconde de timecode (30 pour 29.97)
+        self.nominal = round(self.fps)
+        if drop_frame and self.nominal not in (30, 60):
+            raise ValueError(f"Drop-frame impossible à {float(self.fps):g} images/s")
+        self.drop_frame = drop_frame
+        # Libellés sautés au début de chaque minute non multiple de 10
+        self.dropped = self.nominal // 15 if drop_frame else 0
+        self.frames_per_minute = self.nominal * 60 - self.dropped
+        self.frames_per_10_minutes = self.nominal * 600 - 9 * self.dropped
+        self.frames_per_day = 144 * self.frames_per_10_minutes
+        self.separator = ";" if drop_frame else ":"
+
+    def __repr__(self) -> str:
+        return f"FrameRate({float(self.fps):.3f}{' DF' if self.drop_frame else ''})"
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, FrameRate) and (self.fps, self.drop_frame) == (other.fps, other.drop_frame)
+
+    @classmethod
+    def from_string(cls, rate: str) -> "FrameRate":
+        """
+        Crée une cadence depuis son nom.
+
+        Args:
+            rate: Nom de la cadence (voir NAMED_RATES et RATE_ALIASES : 23.976, 25, 29.97, 30d...)
+
+        Returns:
+            Cadence
+        """
+        key = str(rate).strip().lower()
+        key = RATE_ALIASES.get(key, key)
+        if key not in NAMED_RATES:
+            raise ValueError(f"Cadence inconnue: {rate} (choix: {', '.join(NAMED_RATES)})")
+        return cls(*NAMED_RATES[key])
+
+    @classmethod
+    def from_media(cls, info: Optional[Dict[str, Any]], default: str = DEFAULT_RATE) -> "FrameRate":
+        """
+        Crée la cadence de la piste vidéo d'un fichier.
+
+        Les cadences NTSC (29.97, 59.94) sont numérotées en drop-frame, comme
+        le champ "Rate" du fichier TXT de diffusion (media_info.get_broadcast_rate).
+
+        Args:
+            info: Métadonnées du fichier (probe_media)
+            default: Cadence si le fichier n'a pas de piste vidéo
+
+        Returns:
+            Cadence
+        """
+        video = (info or {}).get("video") or {}
+        rate = video.get("r_frame_rate")
+        try:
+            fps = Fraction(rate) if rate and rate != "0/0" else None
+        except (ValueError, ZeroDivisionError):
+            fps = None
+        if not fps:
+            return cls.from_string(default)
+
+        nominal = round(fps)
+        return cls(fps.numerator, fps.denominator, drop_frame=fps.denominator != 1 and nominal in (30, 60))
+
+
+def parse_timecode(timecode: str, rate: FrameRate) -> int:
+    """
+    Convertit un timecode en nombre d'images.
+
+    Args:
+        timecode: Timecode HH:MM:SS:FF, HH:MM:SS;FF ou HH:MM:SS (images à 0)
+        rate: Cadence du timecode
+
+    Returns:
+        Nombre d'images depuis 00:00:00:00
+    """
+    match = _TIMECODE_RE.match(timecode or "")
+    if not match:
+        raise ValueError(f"Format de timecode invalide: {timecode}")
+    hours, minutes, seconds = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    frames = int(match.group(5) or 0)
+    if minutes > 59 or seconds > 59 or frames >= rate.nominal:
+        raise ValueError(f"Timecode hors limites à {float(rate.fps):g} images/s: {timecode}")
+    if rate.drop_frame and seconds == 0 and frames < rate.dropped and minutes % 10:
+        raise ValueError(f"Timecode inexistant en drop-frame: {timecode}")
+
+    total_minutes = hours * 60 + minutes
+    return (total_minutes * 60 + seconds) * rate.nominal + frames - rate.dropped * (total_minutes - total_minutes // 10)
+
+
+def seconds_to_frames(seconds: Union[float, Sequence[float], np.ndarray], rate: FrameRate) -> np.ndarray:
+    """
+    Convertit des temps en nombres d'images (image la plus proche).
+
+    Args:
+        seconds: Temps en secondes
+        rate: Cadence
+
+    Returns:
+        Nombres d'images (int64)
+    """
+    seconds = np.asarray(seconds, dtype=np.float64)
+    return np.floor(seconds * rate.fps.numerator / rate.fps.denominator + 0.5).astype(np.int64)
+
+
+def frames_to_timecodes(frames: Union[Sequence[int], np.ndarray], rate: FrameRate) -> List[str]:
+    """
+    Convertit des nombres d'images en timecodes, en un seul calcul vectorisé.
+
+    Les timecodes repassent à 00:00:00:00 après 24 heures.
+
+    Args:
+        frames: Nombres d'images depuis 00:00:00:00
+        rate: Cadence
+
+    Returns:
+        Timecodes HH:MM:SS;FF (drop-frame) ou HH:MM:SS:FF
+    """
+    frames = np.asarray(frames, dtype=np.int64) % rate.frames_per_day
+    if rate.drop_frame:
+        # Réintroduire les libellés sautés pour obtenir une numérotation continue
+        tens, rest = np.divmod(frames, rate.frames_per_10_minutes)
+        frames = frames + rate.dropped * (9 * tens + np.maximum(rest - rate.dropped, 0) // rate.frames_per_minute)
+
+    total_seconds, images = np.divmod(frames, rate.nominal)
+    total_minutes, seconds = np.divmod(total_seconds, 60)
+    hours, minutes = np.divmod(total_minutes, 60)
+
+    # Libellés écrits chiffre par chiffre dans un tampon ASCII de largeur fixe
+    buffer = np.empty((len(frames), 11), dtype=np.uint8)
+    for column, values in ((0, hours), (3, minutes), (6, seconds), (9, images)):
+        buffer[:, column] = 48 + values // 10
+        buffer[:, column + 1] = 48 + values % 10
+    buffer[:, 2] = buffer[:, 5] = ord(":")
+    buffer[:, 8] = ord(rate.separator)
+    return buffer.view("S11").ravel().astype(str).tolist()
+
+
+class TimecodeFormatter:
+    """
+    Convertit des temps relatifs au média en timecodes, depuis un timecode de départ lu une seule fois.
+    """
+
+    def __init__(self, rate: FrameRate, start: Optional[str] = None):
+        """
+        Initialise le convertisseur.
+
+        Args:
+            rate: Cadence
+            start: Timecode du début du média (défaut: 00:00:00:00)
+        """
+        self.rate = rate
+        self.start_frames = parse_timecode(start, rate) if start else 0
+
+    @property
+    def start(self) -> str:
+        """Timecode de départ, normalisé pour la cadence."""
+        return frames_to_timecodes([self.start_frames], self.rate)[0]
+
+    def format(self, seconds: Union[Sequence[float], np.ndarray]) -> List[str]:
+        """
+        Convertit un lot de temps en timecodes.
+
+        Args:
+            seconds: Temps depuis le début du média (secondes)
+
+        Returns:
+            Timecodes
+        """
+        return frames_to_timecodes(self.start_frames + seconds_to_frames(seconds, self.rate), self.rate)
+
+    def format_one(self, seconds: float) -> str:
+        """Convertit un temps en timecode."""
+        return self.format([seconds])[0]
@@ -0,0 +1,393 @@
+"""
+Opérations de minutage vectorisées sur une SegmentTable.
+
+Chaque opération calcule les nouveaux débuts/fins de toute la table en une
+fois avec NumPy ; seul le texte des segments fusionnés ou découpés est
+recomposé en Python. Les segments doivent être dans l'ordre chronologique.
+
+- merge_short : fusion des segments plus courts qu'une durée minimale
+  (même résultat que l'étape merge_short du post-traitement) ;
+- close_gaps : suppression des petits intervalles entre segments ;
+- extend_min_duration : allongement jusqu'à une durée d'affichage minimale ;
+- limit_cps : respect d'une vitesse de lecture maximale (caractères/seconde) ;
+- split_long : découpage des segments trop longs (caractères).
+
+reflow enchaîne ces opérations selon le cahier des charges d'un diffuseur.
+"""
+
+import logging
+from itertools import chain, compress
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .segment_table import SegmentTable
+
+logger = logging.getLogger(__name__)
+
+
+def _is_sorted(values: np.ndarray) -> bool:
+    """Indique si un tableau est croissant (au sens large)."""
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+def _char_counts(table: SegmentTable) -> np.ndarray:
+    """Nombre de caractères affichés de chaque segment (espaces de bord exclus)."""
+    return np.fromiter(map(len, map(str.strip, table.text)), dtype=np.int64, count=len(table))
+
+
+def _join_texts(texts: List[str]) -> str:
+    """
+    Texte d'un segment fusionné, comme le ferait merge_short_segments.
+
+    Les textes non vides sont joints par une espace ; si aucun des segments
+    absorbés n'a de texte, celui du premier segment est conservé tel quel.
+    """
+    parts = [text.strip() for text in texts]
+    if not any(parts[1:]):
+        return texts[0]
+    return " ".join(filter(None, parts))
+
+
+def _merge_groups(table: SegmentTable, firsts: np.ndarray) -> SegmentTable:
+    """
+    Fusionne des groupes de segments consécutifs.
+
+    Chaque groupe garde le début et les autres champs de son premier segment,
+    la fin de son dernier segment et la concaténation des textes.
+
+    Args:
+        table: Segments
+        firsts: Indice du premier segment de chaque groupe (croissants, firsts[0] == 0)
+
+    Returns:
+        Nouvelle table
+    """
+    lasts = np.append(firsts[1:], len(table)) - 1
+    merged = table.take(firsts)
+    merged.end = table.end[lasts]
+
+    text, merged_text = table.text, merged.text
+    groups = np.flatnonzero(lasts > firsts)
+    for group, first, last in zip(groups.tolist(), firsts[groups].tolist(), lasts[groups].tolist()):
+        merged_text[group] = _join_texts(text[first:last + 1])
+    return merged
+
+
+def _merge_short_firsts(start: np.ndarray, end: np.ndarray, min_duration: float) -> np.ndarray:
+    """
+    Premiers segments des groupes formés par merge_short_segments.
+
+    Un groupe commencé au segment i absorbe les segments suivants jusqu'au
+    premier j tel que end[j] - start[i] >= min_duration. Le segment qui suit
+    un segment assez long commence toujours un groupe : la chaîne des groupes
+    n'est donc suivie qu'entre ces points d'ancrage, tous en parallèle, par
+    doublement des sauts (log2 du plus long intervalle entre ancres).
+
+    Args:
+        start: Débuts (croissants)
+        end: Fins (croissantes)
+        min_duration: Durée minimale
+
+    Returns:
+        Indices des premiers segments des groupes
+    """
+    count = len(start)
+    index = np.arange(count)
+
+    # Dernier segment du groupe commencé en i ; la recherche sur start + min_duration
+    # est ajustée pour reproduire exactement la comparaison end[j] - start[i] >= min_duration
+    last = np.maximum(np.searchsorted(end, start + min_duration, side="left"), index)
+    while True:
+        previous = last - 1
+        mask = previous >= index
+        mask[mask] = end[previous[mask]] - start[mask] >= min_duration
+        if not mask.any():
+            break
+        last[mask] -= 1
+    while True:
+        mask = last < count
+        mask[mask] = end[last[mask]] - start[mask] < min_duration
+        if not mask.any():
+            break
+        last[mask] += 1
+
+    # Début du groupe suivant (count : fin de la table, point fixe)
+    jump = np.append(np.minimum(last + 1, count), count).astype(np.int32 if count < 2 ** 31 else np.int64)
+
+    anchors = np.zeros(count + 1, dtype=bool)
+    anchors[0] = True
+    anchors[1:][last == index] = True
+    anchors[count] = False
+    anchor_index = np.append(np.flatnonzero(anchors), count)
+    levels = int(np.diff(anchor_index).max()).bit_length() if count else 0
+
+    jumps = [jump]
+    for _ in range(1, levels):
+        jumps.append(jumps[-1][jumps[-1]])
+
+    firsts = anchors
+    for level in reversed(range(levels)):
+        firsts[jumps[level][np.flatnonzero(firsts)]] = True
+    return np.flatnonzero(firsts[:count])
+
+
+def _merge_short_firsts_sequential(start: List[float], end: List[float], min_duration: float) -> np.ndarray:
+    """Variante séquentielle de _merge_short_firsts, pour des segments hors d'ordre."""
+    firsts = [0]
+    group_start, group_end = start[0], end[0]
+    for i in range(1, len(start)):
+        if group_end - group_start < min_duration:
+            group_end = end[i]
+        else:
+            firsts.append(i)
+            group_start, group_end = start[i], end[i]
+    return np.array(firsts, dtype=np.int64)
+
+
+def merge_short(table: SegmentTable, min_duration: float = 1.0) -> SegmentTable:
+    """
+    Fusionne chaque segment trop court avec les suivants.
+
+    Résultat identique à postprocess.merge_short_segments : un segment plus
+    court que min_duration absorbe le suivant, et ainsi de suite jusqu'à
+    atteindre la durée minimale.
+
+    Args:
+        table: Segments
+        min_duration: Durée minimale d'un segment (secondes)
+
+    Returns:
+        Nouvelle table
+    """
+    if len(table) == 0:
+        return table.take([])
+    if _is_sorted(table.start) and _is_sorted(table.end):
+        firsts = _merge_short_firsts(table.start, table.end, min_duration)
+    else:
+        logger.debug("Segments hors d'ordre chronologique: fusion séquentielle")
+        firsts = _merge_short_firsts_sequential(table.start.tolist(), table.end.tolist(), min_duration)
+    return _merge_groups(table, firsts)
+
+
+def close_gaps(table: SegmentTable, max_gap: float, min_gap: float = 0.0) -> SegmentTable:
+    """
+    Ramène à min_gap les intervalles entre segments ne dépassant pas max_gap.
+
+    La fin du segment précédent est déplacée (chevauchements compris), sans
+    jamais précéder son début.
+
+    Args:
+        table: Segments
+        max_gap: Intervalle maximal comblé (secondes)
+        min_gap: Intervalle conservé entre deux segments (secondes)
+
+    Returns:
+        Nouvelle table
+    """
+    result = table.copy()
+    gap = table.start[1:] - table.end[:-1]
+    close = (gap <= max_gap) & (gap != min_gap)
+    result.end[:-1][close] = np.maximum(table.start[1:][close] - min_gap, table.start[:-1][close])
+    return result
+
+
+def _extend_to(table: SegmentTable, durations: np.ndarray, min_gap: float) -> np.ndarray:
+    """
+    Fins allongées pour atteindre les durées voulues, sans empiéter sur le segment suivant.
+
+    Args:
+        table: Segments
+        durations: Durée visée de chaque segment
+        min_gap: Intervalle à conserver avant le segment suivant
+
+    Returns:
+        Nouvelles fins (jamais avant les fins actuelles)
+    """
+    limit = np.append(table.start[1:] - min_gap, np.inf)
+    return np.maximum(table.end, np.minimum(table.start + durations, limit))
+
+
+def extend_min_duration(table: SegmentTable, min_duration: float, min_gap: float = 0.0) -> SegmentTable:
+    """
+    Allonge les segments jusqu'à une durée d'affichage minimale.
+
+    Args:
+        table: Segments
+        min_duration: Durée d'affichage minimale (secondes)
+        min_gap: Intervalle à conserver avant le segment suivant (secondes)
+
+    Returns:
+        Nouvelle table
+    """
+    result = table.copy()
+    result.end = _extend_to(table, np.full(len(table), float(min_duration)), min_gap)
+    return result
+
+
+def limit_cps(table: SegmentTable, max_cps: float, min_gap: float = 0.0) -> SegmentTable:
+    """
+    Ramène les segments trop rapides sous une vitesse de lecture maximale.
+
+    Un segment trop rapide est d'abord allongé sur l'intervalle qui le suit ;
+    s'il l'est encore, il est fusionné avec le segment suivant quand la paire
+    respecte la limite (en un seul passage : un segment n'est fusionné qu'une
+    fois). Les segments qui restent trop rapides sont laissés tels quels.
+
+    Args:
+        table: Segments
+        max_cps: Nombre maximal de caractères par seconde
+        min_gap: Intervalle à conserver avant le segment suivant (secondes)
+
+    Returns:
+        Nouvelle table
+    """
+    if len(table) == 0:
+        return table.take([])
+    chars = _char_counts(table)
+    result = table.copy()
+    result.end = _extend_to(table, chars / max_cps, min_gap)
+
+    start, end = result.start, result.end
+    too_fast = chars > max_cps * (end - start)
+    # Paire (i, i + 1) fusionnable : i trop rapide et la paire sous la limite (espace de jonction comprise)
+    pair_ok = too_fast[:-1] & (chars[:-1] + 1 + chars[1:] <= max_cps * (end[1:] - start[:-1]))
+    if not pair_ok.any():
+        return result
+
+    # Paires disjointes : dans chaque suite de paires candidates consécutives, une sur deux
+    run_starts = pair_ok & ~np.append(False, pair_ok[:-1])
+    offset = np.arange(len(pair_ok)) - np.flatnonzero(run_starts)[np.maximum(np.cumsum(run_starts) - 1, 0)]
+    selected = pair_ok & (offset % 2 == 0)
+
+    absorbed = np.zeros(len(table), dtype=bool)
+    absorbed[1:] = selected
+    logger.debug(f"Vitesse de lecture: {int(selected.sum())} paire(s) fusionnée(s)")
+    return _merge_groups(result, np.flatnonzero(~absorbed))
+
+
+def _split_texts(texts: List[str], parts: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    """
+    Coupe des textes entre les mots en morceaux de longueurs proches.
+
+    Chaque mot va au morceau où tombe son milieu ; la répartition est
+    calculée pour tous les mots de tous les textes à la fois.
+
+    Args:
+        texts: Textes à couper (au moins un mot chacun)
+        parts: Nombre de morceaux voulus pour chaque texte
+
+    Returns:
+        Tuple (morceaux de tous les textes bout à bout, nombre de morceaux par texte)
+    """
+    split_texts = [text.split() for text in texts]
+    word_counts = np.fromiter(map(len, split_texts), dtype=np.int64, count=len(texts))
+    words = list(chain.from_iterable(split_texts))
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    owner = np.repeat(np.arange(len(texts)), word_counts)
+    first_word = np.cumsum(word_counts) - word_counts
+
+    # Position de chaque mot dans son texte (mots séparés par une espace)
+    cumulative = np.cumsum(lengths + 1)
+    position = cumulative - (lengths + 1) - np.repeat(cumulative[first_word] - (lengths[first_word] + 1), word_counts)
+    total = np.add.reduceat(lengths, first_word) + word_counts - 1
+    piece = np.minimum(parts[owner] - 1, ((position + lengths / 2) * parts[owner] / total[owner]).astype(np.int64))
+
+    # Morceaux non vides : suites de mots de même texte et même morceau
+    starts = np.flatnonzero(np.append(True, (owner[1:] != owner[:-1]) | (piece[1:] != piece[:-1])))
+    ends = np.append(starts[1:], len(words))
+    pieces = [" ".join(words[start:end]) for start, end in zip(starts.tolist(), ends.tolist())]
+    return pieces, np.bincount(owner[starts], minlength=len(texts))
+
+
+def split_long(table: SegmentTable, max_chars: int) -> SegmentTable:
+    """
+    Découpe les segments de plus de max_chars caractères.
+
+    Le texte est coupé entre les mots en morceaux de longueurs proches ; la
+    durée est répartie au prorata des caractères, ce qui conserve la vitesse
+    de lecture. Les autres champs sont recopiés sur chaque morceau.
+
+    Args:
+        table: Segments
+        max_chars: Nombre maximal de caractères par segment
+
+    Returns:
+        Nouvelle table
+    """
+    chars = _char_counts(table)
+    long_rows = np.flatnonzero(chars > max_chars)
+    if len(long_rows) == 0:
+        return table.copy()
+
+    long_list = long_rows.tolist()
+    pieces, piece_counts = _split_texts([table.text[row] for row in long_list], -(-chars[long_rows] // max_chars))
+    counts = np.ones(len(table), dtype=np.int64)
+    counts[long_rows] = piece_counts
+
+    # Textes : ceux des segments d'origine, remplacés par les morceaux des segments découpés
+    rows = np.repeat(np.arange(len(table)), counts)
+    split = np.flatnonzero(counts[rows] > 1)
+    texts = [table.text[row] for row in rows.tolist()]
+    # Un segment long resté d'un seul morceau (un seul mot) garde son texte
+    kept = np.repeat(piece_counts > 1, piece_counts)
+    for index, text in zip(split.tolist(), compress(pieces, kept.tolist())):
+        texts[index] = text
+
+    result = table.take(rows)
+    result.text = texts
+
+    # Durée du segment d'origine répartie entre ses morceaux au prorata des caractères
+    source = rows[split]
+    lengths = np.fromiter((len(texts[i]) for i in split.tolist()), dtype=np.float64, count=len(split))
+    first = np.flatnonzero(np.append(True, source[1:] != source[:-1]))
+    sizes = np.diff(np.append(first, len(split)))
+    cumulative = np.cumsum(lengths)
+    before = cumulative - lengths - np.repeat(cumulative[first] - lengths[first], sizes)
+    total = np.repeat(np.add.reduceat(lengths, first), sizes)
+    origin = table.start[source]
+    duration = table.end[source] - origin
+    result.start[split] = origin + duration * before / total
+    result.end[split] = origin + duration * (before + lengths) / total
+    return result
+
+
+def reflow(
+    table: SegmentTable,
+    merge_under: Optional[float] = None,
+    max_chars: Optional[int] = None,
+    max_cps: Optional[float] = None,
+    min_duration: Optional[float] = None,
+    max_gap: Optional[float] = None,
+    min_gap: float = 0.0
+) -> SegmentTable:
+    """
+    Applique un cahier des charges de minutage complet.
+
+    Ordre des opérations : fusion des segments courts, découpage des segments
+    longs, vitesse de lecture, durée minimale d'affichage, intervalles. Une
+    règle à None n'est pas appliquée.
+
+    Args:
+        table: Segments
+        merge_under: Durée sous laquelle un segment est fusionné avec le suivant (secondes)
+        max_chars: Nombre maximal de caractères par segment
+        max_cps: Nombre maximal de caractères par seconde
+        min_duration: Durée d'affichage minimale (secondes)
+        max_gap: Intervalle maximal comblé entre deux segments (secondes)
+        min_gap: Intervalle à conserver entre deux segments (secondes)
+
+    Returns:
+        Nouvelle table
+    """
+    if merge_under is not None:
+        table = merge_short(table, merge_under)
+    if max_chars is not None:
+        table = split_long(table, max_chars)
+    if max_cps is not None:
+        table = limit_cps(table, max_cps, min_gap)
+    if min_duration is not None:
+        table = extend_min_duration(table, min_duration, min_gap)
+    if max_gap is not None:
+        table = close_gaps(table, max_gap, min_gap)
+    return table
@@ -0,0 +1,194 @@
+"""
+Détection d'activité vocale (VAD) par énergie, entièrement vectorisée.
+
+Seules les zones de parole sont transmises au modèle ; les horodatages du
+résultat sont ensuite replacés sur la timeline d'origine.
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .audio_cache import SAMPLE_RATE
+from .chunking import frame_energy
+
+logger = logging.getLogger(__name__)
+
+# Silence inséré entre deux zones de parole concaténées (secondes)
+JOIN_GAP_SECONDS = 0.2
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Retourne les indices de début et de fin (exclus) des suites de True."""
+    padded = np.concatenate(([False], mask, [False]))
+    changes = np.flatnonzero(padded[1:] != padded[:-1])
+    return changes[0::2], changes[1::2]
+
+
+def detect_speech_regions(
+    audio: np.ndarray,
+    sample_rate: int = SAMPLE_RATE,
+    frame_seconds: float = 0.03,
+    margin_db: float = 12.0,
+    min_threshold_db: float = -50.0,
+    min_speech_seconds: float = 0.25,
+    min_silence_seconds: float = 0.5,
+    padding_seconds: float = 0.2
+) -> List[Tuple[float, float]]:
+    """
+    Détecte les zones de parole d'un signal.
+
+    Le seuil s'adapte au bruit de fond : une trame est active si son énergie
+    dépasse le plancher de bruit (10e percentile) de margin_db décibels.
+
+    Args:
+        audio: Signal audio mono
+        sample_rate: Fréquence d'échantillonnage
+        frame_seconds: Durée d'une trame d'analyse
+        margin_db: Marge au-dessus du plancher de bruit
+        min_threshold_db: Seuil minimal absolu (dBFS)
+        min_speech_seconds: Durée minimale d'une zone de parole
+        min_silence_seconds: Silences plus courts fusionnés avec la parole
+        padding_seconds: Marge ajoutée autour de chaque zone
+
+    Returns:
+        Liste de zones (début, fin) en secondes
+    """
+    energy = frame_energy(audio, sample_rate, frame_seconds)
+    if len(energy) == 0:
+        return []
+
+    db = 20.0 * np.log10(np.maximum(energy, 1e-10))
+    threshold = max(float(np.percentile(db, 10)) + margin_db, min_threshold_db)
+    active = db > threshold
+
+    # Combler les silences courts
+    starts, ends = _runs(~active)
+    short = (ends - starts) * frame_seconds < min_silence_seconds
+    interior = (starts > 0) & (ends < len(active))
+    fill = np.zeros(len(active) + 1, dtype=np.int32)
+    np.add.at(fill, starts[short & interior], 1)
+    np.add.at(fill, ends[short & interior], -1)
+    active |= np.cumsum(fill[:-1]) > 0
+
+    # Retirer les zones de parole trop courtes
+    starts, ends = _runs(active)
+    keep = (ends - starts) * frame_seconds >= min_speech_seconds
+    starts, ends = starts[keep], ends[keep]
+    if len(starts) == 0:
+        return []
+
+    duration = len(audio) / float(sample_rate)
+    region_starts = np.maximum(starts * frame_seconds - padding_seconds, 0.0)
+    region_ends = np.minimum(ends * frame_seconds + padding_seconds, duration)
+
+    # Fusionner les zones qui se chevauchent après l'ajout des marges
+    first = np.flatnonzero(np.concatenate(([True], region_starts[1:] > region_ends[:-1])))
+    merged_starts = region_starts[first]
+    merged_ends = np.maximum.reduceat(region_ends, first)
+
+    return list(zip(merged_starts.tolist(), merged_ends.tolist()))
+
+
+def extract_speech(
+    audio: np.ndarray,
+    regions: List[Tuple[float, float]],
+    sample_rate: int = SAMPLE_RATE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatène les zones de parole en un signal compact.
+
+    Args:
+        audio: Signal audio mono
+        regions: Zones (début, fin) en secondes
+        sample_rate: Fréquence d'échantillonnage
+
+    Returns:
+        Tuple (signal compact, table de correspondance [début compact, début original, durée])
+    """
+    gap = np.zeros(int(JOIN_GAP_SECONDS * sample_rate), dtype=np.float32)
+    pieces = []
+    mapping = np.zeros((len(regions), 3), dtype=np.float64)
+    position = 0.0
+
+    for i, (start, end) in enumerate(regions):
+        piece = np.asarray(audio[int(start * sample_rate):int(end * sample_rate)], dtype=np.float32)
+        mapping[i] = (position, start, len(piece) / float(sample_rate))
+        pieces.append(piece)
+        pieces.append(gap)
+        position += (len(piece) + len(gap)) / float(sample_rate)
+
+    compact = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+    return compact, mapping
+
+
+def remap_times(times: np.ndarray, mapping: np.ndarray) -> np.ndarray:
+    """
+    Convertit des instants de la timeline compacte vers la timeline d'origine.
+
+    Args:
+        times: Instants (secondes) sur le signal compact
+        mapping: Table de correspondance issue de extract_speech
+
+    Returns:
+        Instants sur la timeline d'origine
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if len(mapping) == 0:
+        return times
+    index = np.clip(np.searchsorted(mapping[:, 0], times, side="right") - 1, 0, len(mapping) - 1)
+    # Un instant tombant dans le silence inséré est ramené à la fin de la zone
+    local = np.clip(times - mapping[index, 0], 0.0, mapping[index, 2])
+    return mapping[index, 1] + local
+
+
+def remap_result(result: Dict[str, Any], mapping: np.ndarray) -> Dict[str, Any]:
+    """
+    Replace les horodatages d'un résultat Whisper sur la timeline d'origine.
+
+    Args:
+        result: Résultat obtenu sur le signal compact
+        mapping: Table de correspondance issue de extract_speech
+
+    Returns:
+        Résultat avec horodatages d'origine
+    """
+    segments = result.get("segments", [])
+    if not segments:
+        return result
+
+    starts = remap_times([seg["start"] for seg in segments], mapping)
+    ends = remap_times([seg["end"] for seg in segments], mapping)
+    for segment, start, end in zip(segments, starts.tolist(), ends.tolist()):
+        segment["start"] = start
+        segment["end"] = max(end, start)
+        if "words" in segment:
+            word_starts = remap_times([w["start"] for w in segment["words"]], mapping)
+            word_ends = remap_times([w["end"] for w in segment["words"]], mapping)
+            for word, w_start, w_end in zip(segment["words"], word_starts.tolist(), word_ends.tolist()):
+                word["start"] = w_start
+                word["end"] = max(w_end, w_start)
+    return result
+
+
+def speech_report(regions: List[Tuple[float, float]], total_duration: float) -> Dict[str, float]:
+    """
+    Résume la part d'audio ignorée par la VAD.
+
+    Args:
+        regions: Zones de parole (début, fin) en secondes
+        total_duration: Durée totale du signal
+
+    Returns:
+        Dictionnaire (total, speech, skipped, skipped_ratio, regions)
+    """
+    speech = float(sum(end - start for start, end in regions))
+    skipped = max(total_duration - speech, 0.0)
+    return {
+        "total": total_duration,
+        "speech": speech,
+        "skipped": skipped,
+        "skipped_ratio": skipped / total_duration if total_duration else 0.0,
+        "regions": len(regions),
+    }
@@ -3,12 +3,32 @@ Gestionnaire de transcription avec Whisper.
 """
 
 import os
+import time
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import whisper
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Union
+import numpy as np
 import ffmpeg
 
+from .model_registry import get_model_registry
+from .backends import DEFAULT_BACKEND, InferenceBackend, get_backend
+from .ffmpeg_tools import get_ffmpeg_path
+from .media_info import probe_media
+from .audio_cache import SAMPLE_RATE, load_audio, stream_audio, get_audio_duration, content_hash
+from .result_cache import ResultCache, make_cache_key
+from .chunking import transcribe_in_chunks, split_audio, stream_windows, stitch_results
+from .vad import detect_speech_regions, extract_speech, remap_result, speech_report
+from .cascade import find_low_confidence, plan_ranges, splice, cascade_report
+from .language_detection import detect_language as run_language_detection
+from .corrections import get_correction_engine
+from .postprocess import PostProcessor, improve_punctuation, merge_short_segments, improve_context
+from .quantization import validate_quantize, quantize_model
+from .cpu_budget import apply_thread_settings
+from .stream_writers import WRITERS, SRTWriter, VTTWriter, BroadcastTXTWriter
+from .segment_table import SegmentTable
+from .timecode import DEFAULT_RATE, PROGRAM_START, FrameRate, TimecodeFormatter, parse_timecode, seconds_to_frames, frames_to_timecodes
+from profiling import profiled, profile_stage
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,56 +37,137 @@ class WhisperHandler:
     Gestionnaire pour la transcription audio/vidéo avec Whisper.
     """
     
-    def __init__(self, model_name: str = "medium", device: str = "cpu"):
+    def __init__(
+        self,
+        model_name: str = "medium",
+        device: str = "cpu",
+        use_audio_cache: bool = True,
+        use_result_cache: bool = False,
+        refresh_cache: bool = False,
+        use_vad: bool = False,
+        language_model: Optional[str] = None,
+        quantize: Optional[str] = None,
+        num_threads: Optional[int] = None,
+        cpu_affinity: Optional[List[int]] = None,
+        backend: Union[str, InferenceBackend] = DEFAULT_BACKEND,
+        corrections: Optional[List[str]] = None,
+        post_process_stages: Optional[List[str]] = None
+    ):
         """
         Initialise le gestionnaire Whisper.
         
         Args:
             model_name: Nom du modèle Whisper (tiny, base, small, medium, large)
             device: Device pour l'inférence (cpu, cuda, auto)
+            use_audio_cache: Conserver l'audio décodé dans un cache disque
+            use_result_cache: Réutiliser les résultats de transcription déjà calculés
+            refresh_cache: Ignorer les résultats en cache et les recalculer
+            use_vad: Ne transmettre au modèle que les zones de parole détectées
+            language_model: Petit modèle chargé de détecter la langue quand elle
+                n'est pas fournie (None = détection par Whisper avec ce modèle)
+            quantize: Quantification dynamique des couches linéaires ("int8")
+            num_threads: Threads PyTorch pour l'inférence (réglage du processus entier)
+            cpu_affinity: Cœurs autorisés pour le processus (None = inchangé)
+            backend: Moteur d'inférence, par nom ("whisper", "fake") ou instance
+            corrections: Dictionnaires de corrections propres à l'émission
+                (compléments du dictionnaire par défaut)
+            post_process_stages: Étapes du post-traitement, dans l'ordre
+                (défaut: correct_errors, punctuation, merge_short, context)
         """
         self.model_name = model_name
         self.device = device
-        self.model = None
-        self._load_model()
+        self.use_audio_cache = use_audio_cache
+        self.result_cache = ResultCache() if use_result_cache else None
+        self.refresh_cache = refresh_cache
+        self.use_vad = use_vad
+        self.last_vad_report = None
+        self.last_cascade_report = None
+        self.language_model = language_model
+        self.last_language_detection = None
+        self.backend = get_backend(backend) if isinstance(backend, str) else backend
+        self.quantize = validate_quantize(quantize)
+        if self.quantize and not self.backend.supports_quantize:
+            raise ValueError(f"Le moteur {self.backend.name} ne supporte pas la quantification")
+        self.num_threads = num_threads
+        self.cpu_affinity = list(cpu_affinity) if cpu_affinity else None
+        if num_threads or cpu_affinity:
+            apply_thread_settings(num_threads, cpu_affinity)
+        self.corrections = get_correction_engine(corrections)
+        self.post_processor = PostProcessor(post_process_stages, self.corrections)
+        # Le modèle est chargé au premier usage (transcription ou warmup)
+        self._model = None
+    
+    @property
+    def model(self):
+        """Modèle Whisper, chargé à la première utilisation."""
+        if self._model is None:
+            self._load_model()
+        return self._model
+    
+    @property
+    def is_model_loaded(self) -> bool:
+        """Indique si le modèle est déjà chargé."""
+        return self._model is not None
+    
+    def warmup(self) -> "WhisperHandler":
+        """
+        Charge le modèle immédiatement plutôt qu'à la première transcription.
+        
+        Returns:
+            Le gestionnaire lui-même
+        """
+        if self._model is None:
+            self._load_model()
+        return self
     
+    @profiled("model.load")
     def _load_model(self):
-        """Charge le modèle Whisper."""
+        """Charge le modèle Whisper (ou le réutilise depuis le registre partagé)."""
+        # Gérer l'absence de PyTorch sur Streamlit Cloud
         try:
-            logger.info(f"Chargement du modèle Whisper: {self.model_name}")
-            
-            # Gérer l'absence de PyTorch sur Streamlit Cloud
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    logger.info("CUDA disponible mais utilisation forcée du CPU pour la compatibilité")
-                device = "cpu"
-            except ImportError:
-                logger.info("PyTorch non disponible, utilisation du CPU par défaut")
-                device = "cpu"
-            
-            # Charger le modèle avec des options spécifiques pour éviter les erreurs
-            self.model = whisper.load_model(
-                self.model_name, 
-                device=device,
-                download_root=None,
-                in_memory=False
-            )
-            logger.info("Modèle chargé avec succès")
-        except Exception as e:
-            logger.error(f"Erreur lors du chargement du modèle: {e}")
-            # Essayer avec des options de fallback
-            try:
-                logger.info("Tentative de chargement avec options de fallback...")
-                self.model = whisper.load_model(self.model_name, device="cpu")
-                logger.info("Modèle chargé avec succès (fallback)")
-            except Exception as e2:
-                logger.error(f"Erreur lors du chargement de fallback: {e2}")
-                raise
+            import torch
+            if torch.cuda.is_available():
+                logger.info("CUDA disponible mais utilisation forcée du CPU pour la compatibilité")
+            device = "cpu"
+        except ImportError:
+            logger.info("PyTorch non disponible, utilisation du CPU par défaut")
+            device = "cpu"
+        
+        self._model = self._get_registry_model(self.model_name, device)
+    
+    def _get_registry_model(self, model_name: str, device: str = "cpu"):
+        """
+        Retourne un modèle du registre partagé, quantifié si demandé.
+        
+        Args:
+            model_name: Nom du modèle Whisper
+            device: Device pour l'inférence
+            
+        Returns:
+            Modèle chargé par le moteur d'inférence
+        """
+        backend = self.backend
+        variant = self._model_variant()
+        if not self.quantize:
+            return get_model_registry().get(model_name, device, backend.load, variant=variant)
+        
+        quantize = self.quantize
+        
+        def load_quantized(name: str, dev: str):
+            return quantize_model(backend.load(name, dev), quantize)
+        
+        return get_model_registry().get(model_name, device, load_quantized, variant=variant)
+    
+    def _model_variant(self) -> Optional[str]:
+        """Variante du modèle dans le registre (moteur autre que whisper, quantification)."""
+        parts = [self.backend.name] if self.backend.name != DEFAULT_BACKEND else []
+        if self.quantize:
+            parts.append(self.quantize)
+        return ":".join(parts) or None
     
     def transcribe(
         self,
-        input_path: str,
+        input_path: Union[str, np.ndarray],
         language: Optional[str] = None,
         task: str = "transcribe",
         output_format: str = "srt"
@@ -75,7 +176,7 @@ class WhisperHandler:
         Transcrit un fichier audio/vidéo.
         
         Args:
-            input_path: Chemin vers le fichier d'entrée
+            input_path: Chemin vers le fichier d'entrée (ou signal audio 16 kHz)
             language: Langue du contenu (auto-détection si None)
             task: Type de tâche (transcribe ou translate)
             output_format: Format de sortie (srt, vtt, txt, json)
@@ -87,7 +188,7 @@ class WhisperHandler:
     
     def transcribe_with_options(
         self,
-        input_path: str,
+        input_path: Union[str, np.ndarray],
         language: Optional[str] = None,
         task: str = "transcribe",
         condition_on_previous_text: bool = True,
@@ -100,7 +201,7 @@ class WhisperHandler:
         Transcrit avec des options avancées pour améliorer la qualité.
         
         Args:
-            input_path: Chemin vers le fichier d'entrée
+            input_path: Chemin vers le fichier d'entrée (ou signal audio 16 kHz)
             language: Langue du contenu
             task: Type de tâche
             condition_on_previous_text: Utiliser le contexte précédent
@@ -123,7 +224,7 @@ class WhisperHandler:
     
     def _transcribe_with_config(
         self,
-        input_path: str,
+        input_path: Union[str, np.ndarray],
         language: Optional[str] = None,
         task: str = "transcribe",
         output_format: str = "srt",
@@ -131,98 +232,595 @@ class WhisperHandler:
     ) -> Dict[str, Any]:
         """
         Transcription avec configuration personnalisée.
+        
+        Args:
+            input_path: Chemin du fichier d'entrée ou signal audio mono 16 kHz float32
+            language: Langue du contenu (auto-détection si None)
+            task: Type de tâche (transcribe ou translate)
+            output_format: Format de sortie
+            **kwargs: Options de décodage transmises à Whisper
         """
         try:
-            logger.info(f"Transcription de: {input_path}")
+            options = self._build_options(language, task, kwargs)
+            prepared = self._prepare_input(input_path, options)
+            if prepared["cached"] is not None:
+                return prepared["cached"]
+            return self._run_inference(prepared, options)
+            
+        except Exception as e:
+            logger.error(f"Erreur lors de la transcription: {e}")
+            raise
+    
+    def _build_options(self, language: Optional[str], task: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Construit les options de transcription transmises à Whisper.
+        
+        Args:
+            language: Langue du contenu (auto-détection si None)
+            task: Type de tâche
+            kwargs: Options avancées
+            
+        Returns:
+            Options complètes
+        """
+        # Options de transcription de base
+        options = {
+            "task": task,
+            "verbose": False,
+            "fp16": False
+        }
+        
+        # Ajouter les options avancées si fournies
+        if kwargs:
+            options.update(kwargs)
+            logger.info(f"Options avancées utilisées: {kwargs}")
+        
+        if language:
+            options["language"] = language
+        
+        return options
+    
+    def _prepare_input(self, input_path: Union[str, np.ndarray], options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Étape d'entrée/sortie : cache des résultats, métadonnées et décodage audio.
+        
+        Cette étape ne touche pas au modèle ; elle peut donc s'exécuter dans un
+        autre thread pendant l'inférence d'un autre fichier.
+        
+        Args:
+            input_path: Chemin du fichier d'entrée ou signal audio 16 kHz
+            options: Options complètes de transcription
+            
+        Returns:
+            Dictionnaire (audio, duration, cache_key, cached, source)
+        """
+        prepared = {"audio": None, "duration": None, "cache_key": None, "cached": None, "source": None}
+        
+        if isinstance(input_path, np.ndarray):
+            # Signal déjà décodé
+            prepared["audio"] = input_path
+            prepared["duration"] = get_audio_duration(input_path)
+            logger.info(f"Transcription d'un signal audio de {prepared['duration']:.1f}s")
+            return prepared
+        
+        logger.info(f"Transcription de: {input_path}")
+        prepared["source"] = input_path
+        
+        # Validation du fichier d'entrée
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Fichier non trouvé: {input_path}")
+        
+        # Cache des résultats : un succès évite le décodage et le chargement du modèle
+        prepared["cache_key"], prepared["cached"] = self._lookup_result_cache(input_path, options)
+        if prepared["cached"] is not None:
+            return prepared
+        
+        # Configuration de FFmpeg pour le moteur (résolu une seule fois par processus)
+        self.backend.prepare(get_ffmpeg_path())
+        
+        # Métadonnées du média (durée pour le suivi de progression)
+        media_info = probe_media(input_path)
+        prepared["duration"] = media_info.get("duration") if media_info else None
+        if prepared["duration"]:
+            logger.info(f"Durée du média: {prepared['duration']:.1f}s")
+        
+        # Décodage unique de la piste audio (cache .npy mappé en mémoire)
+        prepared["audio"] = load_audio(input_path, use_cache=self.use_audio_cache)
+        return prepared
+    
+    def _run_inference(self, prepared: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Étape de calcul : VAD éventuelle puis transcription par le modèle.
+        
+        Args:
+            prepared: Entrée préparée par _prepare_input
+            options: Options complètes de transcription
+            
+        Returns:
+            Résultat de la transcription
+        """
+        audio = prepared["audio"]
+        duration = prepared["duration"]
+        
+        # Langue détectée sur l'audio complet, avant le pré-filtrage
+        options = self._resolve_language(options, audio, prepared.get("source"))
+        
+        # Pré-filtrage VAD : seules les zones de parole sont transmises au modèle
+        mapping = None
+        if self.use_vad:
+            audio, mapping = self._apply_vad(audio)
+        
+        # Transcription
+        start = time.perf_counter()
+        if mapping is not None and len(mapping) == 0:
+            result = {"text": "", "segments": [], "language": options.get("language")}
+        else:
+            with profile_stage("inference"):
+                result = self.backend.transcribe_window(self.model, audio, **options)
+        if mapping is not None:
+            result = remap_result(result, mapping)
+        elapsed = time.perf_counter() - start
+        
+        if duration:
+            logger.info(f"Transcription terminée avec succès en {elapsed:.1f}s (facteur temps réel: {elapsed / duration:.2f})")
+        else:
+            logger.info("Transcription terminée avec succès")
+        
+        if prepared["cache_key"] is not None:
+            self.result_cache.put(prepared["cache_key"], result)
+        return result
+    
+    def transcribe_iter(
+        self,
+        input_path: Union[str, np.ndarray],
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        window_seconds: float = 30.0,
+        bounded_memory: bool = False,
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Transcrit en produisant les segments au fur et à mesure.
+        
+        Le signal est découpé en fenêtres (coupées sur les silences) décodées
+        l'une après l'autre ; les segments de chaque fenêtre sont produits dès
+        qu'elle est terminée, avec des horodatages sur la timeline d'origine.
+        
+        En mode bounded_memory, l'audio est lu par blocs depuis ffmpeg au lieu
+        d'être chargé en entier : seule la fenêtre courante et le prompt de
+        contexte restent en mémoire, quelle que soit la durée du fichier
+        (associer à save_stream pour écrire les segments au fil de l'eau).
+        
+        Args:
+            input_path: Chemin vers le fichier d'entrée (ou signal audio 16 kHz)
+            language: Langue du contenu (détectée avec language_model, ou sur la
+                première fenêtre, si None)
+            task: Type de tâche (transcribe ou translate)
+            window_seconds: Durée cible d'une fenêtre de décodage
+            bounded_memory: Lire l'audio par blocs (mémoire constante, fichiers de plusieurs heures)
+            **kwargs: Options de décodage transmises à Whisper
             
-            # Validation du fichier d'entrée
+        Yields:
+            Segments au format Whisper
+        """
+        options = {"task": task, "verbose": False, "fp16": False}
+        options.update(kwargs)
+        if language:
+            options["language"] = language
+        
+        streamed = bounded_memory and not isinstance(input_path, np.ndarray)
+        mapping = None
+        if streamed:
             if not os.path.exists(input_path):
                 raise FileNotFoundError(f"Fichier non trouvé: {input_path}")
-            
-            # Configuration de FFmpeg pour Whisper
-            import whisper
-            import subprocess
-            
-            # Vérifier si FFmpeg est disponible
-            ffmpeg_path = None
-            possible_paths = [
-                "ffmpeg",
-                r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-                os.path.expanduser(r"~\AppData\Local\Microsoft\WinGet\Packages\Gyan.FFmpeg_Microsoft.Winget.Source_8wekyb3d8bbwe\ffmpeg-7.1.1-full_build\bin\ffmpeg.exe")
-            ]
-            
-            for path in possible_paths:
-                try:
-                    if path == "ffmpeg":
-                        subprocess.run([path, "-version"], capture_output=True, check=True)
-                        ffmpeg_path = path
-                        break
-                    elif os.path.exists(path):
-                        subprocess.run([path, "-version"], capture_output=True, check=True)
-                        ffmpeg_path = path
-                        break
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
-            
-            if ffmpeg_path:
-                logger.info(f"FFmpeg trouvé: {ffmpeg_path}")
-                # Configurer Whisper pour utiliser le chemin FFmpeg
-                import whisper.audio
-                whisper.audio.ffmpeg_path = ffmpeg_path
-                
-                # Ajouter le répertoire FFmpeg au PATH
-                ffmpeg_dir = os.path.dirname(ffmpeg_path)
-                if ffmpeg_dir not in os.environ.get('PATH', ''):
-                    os.environ['PATH'] = ffmpeg_dir + os.pathsep + os.environ.get('PATH', '')
-                    logger.info(f"Répertoire FFmpeg ajouté au PATH: {ffmpeg_dir}")
+            self.backend.prepare(get_ffmpeg_path())
+            logger.info(f"Lecture de l'audio par blocs: {input_path}")
+            windows = stream_windows(stream_audio(input_path), window_seconds)
+        else:
+            if isinstance(input_path, np.ndarray):
+                audio = input_path
             else:
-                logger.warning("FFmpeg non trouvé, Whisper utilisera sa configuration par défaut")
+                if not os.path.exists(input_path):
+                    raise FileNotFoundError(f"Fichier non trouvé: {input_path}")
+                self.backend.prepare(get_ffmpeg_path())
+                audio = load_audio(input_path, use_cache=self.use_audio_cache)
             
-            # Options de transcription de base
-            options = {
-                "task": task,
-                "verbose": False,
-                "fp16": False
-            }
+            options = self._resolve_language(
+                options, audio, None if isinstance(input_path, np.ndarray) else input_path
+            )
+            
+            if self.use_vad:
+                audio, mapping = self._apply_vad(audio)
+            windows = ((start, audio[start:end]) for start, end in split_audio(audio, window_seconds))
+        
+        # Le contexte est transmis d'une fenêtre à l'autre par le prompt initial
+        condition_on_previous_text = options.get("condition_on_previous_text", True)
+        prompt = options.pop("initial_prompt", None)
+        
+        segment_id = 0
+        for start, window in windows:
+            window = np.ascontiguousarray(window, dtype=np.float32)
+            
+            window_mapping = None
+            if streamed:
+                # Sans l'audio complet : langue et VAD évaluées fenêtre par fenêtre
+                options = self._resolve_language(options, window)
+                if self.use_vad:
+                    window, window_mapping = self._apply_vad(window)
+                    if len(window_mapping) == 0:
+                        continue
+            
+            with profile_stage("inference"):
+                result = self.backend.transcribe_window(self.model, window, initial_prompt=prompt, **options)
+            
+            # Langue détectée une seule fois, puis imposée aux fenêtres suivantes
+            if "language" not in options and result.get("language"):
+                options["language"] = result["language"]
+            
+            if window_mapping is not None:
+                result = remap_result(result, window_mapping)
+            result = stitch_results([result], [start / SAMPLE_RATE])
+            if mapping is not None:
+                result = remap_result(result, mapping)
+            
+            for segment in result["segments"]:
+                segment["id"] = segment_id
+                segment_id += 1
+                yield segment
+            
+            if condition_on_previous_text:
+                prompt = result["text"][-200:] or prompt
+    
+    def open_writer(
+        self,
+        output_format: str,
+        output_path: str,
+        input_path: Optional[str] = None,
+        flush: bool = True
+    ):
+        """
+        Ouvre un writer incrémental (srt, vtt, txt).
+        
+        Args:
+            output_format: Format de sortie
+            output_path: Chemin de sortie
+            input_path: Chemin du fichier vidéo source (pour le TXT de diffusion)
+            flush: Vider le tampon après chaque segment
             
-            # Ajouter les options avancées si fournies
-            if kwargs:
-                options.update(kwargs)
-                logger.info(f"Options avancées utilisées: {kwargs}")
+        Returns:
+            Writer avec write(segment) et close()
+        """
+        if output_format not in WRITERS:
+            raise ValueError(f"Format non supporté pour l'écriture incrémentale: {output_format}")
+        if output_format == "txt":
+            return BroadcastTXTWriter(self, output_path, input_path, flush=flush)
+        return WRITERS[output_format](self, output_path, flush=flush)
+    
+    def save_stream(
+        self,
+        segments: Iterable[Dict[str, Any]],
+        outputs: Dict[str, str],
+        input_path: Optional[str] = None
+    ) -> int:
+        """
+        Écrit un flux de segments dans plusieurs fichiers au fur et à mesure.
+        
+        Args:
+            segments: Segments (par exemple issus de transcribe_iter)
+            outputs: Dictionnaire format -> chemin de sortie (srt, vtt, txt)
+            input_path: Chemin du fichier vidéo source (pour le TXT de diffusion)
             
-            if language:
-                options["language"] = language
+        Returns:
+            Nombre de segments écrits
+        """
+        writers = []
+        try:
+            for output_format, output_path in outputs.items():
+                logger.info(f"Écriture incrémentale {output_format.upper()}: {output_path}")
+                writers.append(self.open_writer(output_format, output_path, input_path))
+            
+            count = 0
+            for segment in segments:
+                for writer in writers:
+                    writer.write(segment)
+                count += 1
+            return count
+        finally:
+            for writer in writers:
+                writer.close()
+    
+    @profiled("vad")
+    def _apply_vad(self, audio: np.ndarray):
+        """
+        Réduit le signal à ses zones de parole.
+        
+        Args:
+            audio: Signal audio mono 16 kHz
             
-            # Transcription
-            result = self.model.transcribe(input_path, **options)
+        Returns:
+            Tuple (signal compact, table de correspondance des horodatages)
+        """
+        regions = detect_speech_regions(audio)
+        self.last_vad_report = speech_report(regions, get_audio_duration(audio))
+        logger.info(
+            f"VAD: {self.last_vad_report['speech']:.1f}s de parole sur {self.last_vad_report['total']:.1f}s "
+            f"({self.last_vad_report['skipped_ratio']:.0%} ignoré, {len(regions)} zones)"
+        )
+        return extract_speech(audio, regions)
+    
+    @profiled("language.detect")
+    def detect_language(self, input_path: Union[str, np.ndarray], source: Optional[str] = None) -> str:
+        """
+        Détecte la langue sur quelques fenêtres de 30 secondes riches en parole.
+        
+        Le modèle utilisé est language_model (ou le modèle principal à défaut) ;
+        le résultat est mis en cache par fichier.
+        
+        Args:
+            input_path: Chemin du fichier d'entrée ou signal audio 16 kHz
+            source: Fichier d'origine du signal (clé du cache de langue)
             
-            logger.info("Transcription terminée avec succès")
+        Returns:
+            Code de la langue détectée (ex: "fr")
+        """
+        if isinstance(input_path, np.ndarray):
+            audio = input_path
+        else:
+            if not os.path.exists(input_path):
+                raise FileNotFoundError(f"Fichier non trouvé: {input_path}")
+            self.backend.prepare(get_ffmpeg_path())
+            audio = load_audio(input_path, use_cache=self.use_audio_cache)
+            source = input_path
+        
+        model_name = self.language_model or self.model_name
+        if model_name == self.model_name:
+            model = self.model
+        else:
+            model = self._get_registry_model(model_name)
+        
+        if self.backend.name != DEFAULT_BACKEND:
+            model_name = f"{model_name}:{self.backend.name}"
+        self.last_language_detection = run_language_detection(
+            model, audio, model_name, content_hash(source) if source else None, backend=self.backend
+        )
+        return self.last_language_detection["language"]
+    
+    def _resolve_language(
+        self,
+        options: Dict[str, Any],
+        audio: np.ndarray,
+        source: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fixe la langue avec le modèle de détection si elle n'est pas fournie.
+        
+        Args:
+            options: Options de transcription
+            audio: Signal audio mono 16 kHz
+            source: Fichier d'origine du signal
+            
+        Returns:
+            Options avec la langue (copie), ou les options inchangées
+        """
+        if options.get("language") or not self.language_model:
+            return options
+        return {**options, "language": self.detect_language(audio, source)}
+    
+    def _cache_params(self) -> Dict[str, Any]:
+        """Paramètres du gestionnaire qui influencent le résultat (pour la clé de cache)."""
+        params = {"vad": self.use_vad}
+        if self.language_model:
+            params["language_model"] = self.language_model
+        if self.quantize:
+            params["quantize"] = self.quantize
+        if self.backend.name != DEFAULT_BACKEND:
+            params["backend"] = self.backend.name
+        return params
+    
+    @profiled("cache.lookup")
+    def _lookup_result_cache(self, input_path: str, options: Dict[str, Any]):
+        """
+        Cherche un résultat déjà calculé pour ce fichier et ces options.
+        
+        Args:
+            input_path: Chemin du fichier d'entrée
+            options: Options complètes de transcription
+            
+        Returns:
+            Tuple (clé de cache ou None, résultat en cache ou None)
+        """
+        if self.result_cache is None:
+            return None, None
+        
+        cache_key = make_cache_key(content_hash(input_path), self.model_name, {**options, **self._cache_params()})
+        if self.refresh_cache:
+            return cache_key, None
+        
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Résultat de transcription chargé depuis le cache")
+        return cache_key, cached
+    
+    def transcribe_chunked(
+        self,
+        input_path: Union[str, np.ndarray],
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        chunk_minutes: float = 10.0,
+        workers: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Transcrit en parallèle des morceaux découpés sur les silences.
+        
+        Le résultat a le même format que celui de transcribe() et peut être
+        passé tel quel aux méthodes save_*.
+        
+        Args:
+            input_path: Chemin vers le fichier d'entrée (ou signal audio 16 kHz)
+            language: Langue du contenu (auto-détection si None)
+            task: Type de tâche (transcribe ou translate)
+            chunk_minutes: Durée cible d'un morceau en minutes
+            workers: Nombre de processus (un modèle par processus)
+            **kwargs: Options de décodage transmises à Whisper
+            
+        Returns:
+            Résultat de la transcription
+        """
+        try:
+            cache_key = None
+            if isinstance(input_path, np.ndarray):
+                audio = input_path
+            else:
+                if not os.path.exists(input_path):
+                    raise FileNotFoundError(f"Fichier non trouvé: {input_path}")
+                
+                options = {"task": task, "language": language, "chunk_minutes": chunk_minutes, **kwargs}
+                cache_key, cached = self._lookup_result_cache(input_path, options)
+                if cached is not None:
+                    return cached
+                
+                self.backend.prepare(get_ffmpeg_path())
+                audio = load_audio(input_path, use_cache=self.use_audio_cache)
+            
+            # Langue détectée une seule fois plutôt que dans chaque morceau
+            if not language and self.language_model:
+                language = self.detect_language(audio, None if isinstance(input_path, np.ndarray) else input_path)
+            
+            duration = get_audio_duration(audio)
+            logger.info(f"Transcription par morceaux de {chunk_minutes:g} min ({duration:.1f}s d'audio)")
+            
+            start = time.perf_counter()
+            with profile_stage("inference.chunked"):
+                result = transcribe_in_chunks(
+                    audio, self.model_name, self.device,
+                    language=language, task=task,
+                    chunk_minutes=chunk_minutes, workers=workers,
+                    use_vad=self.use_vad,
+                    quantize=self.quantize,
+                    backend=self.backend.name,
+                    num_threads=self.num_threads,
+                    cpu_affinity=self.cpu_affinity,
+                    **kwargs
+                )
+            elapsed = time.perf_counter() - start
+            if duration:
+                logger.info(f"Transcription par morceaux terminée en {elapsed:.1f}s (facteur temps réel: {elapsed / duration:.2f})")
+            
+            if cache_key is not None:
+                self.result_cache.put(cache_key, result)
             return result
             
         except Exception as e:
-            logger.error(f"Erreur lors de la transcription: {e}")
+            logger.error(f"Erreur lors de la transcription par morceaux: {e}")
             raise
     
-    def save_srt(self, result: Dict[str, Any], output_path: str) -> None:
+    def transcribe_cascade(
+        self,
+        input_path: Union[str, np.ndarray],
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        draft_model: str = "tiny",
+        thresholds: Optional[Dict[str, float]] = None,
+        padding: float = 0.5,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Transcrit avec un petit modèle, puis reprend les segments peu fiables avec ce modèle.
+        
+        Args:
+            input_path: Chemin vers le fichier d'entrée (ou signal audio 16 kHz)
+            language: Langue du contenu (auto-détection si None)
+            task: Type de tâche (transcribe ou translate)
+            draft_model: Modèle rapide utilisé pour le brouillon
+            thresholds: Seuils de confiance (logprob_threshold, compression_ratio_threshold, no_speech_threshold)
+            padding: Marge (secondes) autour des plages retranscrites
+            **kwargs: Options de décodage transmises à Whisper
+            
+        Returns:
+            Résultat de la transcription (même format que transcribe())
+        """
+        try:
+            options = self._build_options(language, task, kwargs)
+            cascade_options = {
+                **options,
+                "cascade": {"draft_model": draft_model, "thresholds": thresholds, "padding": padding}
+            }
+            prepared = self._prepare_input(input_path, cascade_options)
+            if prepared["cached"] is not None:
+                return prepared["cached"]
+            
+            audio = prepared["audio"]
+            total_duration = get_audio_duration(audio)
+            options = self._resolve_language(options, audio, prepared["source"])
+            
+            # 1. Brouillon complet avec le petit modèle (partagé via le registre)
+            logger.info(f"Cascade: brouillon avec le modèle {draft_model}")
+            drafter = WhisperHandler(
+                model_name=draft_model, device=self.device, use_vad=self.use_vad, quantize=self.quantize,
+                backend=self.backend
+            )
+            with profile_stage("inference.draft"):
+                draft = drafter._run_inference({**prepared, "cache_key": None}, options)
+            
+            # 2. Sélection des segments peu fiables
+            segments = draft.get("segments", [])
+            flagged = find_low_confidence(segments, thresholds)
+            ranges = plan_ranges(segments, flagged, total_duration, padding)
+            
+            # 3. Reprise des plages avec ce modèle, langue fixée par le brouillon
+            final_options = dict(options)
+            if draft.get("language") and "language" not in final_options:
+                final_options["language"] = draft["language"]
+            
+            replacements = []
+            for _, _, start, end in ranges:
+                window = np.ascontiguousarray(
+                    audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)], dtype=np.float32
+                )
+                with profile_stage("inference"):
+                    partial = self.backend.transcribe_window(self.model, window, **final_options)
+                replacements.append(stitch_results([partial], [start])["segments"])
+            
+            merged = splice(segments, ranges, replacements)
+            result = {
+                "text": "".join(segment.get("text", "") for segment in merged),
+                "segments": merged,
+                "language": final_options.get("language", draft.get("language")),
+            }
+            
+            self.last_cascade_report = cascade_report(ranges, flagged, total_duration, draft_model, self.model_name)
+            logger.info(
+                f"Cascade: {self.last_cascade_report['flagged_segments']}/{self.last_cascade_report['segments']} segments repris, "
+                f"{self.last_cascade_report['retranscribed']:.1f}s sur {total_duration:.1f}s "
+                f"({self.last_cascade_report['retranscribed_ratio']:.0%}) avec le modèle {self.model_name}"
+            )
+            
+            if prepared["cache_key"] is not None:
+                self.result_cache.put(prepared["cache_key"], result)
+            return result
+            
+        except Exception as e:
+            logger.error(f"Erreur lors de la transcription en cascade: {e}")
+            raise
+    
+    @profiled("save.srt")
+    def save_srt(self, result: Union[Dict[str, Any], SegmentTable], output_path: str) -> None:
         """
         Sauvegarde le résultat au format SRT.
         
         Args:
-            result: Résultat de la transcription
+            result: Résultat de la transcription (dictionnaire ou SegmentTable)
             output_path: Chemin de sortie
         """
         try:
             logger.info(f"Sauvegarde SRT: {output_path}")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for i, segment in enumerate(result["segments"], 1):
-                    start_time = self._format_timestamp(segment["start"])
-                    end_time = self._format_timestamp(segment["end"])
-                    text = segment["text"].strip()
-                    
-                    f.write(f"{i}\n")
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
+            with SRTWriter(self, output_path, flush=False) as writer:
+                if isinstance(result, SegmentTable):
+                    writer.write_table(result)
+                else:
+                    writer.write_all(result["segments"])
             
             logger.info("Fichier SRT sauvegardé avec succès")
             
@@ -230,27 +828,23 @@ class WhisperHandler:
             logger.error(f"Erreur lors de la sauvegarde SRT: {e}")
             raise
     
-    def save_vtt(self, result: Dict[str, Any], output_path: str) -> None:
+    @profiled("save.vtt")
+    def save_vtt(self, result: Union[Dict[str, Any], SegmentTable], output_path: str) -> None:
         """
         Sauvegarde le résultat au format VTT.
         
         Args:
-            result: Résultat de la transcription
+            result: Résultat de la transcription (dictionnaire ou SegmentTable)
             output_path: Chemin de sortie
         """
         try:
             logger.info(f"Sauvegarde VTT: {output_path}")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("WEBVTT\n\n")
-                
-                for i, segment in enumerate(result["segments"], 1):
-                    start_time = self._format_timestamp_vtt(segment["start"])
-                    end_time = self._format_timestamp_vtt(segment["end"])
-                    text = segment["text"].strip()
-                    
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
+            with VTTWriter(self, output_path, flush=False) as writer:
+                if isinstance(result, SegmentTable):
+                    writer.write_table(result)
+                else:
+                    writer.write_all(result["segments"])
             
             logger.info("Fichier VTT sauvegardé avec succès")
             
@@ -258,93 +852,22 @@ class WhisperHandler:
             logger.error(f"Erreur lors de la sauvegarde VTT: {e}")
             raise
     
-    def save_txt(self, result: Dict[str, Any], output_path: str, input_path: str = None) -> None:
+    @profiled("save.txt")
+    def save_txt(self, result: Union[Dict[str, Any], SegmentTable], output_path: str, input_path: str = None) -> None:
         """
         Sauvegarde le résultat au format TXT pour diffusion professionnelle.
         
         Args:
-            result: Résultat de la transcription
+            result: Résultat de la transcription (dictionnaire ou SegmentTable)
             output_path: Chemin de sortie
             input_path: Chemin du fichier vidéo source (pour timecodes LTC)
         """
         try:
             logger.info(f"Sauvegarde TXT pour diffusion professionnelle: {output_path}")
             
-            # Récupérer les timecodes LTC du fichier vidéo
-            ltc_start = None
-            if input_path:
-                ltc_start = self._get_ltc_timecode(input_path)
-            
-            # Codes de diffusion
-            codes = self._get_broadcast_codes()
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                # En-tête du fichier de diffusion
-                f.write("'**************************************************\n\n")
-                f.write("\\ Title: " + os.path.basename(output_path) + "\n\n")
-                f.write("\\ Version: 1.0\n")
-                f.write("\\ Channel: F1C1\n")
-                f.write("\\ Rate: 30d\n")
-                f.write("\\ Type: LTC\n\n")
-                f.write("\\ Generated By: JJ Caption\n")
-                f.write("\\ CaptionFile: " + output_path + "\n")
-                f.write("\\ MediaFile: " + (input_path or "Unknown") + "\n\n")
-                f.write("\\ Author: JJ Caption\n")
-                f.write("\\ Owner: \n\n")
-                f.write("\\ Date: " + self._get_current_date() + "\n")
-                f.write("\\ Time: " + self._get_current_time() + "\n\n")
-                f.write("'**************************************************\n\n\n")
-                
-                # Timecode de départ avec format professionnel
-                if ltc_start:
-                    # Ajuster le timecode de départ
-                    adjusted_start = self._adjust_start_time(ltc_start)
-                    f.write("\\ TC:  " + adjusted_start + " " + codes["clear"] + "\n")
-                else:
-                    # Timecode par défaut
-                    f.write("\\ TC:  10:00:00;00 " + codes["clear"] + "\n")
-                
-                # Segments avec timecodes LTC et segmentation professionnelle
-                for i, segment in enumerate(result["segments"]):
-                    start_time = segment["start"]
-                    text = segment["text"].strip()
-                    
-                    # Convertir le temps en timecode LTC avec ajustement
-                    if ltc_start:
-                        adjusted_start = self._adjust_start_time(ltc_start)
-                        ltc_time = self._convert_to_ltc(start_time, adjusted_start)
-                    else:
-                        ltc_time = self._format_timestamp_ltc(start_time)
-                    
-                    # Segmenter le texte pour la diffusion
-                    text_segments = self._segment_text_for_broadcast(text)
-                    
-                    # Écrire chaque segment de texte
-                    for j, text_segment in enumerate(text_segments):
-                        if j == 0:
-                            # Premier segment du segment original
-                            f.write("\\ TC:  " + ltc_time + " " + codes["text_start"] + text_segment + codes["text_end"] + "\n")
-                        else:
-                            # Segments suivants (ajouter un petit délai)
-                            next_time = start_time + (j * 0.5)  # 0.5 seconde entre segments
-                            if ltc_start:
-                                adjusted_start = self._adjust_start_time(ltc_start)
-                                next_ltc_time = self._convert_to_ltc(next_time, adjusted_start)
-                            else:
-                                next_ltc_time = self._format_timestamp_ltc(next_time)
-                            f.write("\\ TC:  " + next_ltc_time + " " + codes["text_start"] + text_segment + codes["text_end"] + "\n")
-                    
-                    # Ajouter une pause entre les segments principaux
-                    if i < len(result["segments"]) - 1:
-                        next_segment_start = result["segments"][i + 1]["start"]
-                        if next_segment_start - start_time > 2.0:  # Pause de plus de 2 secondes
-                            pause_time = start_time + 1.0
-                            if ltc_start:
-                                adjusted_start = self._adjust_start_time(ltc_start)
-                                pause_ltc_time = self._convert_to_ltc(pause_time, adjusted_start)
-                            else:
-                                pause_ltc_time = self._format_timestamp_ltc(pause_time)
-                            f.write("\\ TC:  " + pause_ltc_time + " " + codes["clear"] + "\n")
+            # Timecodes calculés par blocs depuis les colonnes start
+            with BroadcastTXTWriter(self, output_path, input_path, flush=False) as writer:
+                writer.write_table(SegmentTable.from_result(result))
             
             logger.info("Fichier TXT pour diffusion professionnelle sauvegardé avec succès")
             
@@ -352,18 +875,21 @@ class WhisperHandler:
             logger.error(f"Erreur lors de la sauvegarde TXT: {e}")
             raise
     
-    def save_json(self, result: Dict[str, Any], output_path: str) -> None:
+    @profiled("save.json")
+    def save_json(self, result: Union[Dict[str, Any], SegmentTable], output_path: str) -> None:
         """
         Sauvegarde le résultat au format JSON.
         
         Args:
-            result: Résultat de la transcription
+            result: Résultat de la transcription (dictionnaire ou SegmentTable)
             output_path: Chemin de sortie
         """
         try:
             logger.info(f"Sauvegarde JSON: {output_path}")
             
             import json
+            if isinstance(result, SegmentTable):
+                result = result.to_result()
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(result, f, ensure_ascii=False, indent=2)
             
@@ -426,9 +952,13 @@ class WhisperHandler:
         return {
             "name": self.model_name,
             "device": self.device,
+            "backend": self.backend.name,
+            "quantize": self.quantize,
+            "loaded": self.is_model_loaded,
             "available_models": self.get_available_models()
         }
     
+    @profiled("media.ltc")
     def _get_ltc_timecode(self, video_path: str) -> Optional[str]:
         """
         Récupère le timecode LTC du fichier vidéo.
@@ -439,141 +969,70 @@ class WhisperHandler:
         Returns:
             Timecode LTC ou None si non trouvé
         """
-        try:
-            import subprocess
-            import json
-            
-            # Utiliser ffprobe pour récupérer les timecodes
-            ffprobe_path = None
-            possible_paths = [
-                "ffprobe",
-                r"C:\Program Files\ffmpeg\bin\ffprobe.exe",
-                os.path.expanduser(r"~\AppData\Local\Microsoft\WinGet\Packages\Gyan.FFmpeg_Microsoft.Winget.Source_8wekyb3d8bbwe\ffmpeg-7.1.1-full_build\bin\ffprobe.exe")
-            ]
-            
-            for path in possible_paths:
-                try:
-                    if path == "ffprobe":
-                        result = subprocess.run([path, "-v", "quiet", "-show_entries", "stream_tags=timecode", "-of", "json", video_path], 
-                                              capture_output=True, text=True, check=True)
-                        ffprobe_path = path
-                        break
-                    elif os.path.exists(path):
-                        result = subprocess.run([path, "-v", "quiet", "-show_entries", "stream_tags=timecode", "-of", "json", video_path], 
-                                              capture_output=True, text=True, check=True)
-                        ffprobe_path = path
-                        break
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
-            
-            if ffprobe_path and result.stdout:
-                data = json.loads(result.stdout)
-                # Chercher le timecode dans les streams ou le format
-                for stream in data.get("streams", []):
-                    if "tags" in stream and "timecode" in stream["tags"]:
-                        return stream["tags"]["timecode"]
-                
-                # Chercher dans les tags du format
-                if "format" in data and "tags" in data["format"] and "timecode" in data["format"]["tags"]:
-                    return data["format"]["tags"]["timecode"]
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Impossible de récupérer le timecode LTC: {e}")
+        # Les métadonnées (dont le timecode) proviennent d'une seule passe ffprobe mise en cache
+        info = probe_media(video_path)
+        if info is None:
+            logger.warning("Impossible de récupérer le timecode LTC")
             return None
+        return info.get("timecode")
     
-    def _convert_to_ltc(self, seconds: float, start_ltc: str) -> str:
+    def _convert_to_ltc(self, seconds: float, start_ltc: str, rate: Optional[FrameRate] = None) -> str:
         """
         Convertit un temps en secondes vers un timecode LTC.
         
         Args:
             seconds: Temps en secondes depuis le début
             start_ltc: Timecode LTC de départ (format HH:MM:SS;FF ou HH:MM:SS:FF)
+            rate: Cadence du timecode (défaut: 29.97 drop-frame)
             
         Returns:
-            Timecode LTC calculé
+            Timecode LTC calculé, à l'image près
         """
+        rate = rate or FrameRate.from_string(DEFAULT_RATE)
         try:
-            # Normaliser le format du timecode de départ
-            if ";" in start_ltc:
-                # Format HH:MM:SS;FF
-                parts = start_ltc.replace(";", ":").split(":")
-            else:
-                # Format HH:MM:SS:FF
-                parts = start_ltc.split(":")
-            
-            if len(parts) >= 3:
-                start_hours = int(parts[0])
-                start_minutes = int(parts[1])
-                start_seconds = int(parts[2])
-                
-                # Convertir en secondes totales
-                start_total_seconds = start_hours * 3600 + start_minutes * 60 + start_seconds
-                
-                # Ajouter le temps de la transcription
-                total_seconds = start_total_seconds + seconds
-                
-                # Convertir en timecode LTC
-                hours = int(total_seconds // 3600)
-                minutes = int((total_seconds % 3600) // 60)
-                secs = int(total_seconds % 60)
-                
-                # Format avec point-virgule comme dans l'original
-                return f"{hours:02d}:{minutes:02d};{secs:02d}"
-            else:
-                raise ValueError(f"Format de timecode invalide: {start_ltc}")
-            
-        except Exception as e:
+            return TimecodeFormatter(rate, start_ltc).format_one(seconds)
+        except ValueError as e:
             logger.warning(f"Erreur lors de la conversion LTC: {e}")
-            return self._format_timestamp_ltc(seconds)
+            return self._format_timestamp_ltc(seconds, rate)
     
-    def _adjust_start_time(self, start_ltc: str) -> str:
+    def _adjust_start_time(self, start_ltc: str, rate: Optional[FrameRate] = None) -> str:
         """
         Ajuste le timecode de départ pour correspondre au format professionnel.
         
         Args:
             start_ltc: Timecode LTC original
+            rate: Cadence du timecode (défaut: 29.97 drop-frame)
             
         Returns:
-            Timecode ajusté
+            Timecode ajusté (10:00:00 au plus tôt), normalisé pour la cadence
         """
+        rate = rate or FrameRate.from_string(DEFAULT_RATE)
+        program_start = parse_timecode(PROGRAM_START, rate)
         try:
             if not start_ltc:
-                return "10:00:00;00"  # Timecode par défaut
-            
-            # Si le timecode commence avant 10:00:00, l'ajuster
-            parts = start_ltc.split(":")
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = int(parts[2])
+                return frames_to_timecodes([program_start], rate)[0]  # Timecode par défaut
             
-            # Si c'est avant 10:00:00, ajuster à 10:00:00
-            if hours < 10 or (hours == 9 and minutes == 59):
-                return "10:00:00;00"
+            # Si le timecode commence avant 10:00:00, l'ajuster à 10:00:00
+            frames = parse_timecode(start_ltc, rate)
+            return frames_to_timecodes([max(frames, program_start)], rate)[0]
             
-            return start_ltc
-            
-        except Exception as e:
+        except ValueError as e:
             logger.warning(f"Erreur lors de l'ajustement du timecode: {e}")
-            return "10:00:00;00"
+            return frames_to_timecodes([program_start], rate)[0]
     
-    def _format_timestamp_ltc(self, seconds: float) -> str:
+    def _format_timestamp_ltc(self, seconds: float, rate: Optional[FrameRate] = None) -> str:
         """
-        Formate un timestamp en format LTC (HH:MM:SS).
+        Formate un timestamp en format LTC (HH:MM:SS;FF).
         
         Args:
             seconds: Temps en secondes
+            rate: Cadence du timecode (défaut: 29.97 drop-frame)
             
         Returns:
             Timestamp formaté LTC
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        
-        # Format avec point-virgule comme dans l'original
-        return f"{hours:02d}:{minutes:02d};{secs:02d}"
+        rate = rate or FrameRate.from_string(DEFAULT_RATE)
+        return frames_to_timecodes(seconds_to_frames([seconds], rate), rate)[0]
     
     def _get_broadcast_codes(self) -> Dict[str, str]:
         """
@@ -643,38 +1102,43 @@ class WhisperHandler:
         from datetime import datetime
         return datetime.now().strftime("%I:%M:%S %p")
     
-    def post_process_transcription(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    @profiled("post_process")
+    def post_process_transcription(
+        self,
+        result: Union[Dict[str, Any], SegmentTable]
+    ) -> Union[Dict[str, Any], SegmentTable]:
         """
         Applique un post-traitement pour améliorer la qualité de la transcription.
         
+        Les segments traversent la chaîne d'étapes en une seule passe. Une
+        SegmentTable est modifiée sur place ; les segments d'un dictionnaire
+        sont copiés, si bien que le résultat d'origine reste intact en cas
+        d'erreur.
+        
         Args:
-            result: Résultat de la transcription Whisper
+            result: Résultat de la transcription Whisper (dictionnaire ou SegmentTable)
             
         Returns:
-            Résultat post-traité
+            Résultat post-traité, du même type que result
         """
         try:
             logger.info("Application du post-traitement...")
             
-            # Copier le résultat pour ne pas modifier l'original
-            processed_result = result.copy()
-            segments = processed_result.get('segments', []).copy()
+            if isinstance(result, SegmentTable):
+                table = self.post_processor.run_table(result)
+                table.meta['text'] = ' '.join([text.strip() for text in table.text])
+                logger.info("Post-traitement terminé avec succès")
+                return table
             
-            # 1. Correction des erreurs communes
-            segments = self._correct_common_errors(segments)
-            
-            # 2. Amélioration de la ponctuation
-            segments = self._improve_punctuation(segments)
-            
-            # 3. Fusion des segments trop courts
-            segments = self._merge_short_segments(segments)
-            
-            # 4. Correction du contexte
-            segments = self._improve_context(segments)
+            # Copie des segments : les étapes les modifient sur place
+            segments = self.post_processor.run([dict(segment) for segment in result.get('segments', [])])
             
             # Mettre à jour le résultat
-            processed_result['segments'] = segments
-            processed_result['text'] = ' '.join([seg.get('text', '').strip() for seg in segments])
+            processed_result = {
+                **result,
+                'segments': segments,
+                'text': ' '.join([seg.get('text', '').strip() for seg in segments])
+            }
             
             logger.info("Post-traitement terminé avec succès")
             return processed_result
@@ -683,153 +1147,34 @@ class WhisperHandler:
             logger.error(f"Erreur lors du post-traitement: {e}")
             return result  # Retourner l'original en cas d'erreur
     
-    def _correct_common_errors(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Corrige les erreurs communes de transcription."""
-        corrections = {
-            # Erreurs de transcription françaises communes
-            "awe vi": "au revoir",
-            "brigette": "Brigitte",
-            "j'en amie": "Jean-Mi",
-            "ma tête": "matin",
-            "racker": "raquer",
-            "t'as barouette": "tabarouette",
-            "colombe": "Colombie",
-            "sèillés": "séries",
-            "singlé": "cinglées",
-            "vivrent": "vivre un",
-            "entraînement": "entre amis",
-            "coïnce": "convalescence",
-            "convallé sens": "convalescence",
-            "hébrigette": "Brigitte",
-            "boquillard": "Boquilla",
-            "pirelles": "pirogues",
-            "paix": "pêche",
-            "maix": "mer",
-            "t'explique": "typique",
-            "entriez": "intriguez",
-            "gure": "prêt",
-            "joviterrement": "majoritairement",
-            "afro-colorbienne": "afro-colombienne",
-            "haute haute": "communautaire",
-            "vitra-ditionnel": "vie traditionnel",
-            "génère": "génère",
-            "ancestral": "ancestrales",
-            "Ronnaie": "Rony",
-            "attuyer": "capturer",
-            "crabeurs": "crabes",
-            "parles": "paroles",
-            "médé brûlée": "méditation",
-            "vacimmants": "investissements",
-            "balkille": "Boquilla",
-            "plache": "plage",
-            "gentrification": "gentrification",
-            "élégion": "population",
-            "capaixeur": "capable",
-            "décès d'érestir": "défis d'exister",
-            "blessier": "plaisir",
-            "page": "pêche",
-            "lycier": "pêche",
-            "main grave": "mangrove",
-            "pêcher les": "pêcher des",
-            "Réder": "Rony",
-            "salez traille": "sale travail",
-            "soquies": "soucis",
-            "contre": "compte",
-            "grand-t-blom": "grand problème",
-            "égrés": "égratignures",
-            "commun": "commun",
-            "matre": "matière",
-            "mélange": "mélange"
-        }
+    def post_process_stream(self, segments: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Post-traite un flux de segments au fur et à mesure (ex: sortie de transcribe_iter).
         
-        for segment in segments:
-            text = segment.get('text', '')
-            original_text = text
-            
-            # Appliquer les corrections
-            for error, correction in corrections.items():
-                text = text.replace(error, correction)
+        Args:
+            segments: Segments au format Whisper
             
-            # Mettre à jour le segment si des corrections ont été appliquées
-            if text != original_text:
-                segment['text'] = text
-                logger.debug(f"Correction: '{original_text}' -> '{text}'")
-        
-        return segments
+        Yields:
+            Segments post-traités
+        """
+        return self.post_processor.process(segments)
     
+    @profiled("post_process.correct_errors")
+    def _correct_common_errors(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Corrige les erreurs communes de transcription (mots entiers, une passe par segment)."""
+        return self.corrections.correct_segments(segments)
+    
+    @profiled("post_process.punctuation")
     def _improve_punctuation(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Améliore la ponctuation."""
-        for segment in segments:
-            text = segment.get('text', '').strip()
-            
-            # Ajouter des points d'interrogation pour les questions
-            if any(word in text.lower() for word in ['quoi', 'comment', 'pourquoi', 'quand', 'où', 'qui', 'combien']):
-                if not text.endswith('?'):
-                    text += '?'
-            
-            # Ajouter des points d'exclamation pour les exclamations
-            if any(word in text.lower() for word in ['oh', 'ah', 'wow', 'super', 'génial', 'parfait']):
-                if not text.endswith('!'):
-                    text += '!'
-            
-            # Capitaliser le début des phrases
-            if text and not text[0].isupper():
-                text = text[0].upper() + text[1:]
-            
-            segment['text'] = text
-        
-        return segments
+        return list(improve_punctuation(segments))
     
+    @profiled("post_process.merge_short")
     def _merge_short_segments(self, segments: List[Dict[str, Any]], min_duration: float = 1.0) -> List[Dict[str, Any]]:
         """Fusionne les segments trop courts."""
-        if not segments:
-            return segments
-        
-        merged_segments = []
-        current_segment = segments[0].copy()
-        
-        for i in range(1, len(segments)):
-            segment = segments[i]
-            current_duration = current_segment.get('end', 0) - current_segment.get('start', 0)
-            
-            # Si le segment actuel est trop court, le fusionner avec le suivant
-            if current_duration < min_duration:
-                current_text = current_segment.get('text', '').strip()
-                next_text = segment.get('text', '').strip()
-                
-                # Fusionner les textes
-                if current_text and next_text:
-                    current_segment['text'] = current_text + ' ' + next_text
-                elif next_text:
-                    current_segment['text'] = next_text
-                
-                # Mettre à jour la fin
-                current_segment['end'] = segment.get('end', current_segment.get('end', 0))
-            else:
-                # Le segment actuel est assez long, l'ajouter et passer au suivant
-                merged_segments.append(current_segment)
-                current_segment = segment.copy()
-        
-        # Ajouter le dernier segment
-        merged_segments.append(current_segment)
-        
-        return merged_segments
+        return list(merge_short_segments(segments, min_duration))
     
+    @profiled("post_process.context")
     def _improve_context(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Améliore le contexte en utilisant les segments précédents."""
-        for i in range(1, len(segments)):
-            current_segment = segments[i]
-            previous_segment = segments[i-1]
-            
-            current_text = current_segment.get('text', '').strip()
-            previous_text = previous_segment.get('text', '').strip()
-            
-            # Si le segment actuel commence par une minuscule et le précédent ne se termine pas par un point
-            if (current_text and current_text[0].islower() and 
-                previous_text and not previous_text.endswith('.') and 
-                not previous_text.endswith('!') and not previous_text.endswith('?')):
-                
-                # C'est probablement une continuation de phrase
-                current_segment['text'] = current_text[0].lower() + current_text[1:]
-        
-        return segments 
\ No newline at end of file
+        return list(improve_context(segments)) 
\ No newline at end of file
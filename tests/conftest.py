@@ -0,0 +1,13 @@
+"""
+Configuration commune des tests JJ Caption.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules du projet (main.py) et du paquet src importables depuis les tests
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,70 @@
+"""
+Tests des moteurs d'inférence.
+"""
+
+import stat
+import sys
+import textwrap
+
+import pytest
+
+from transcription.backends import FakeBackend, InferenceBackend, get_backend
+from transcription.ffmpeg_tools import reset_tool_cache
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """Exécutable ffmpeg de substitution : écrit 5 secondes de PCM 16 bits sur la sortie standard."""
+    script = tmp_path / "ffmpeg"
+    script.write_text(textwrap.dedent(f"""\
+        #!{sys.executable}
+        import sys
+        import numpy as np
+        t = np.arange(16000 * 5) / 16000
+        sys.stdout.buffer.write((np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16).tobytes())
+    """))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("JJ_CAPTION_FFMPEG", str(script))
+    monkeypatch.setenv("JJ_CAPTION_CACHE_DIR", str(tmp_path / "cache"))
+    reset_tool_cache()
+    yield str(script)
+    reset_tool_cache()
+
+
+@pytest.mark.unit
+class TestBackends:
+    """Registre et interface des moteurs."""
+
+    def test_get_backend(self):
+        """Les moteurs sont créés par leur nom."""
+        assert isinstance(get_backend("fake"), FakeBackend)
+        with pytest.raises(ValueError):
+            get_backend("inconnu")
+
+    def test_prepare_is_noop_by_default(self, monkeypatch):
+        """La préparation par défaut n'importe pas Whisper."""
+        monkeypatch.setitem(sys.modules, "whisper", None)
+        monkeypatch.setitem(sys.modules, "whisper.audio", None)
+        InferenceBackend().prepare("/usr/bin/ffmpeg")
+        FakeBackend().prepare("/usr/bin/ffmpeg")
+
+
+@pytest.mark.cli
+def test_fake_backend_runs_without_whisper(tmp_path, monkeypatch, fake_ffmpeg):
+    """--backend fake traite un fichier complet sans que Whisper soit installé."""
+    # Un module à None fait échouer toute tentative d'import
+    monkeypatch.setitem(sys.modules, "whisper", None)
+    monkeypatch.setitem(sys.modules, "whisper.audio", None)
+    import main
+
+    media = tmp_path / "extrait.wav"
+    media.write_bytes(b"RIFF")
+    args = main.build_parser().parse_args([
+        str(media), "--backend", "fake", "--language", "French",
+        "--output", "srt", "--output-dir", str(tmp_path), "--no-cache"
+    ])
+    main.run(args)
+
+    srt = tmp_path / "extrait.srt"
+    assert srt.exists()
+    assert "-->" in srt.read_text(encoding="utf-8")
@@ -0,0 +1,129 @@
+"""
+Tests du dictionnaire de corrections compilé.
+"""
+
+import json
+import os
+
+import pytest
+
+from transcription.corrections import (
+    DEFAULT_CORRECTIONS,
+    CorrectionEngine,
+    get_correction_engine,
+    load_corrections,
+)
+
+
+@pytest.mark.unit
+class TestCorrectionEngine:
+    """Remplacements en une seule passe."""
+
+    def test_whole_words_only(self):
+        """Seuls les mots entiers sont corrigés : "page" ne modifie pas "pages"."""
+        engine = CorrectionEngine({"page": "pêche"})
+        assert engine.apply("la page") == "la pêche"
+        assert engine.apply("les pages") == "les pages"
+        assert engine.apply("rampage") == "rampage"
+        assert engine.apply("page, page.") == "pêche, pêche."
+
+    def test_longest_match_wins(self):
+        """L'entrée la plus longue l'emporte sur son suffixe ou son préfixe."""
+        engine = CorrectionEngine({"brigette": "Brigitte", "hébrigette": "Brigitte", "convallé": "X", "convallé sens": "convalescence"})
+        assert engine.apply("hébrigette arrive") == "Brigitte arrive"
+        assert engine.apply("brigette arrive") == "Brigitte arrive"
+        assert engine.apply("en convallé sens") == "en convalescence"
+        assert engine.apply("en convallé") == "en X"
+
+    def test_single_pass(self):
+        """Une correction n'est pas elle-même corrigée par une autre entrée."""
+        engine = CorrectionEngine({"paix": "pêche", "pêche": "pêcheur"})
+        assert engine.apply("paix pêche") == "pêche pêcheur"
+
+    def test_identity_entries_dropped(self):
+        """Les entrées erreur == correction (ou vides) sont ignorées."""
+        engine = CorrectionEngine({"mer": "mer", "": "vide", "maix": "mer"})
+        assert engine.corrections == {"maix": "mer"}
+        assert len(engine) == 1
+        assert len(CorrectionEngine({"mer": "mer"})) == 0
+        assert CorrectionEngine({"mer": "mer"}).apply("la mer") == "la mer"
+
+    def test_correct_segments(self):
+        """Les segments sont corrigés sur place et les autres champs conservés."""
+        segments = [{"start": 0.0, "end": 1.0, "text": " la page"}, {"start": 1.0, "end": 2.0, "text": " rien"}]
+        corrected = CorrectionEngine(DEFAULT_CORRECTIONS).correct_segments(segments)
+        assert [segment["text"] for segment in corrected] == [" la pêche", " rien"]
+        assert corrected[0] is segments[0]
+        assert corrected[0]["end"] == 1.0
+
+
+@pytest.mark.unit
+class TestLoadCorrections:
+    """Lecture des dictionnaires propres à une émission."""
+
+    def test_text_format(self, tmp_path):
+        """Format texte : une entrée par ligne, commentaires et lignes vides ignorés."""
+        path = tmp_path / "emission.txt"
+        path.write_text("# Émission du matin\n\nbrigite => Brigitte\n  la bas =>  là-bas \n", encoding="utf-8")
+        assert load_corrections(str(path)) == {"brigite": "Brigitte", "la bas": "là-bas"}
+
+    def test_text_format_invalid_line(self, tmp_path):
+        """Une ligne sans "=>" est refusée avec son numéro."""
+        path = tmp_path / "emission.txt"
+        path.write_text("brigite => Brigitte\nbrigite Brigitte\n", encoding="utf-8")
+        with pytest.raises(ValueError, match=":2"):
+            load_corrections(str(path))
+
+    def test_json_format(self, tmp_path):
+        """Format JSON : objet erreur -> correction."""
+        path = tmp_path / "emission.json"
+        path.write_text(json.dumps({"brigite": "Brigitte", "page": "plage"}), encoding="utf-8")
+        assert load_corrections(str(path)) == {"brigite": "Brigitte", "page": "plage"}
+
+    def test_json_format_invalid(self, tmp_path):
+        """Un JSON qui n'est pas un objet est refusé."""
+        path = tmp_path / "emission.json"
+        path.write_text(json.dumps(["brigite", "Brigitte"]), encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_corrections(str(path))
+
+
+@pytest.mark.unit
+class TestGetCorrectionEngine:
+    """Cache des dictionnaires compilés."""
+
+    def test_defaults_shared(self):
+        """Le dictionnaire par défaut n'est compilé qu'une fois."""
+        assert get_correction_engine() is get_correction_engine()
+        assert len(get_correction_engine(include_defaults=False)) == 0
+
+    def test_file_overrides_defaults(self, tmp_path):
+        """Une entrée de fichier redéfinit celle du dictionnaire par défaut."""
+        path = tmp_path / "emission.txt"
+        path.write_text("page => plage\n", encoding="utf-8")
+        engine = get_correction_engine([str(path)])
+        assert engine.apply("la page") == "la plage"
+        assert engine.apply("brigette") == "Brigitte"
+
+    def test_cache_invalidated_on_change(self, tmp_path):
+        """Le moteur est réutilisé tant que le fichier ne change pas (date ou taille)."""
+        path = tmp_path / "emission.txt"
+        path.write_text("page => plage\n", encoding="utf-8")
+        first = get_correction_engine([str(path)], include_defaults=False)
+        assert get_correction_engine([str(path)], include_defaults=False) is first
+
+        # Même date de modification, taille différente
+        stat = os.stat(path)
+        path.write_text("page => plages\n", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        second = get_correction_engine([str(path)], include_defaults=False)
+        assert second is not first
+        assert second.apply("page") == "plages"
+
+        # Même taille, date de modification différente
+        stat = os.stat(path)
+        path.write_text("page => pl4ges\n", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = get_correction_engine([str(path)], include_defaults=False)
+        assert third is not second
+        assert third.apply("page") == "pl4ges"
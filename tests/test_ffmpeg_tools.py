@@ -0,0 +1,62 @@
+"""
+Tests de la résolution des exécutables FFmpeg.
+"""
+
+import os
+import stat
+
+import pytest
+
+from transcription.ffmpeg_tools import ENV_OVERRIDES, get_ffmpeg_path, reset_tool_cache, set_tool_path
+
+
+@pytest.fixture
+def tool(tmp_path, monkeypatch):
+    """Exécutable factice ; variables d'environnement et cache restaurés après le test."""
+    for variable in ENV_OVERRIDES.values():
+        # setenv mémorise la valeur d'origine : set_tool_path écrit dans os.environ
+        monkeypatch.setenv(variable, "")
+        monkeypatch.delenv(variable)
+    path = tmp_path / "ffmpeg-perso"
+    path.write_text("#!/bin/sh\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    reset_tool_cache()
+    yield str(path)
+    reset_tool_cache()
+
+
+@pytest.mark.unit
+class TestSetToolPath:
+    """Chemins imposés par configuration."""
+
+    def test_override_and_reset(self, tool, monkeypatch):
+        """Le chemin imposé est prioritaire, puis oublié avec None."""
+        monkeypatch.setenv("PATH", "")
+        assert get_ffmpeg_path() is None
+
+        set_tool_path("ffmpeg", tool)
+        assert get_ffmpeg_path() == tool
+
+        set_tool_path("ffmpeg", None)
+        assert get_ffmpeg_path() is None
+
+    def test_inherited_by_workers(self, tool):
+        """Le chemin est exporté pour les processus de travail."""
+        set_tool_path("ffmpeg", tool)
+        assert os.environ["JJ_CAPTION_FFMPEG"] == tool
+
+    def test_unknown_tool(self):
+        """Seuls ffmpeg et ffprobe sont configurables."""
+        with pytest.raises(ValueError):
+            set_tool_path("ffplay", "/usr/bin/ffplay")
+
+
+@pytest.mark.cli
+def test_cli_options(tool, monkeypatch):
+    """--ffmpeg impose le chemin avant le traitement."""
+    import main
+
+    monkeypatch.setattr("sys.argv", ["main.py", "video.mp4", "--ffmpeg", tool])
+    monkeypatch.setattr(main, "run", lambda args: None)
+    main.main()
+    assert get_ffmpeg_path() == tool
@@ -0,0 +1,27 @@
+"""
+Tests du convertisseur de formats de sous-titres.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+@pytest.mark.unit
+def test_converter_does_not_load_whisper_stack():
+    """Le convertisseur SRT autonome ne charge ni WhisperHandler ni ffmpeg-python."""
+    pytest.importorskip("pycaption")
+    code = (
+        "import sys\n"
+        "import conversion.format_converter\n"
+        "loaded = [name for name in ('transcription.whisper_handler', 'ffmpeg', 'whisper') if name in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=str(SRC), capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert output == ""
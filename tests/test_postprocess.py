@@ -0,0 +1,49 @@
+"""
+Tests du post-traitement des transcriptions.
+"""
+
+import copy
+
+import pytest
+
+from transcription.whisper_handler import WhisperHandler
+
+
+@pytest.fixture
+def handler():
+    """Gestionnaire sur le moteur factice (aucun modèle n'est chargé)."""
+    return WhisperHandler(model_name="tiny", backend="fake", use_audio_cache=False)
+
+
+@pytest.mark.unit
+class TestPostProcessTranscription:
+    """post_process_transcription sur un résultat au format dictionnaire."""
+
+    def test_result_not_modified(self, handler):
+        """Les segments du résultat d'origine ne sont pas modifiés."""
+        result = {
+            "text": " la page",
+            "segments": [{"start": 0.0, "end": 2.0, "text": " la page"}],
+            "language": "fr",
+        }
+        original = copy.deepcopy(result)
+        processed = handler.post_process_transcription(result)
+        assert "pêche" in processed["segments"][0]["text"]
+        assert result == original
+
+    def test_error_returns_intact_original(self, handler):
+        """En cas d'erreur, le résultat retourné est l'original, intact."""
+        # Le premier segment est corrigé et fusionné avant l'échec sur la fin invalide du second
+        result = {
+            "text": " la page x y",
+            "segments": [
+                {"start": 0.0, "end": 0.5, "text": " la page"},
+                {"start": 0.5, "end": None, "text": " x"},
+                {"start": 1.0, "end": 2.0, "text": " y"},
+            ],
+            "language": "fr",
+        }
+        original = copy.deepcopy(result)
+        processed = handler.post_process_transcription(result)
+        assert processed is result
+        assert result == original
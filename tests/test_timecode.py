@@ -0,0 +1,197 @@
+"""
+Tests des timecodes SMPTE.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from transcription.timecode import (
+    FrameRate,
+    TimecodeFormatter,
+    frames_to_timecodes,
+    parse_timecode,
+    seconds_to_frames,
+)
+from transcription.whisper_handler import WhisperHandler
+
+DF_2997 = FrameRate.from_string("29.97")
+DF_5994 = FrameRate.from_string("59.94")
+
+
+def label(frames: int, rate: FrameRate) -> str:
+    """Timecode d'un nombre d'images."""
+    return frames_to_timecodes([frames], rate)[0]
+
+
+@pytest.mark.unit
+class TestFrameRate:
+    """Création des cadences."""
+
+    def test_named_rates(self):
+        """Noms et alias des cadences."""
+        assert FrameRate.from_string("30d") == DF_2997
+        assert FrameRate.from_string("29.97DF") == DF_2997
+        assert FrameRate.from_string("60d") == DF_5994
+        assert FrameRate.from_string("29.97ndf") == FrameRate(30000, 1001)
+        assert FrameRate.from_string("23.98") == FrameRate(24000, 1001)
+        with pytest.raises(ValueError):
+            FrameRate.from_string("31")
+
+    def test_drop_frame_only_ntsc(self):
+        """Le drop-frame n'existe qu'à 29.97 et 59.94."""
+        with pytest.raises(ValueError):
+            FrameRate(25, 1, drop_frame=True)
+
+    def test_counts(self):
+        """Images par minute, par 10 minutes et par jour en drop-frame."""
+        assert (DF_2997.dropped, DF_2997.frames_per_minute, DF_2997.frames_per_10_minutes) == (2, 1798, 17982)
+        assert (DF_5994.dropped, DF_5994.frames_per_minute, DF_5994.frames_per_10_minutes) == (4, 3596, 35964)
+        assert DF_2997.frames_per_day == 2589408
+
+    def test_from_media(self):
+        """Cadence de la piste vidéo, drop-frame pour le NTSC."""
+        assert FrameRate.from_media({"video": {"r_frame_rate": "30000/1001"}}) == DF_2997
+        assert FrameRate.from_media({"video": {"r_frame_rate": "60000/1001"}}) == DF_5994
+        assert FrameRate.from_media({"video": {"r_frame_rate": "25/1"}}) == FrameRate(25)
+        assert FrameRate.from_media({"video": {"r_frame_rate": "0/0"}}) == DF_2997
+        assert FrameRate.from_media(None, default="25") == FrameRate(25)
+
+
+@pytest.mark.unit
+class TestDropFrame:
+    """Numérotation drop-frame."""
+
+    def test_2997_minute_boundary(self):
+        """À 29.97 DF, 00:00:59;29 est suivi de 00:01:00;02."""
+        assert label(1799, DF_2997) == "00:00:59;29"
+        assert label(1800, DF_2997) == "00:01:00;02"
+        assert parse_timecode("00:01:00;02", DF_2997) == 1800
+
+    def test_2997_tenth_minutes_not_dropped(self):
+        """Les minutes multiples de 10 gardent les images 00 et 01."""
+        assert label(17981, DF_2997) == "00:09:59;29"
+        assert label(17982, DF_2997) == "00:10:00;00"
+        assert label(17983, DF_2997) == "00:10:00;01"
+        assert label(107892, DF_2997) == "01:00:00;00"
+        for tens in range(1, 6):
+            assert label(tens * 17982, DF_2997) == f"00:{tens}0:00;00"
+            assert label(tens * 17982 + 1798 * 1 + 2, DF_2997) == f"00:{tens}1:00;02"
+
+    def test_2997_tracks_wall_clock(self):
+        """Une heure de timecode drop-frame correspond à une heure réelle (à l'image près)."""
+        assert seconds_to_frames(3600.0, DF_2997) == 107892
+        assert TimecodeFormatter(DF_2997).format_one(3600.0) == "01:00:00;00"
+
+    def test_5994(self):
+        """À 59.94 DF, 4 libellés sont sautés chaque minute sauf toutes les 10 minutes."""
+        assert label(3599, DF_5994) == "00:00:59;59"
+        assert label(3600, DF_5994) == "00:01:00;04"
+        assert label(35964, DF_5994) == "00:10:00;00"
+        assert label(35965, DF_5994) == "00:10:00;01"
+        assert parse_timecode("00:01:00;04", DF_5994) == 3600
+
+    @pytest.mark.parametrize("rate, timecode", [
+        (DF_2997, "00:01:00;00"),
+        (DF_2997, "00:01:00;01"),
+        (DF_2997, "01:59:00;01"),
+        (DF_5994, "00:01:00;00"),
+        (DF_5994, "00:01:00;03"),
+    ])
+    def test_skipped_labels_rejected(self, rate, timecode):
+        """Les libellés sautés n'existent pas."""
+        with pytest.raises(ValueError):
+            parse_timecode(timecode, rate)
+
+    def test_non_drop_labels_accepted(self):
+        """Ces mêmes libellés existent en non drop-frame et aux minutes multiples de 10."""
+        assert parse_timecode("00:01:00:00", FrameRate.from_string("29.97ndf")) == 1800
+        assert parse_timecode("00:10:00;00", DF_2997) == 17982
+        assert parse_timecode("00:20:00;01", DF_2997) == 2 * 17982 + 1
+
+
+@pytest.mark.unit
+class TestParseFormat:
+    """Lecture et écriture des timecodes."""
+
+    @pytest.mark.parametrize("name", ["23.976", "24", "25", "29.97", "29.97ndf", "30", "50", "59.94", "60"])
+    def test_round_trip(self, name):
+        """Lire le libellé d'un nombre d'images redonne ce nombre."""
+        rate = FrameRate.from_string(name)
+        rng = random.Random(0)
+        frames = set(range(2 * rate.frames_per_10_minutes + 10))
+        frames.update(rng.randrange(rate.frames_per_day) for _ in range(2000))
+        frames = sorted(frames | {rate.frames_per_day - 1})
+        labels = frames_to_timecodes(frames, rate)
+        assert [parse_timecode(text, rate) for text in labels] == frames
+        assert len(set(labels)) == len(labels)
+
+    def test_separator(self):
+        """";" en drop-frame, ":" sinon."""
+        assert label(0, DF_2997) == "00:00:00;00"
+        assert label(0, FrameRate(25)) == "00:00:00:00"
+
+    def test_wraps_after_24_hours(self):
+        """Le timecode repasse à zéro après 24 heures."""
+        assert label(DF_2997.frames_per_day, DF_2997) == "00:00:00;00"
+        assert label(DF_2997.frames_per_day - 1, DF_2997) == "23:59:59;29"
+
+    @pytest.mark.parametrize("timecode", ["", "10:00", "10:60:00:00", "10:00:60:00", "10:00:00:30", "1:2:3:4", "abc"])
+    def test_invalid(self, timecode):
+        """Formats invalides ou hors limites à 29.97."""
+        with pytest.raises(ValueError):
+            parse_timecode(timecode, DF_2997)
+
+    def test_accepted_forms(self):
+        """Séparateurs ":" ";" "." "," et timecode sans images."""
+        for text in ("10:00:00;00", "10:00:00:00", "10:00:00.00", "10:00:00,00", "10:00:00", " 10:00:00;00 "):
+            assert parse_timecode(text, DF_2997) == 10 * 107892
+
+    def test_formatter_offset(self):
+        """Les temps sont comptés depuis le timecode de départ."""
+        formatter = TimecodeFormatter(DF_2997, "10:00:00;00")
+        assert formatter.start == "10:00:00;00"
+        # 1800 images durent 60.06 s à 29.97 : 60 s réelles tombent avant la minute de timecode
+        assert formatter.format(np.array([0.0, 60.0, 60.06])) == ["10:00:00;00", "10:00:59;28", "10:01:00;02"]
+        assert formatter.format([]) == []
+
+
+@pytest.fixture(scope="module")
+def handler():
+    """Gestionnaire sur le moteur factice (aucun modèle n'est chargé)."""
+    return WhisperHandler(model_name="tiny", backend="fake", use_audio_cache=False)
+
+
+@pytest.mark.unit
+class TestHandlerTimecodes:
+    """Timecodes du fichier TXT de diffusion."""
+
+    @pytest.mark.parametrize("start, expected", [
+        ("", "10:00:00;00"),
+        (None, "10:00:00;00"),
+        ("00:00:00;00", "10:00:00;00"),
+        ("09:59:59;29", "10:00:00;00"),
+        ("10:00:00:00", "10:00:00;00"),
+        ("10:00:05;12", "10:00:05;12"),
+        ("11:00:00", "11:00:00;00"),
+        ("10:01:00;00", "10:00:00;00"),
+        ("invalide", "10:00:00;00"),
+    ])
+    def test_adjust_start_time(self, handler, start, expected):
+        """Début de programme à 10:00:00;00 au plus tôt ; libellés invalides remplacés."""
+        assert handler._adjust_start_time(start) == expected
+
+    def test_adjust_start_time_rate(self, handler):
+        """Le début de programme suit la cadence demandée."""
+        assert handler._adjust_start_time("", FrameRate(25)) == "10:00:00:00"
+        assert handler._adjust_start_time("09:00:00:00", DF_5994) == "10:00:00;00"
+
+    def test_convert_to_ltc(self, handler):
+        """Temps convertis depuis le début de programme, à l'image près."""
+        start = handler._adjust_start_time("")
+        assert handler._convert_to_ltc(0.0, start) == "10:00:00;00"
+        assert handler._convert_to_ltc(60.06, start) == "10:01:00;02"
+        assert handler._convert_to_ltc(1.52, start, FrameRate(25)) == "10:00:01:13"
+        # Timecode de départ illisible : temps depuis 00:00:00;00
+        assert handler._convert_to_ltc(60.06, "invalide") == "00:01:00;02"
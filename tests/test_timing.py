@@ -0,0 +1,157 @@
+"""
+Tests des opérations de minutage vectorisées.
+"""
+
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from transcription.postprocess import merge_short_segments
+from transcription.segment_table import SegmentTable
+from transcription.timing import close_gaps, extend_min_duration, limit_cps, merge_short, reflow, split_long
+
+WORDS = ["la", "pêche", "au", "village", "ce", "matin", "les", "pirogues", "rentrent", ""]
+
+
+def random_segments(rng: random.Random, count: int, ordered: bool = True):
+    """Segments aléatoires : durées sur une grille de 0.25 s (égalités exactes), textes parfois vides."""
+    segments, time = [], 0.0
+    for i in range(count):
+        start = time + rng.choice([0.0, 0.0, 0.25, 0.5, -0.25])
+        end = start + rng.choice([0.0, 0.25, 0.5, 0.75, 1.0, 1.5, 3.0])
+        text = " " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 3)))
+        segments.append({"id": i, "start": start, "end": end, "text": text, "tokens": [i, i + 1]})
+        time = max(time, end)
+    if not ordered:
+        rng.shuffle(segments)
+    return segments
+
+
+def merged_with_postprocess(segments, min_duration):
+    """Résultat de référence : l'étape merge_short du post-traitement."""
+    return list(merge_short_segments(copy.deepcopy(segments), min_duration))
+
+
+@pytest.mark.unit
+class TestMergeShort:
+    """merge_short reproduit postprocess.merge_short_segments."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    @pytest.mark.parametrize("min_duration", [0.5, 1.0, 2.0])
+    def test_same_as_postprocess(self, seed, min_duration):
+        """Segments aléatoires dans l'ordre chronologique."""
+        segments = random_segments(random.Random(seed), 60)
+        table = merge_short(SegmentTable.from_segments(copy.deepcopy(segments)), min_duration)
+        assert table.to_segments() == merged_with_postprocess(segments, min_duration)
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_same_as_postprocess_out_of_order(self, seed):
+        """Segments hors d'ordre : la fusion séquentielle donne le même résultat."""
+        segments = random_segments(random.Random(seed), 40, ordered=False)
+        table = merge_short(SegmentTable.from_segments(copy.deepcopy(segments)), 1.0)
+        assert table.to_segments() == merged_with_postprocess(segments, 1.0)
+
+    def test_long_chain(self):
+        """Une longue suite de segments courts forme des groupes successifs."""
+        segments = [{"start": i * 0.1, "end": (i + 1) * 0.1, "text": f" m{i}"} for i in range(1000)]
+        table = merge_short(SegmentTable.from_segments(copy.deepcopy(segments)), 1.0)
+        assert table.to_segments() == merged_with_postprocess(segments, 1.0)
+
+    def test_input_not_modified(self):
+        """La table d'entrée est conservée."""
+        segments = random_segments(random.Random(0), 30)
+        table = SegmentTable.from_segments(copy.deepcopy(segments))
+        merge_short(table, 2.0)
+        assert table.to_segments() == segments
+
+
+@pytest.mark.unit
+class TestEmptyTable:
+    """Toutes les opérations acceptent une table vide."""
+
+    @pytest.mark.parametrize("operation", [
+        lambda table: merge_short(table, 1.0),
+        lambda table: close_gaps(table, 0.5, 0.1),
+        lambda table: extend_min_duration(table, 1.0, 0.1),
+        lambda table: limit_cps(table, 17.0, 0.1),
+        lambda table: split_long(table, 42),
+        lambda table: reflow(table, merge_under=1.0, max_chars=42, max_cps=17.0, min_duration=1.0, max_gap=0.5),
+    ])
+    def test_empty(self, operation):
+        """Une table vide donne une table vide."""
+        result = operation(SegmentTable.from_result({"text": "", "segments": [], "language": "fr"}))
+        assert len(result) == 0
+        assert result.to_result() == {"text": "", "segments": [], "language": "fr"}
+
+
+@pytest.mark.unit
+class TestSplitLong:
+    """Découpage des segments trop longs."""
+
+    def test_words_and_duration_preserved(self):
+        """Les mots et la durée totale de chaque segment découpé sont conservés."""
+        rng = random.Random(1)
+        segments = []
+        for i in range(50):
+            words = [rng.choice(WORDS[:-1]) for _ in range(rng.randint(1, 30))]
+            segments.append({"start": i * 10.0, "end": i * 10.0 + rng.uniform(0.5, 9.0), "text": " " + " ".join(words)})
+        table = SegmentTable.from_segments(copy.deepcopy(segments))
+        result = split_long(table, 20)
+
+        assert " ".join(result.text).split() == " ".join(segment["text"] for segment in segments).split()
+        for i, segment in enumerate(segments):
+            rows = np.flatnonzero((result.start >= segment["start"]) & (result.start < segment["start"] + 10.0))
+            assert result.start[rows[0]] == pytest.approx(segment["start"])
+            assert result.end[rows[-1]] == pytest.approx(segment["end"])
+            assert np.sum(result.end[rows] - result.start[rows]) == pytest.approx(segment["end"] - segment["start"])
+            if len(segment["text"].strip()) <= 20:
+                assert len(rows) == 1 and result.text[rows[0]] == segment["text"]
+
+    def test_single_long_word_kept(self):
+        """Un mot unique plus long que la limite reste un seul segment, texte inchangé."""
+        table = SegmentTable.from_segments([
+            {"start": 0.0, "end": 1.0, "text": " anticonstitutionnellement"},
+            {"start": 1.0, "end": 3.0, "text": " les pirogues rentrent au village ce matin"},
+        ])
+        result = split_long(table, 10)
+        assert result.text[0] == " anticonstitutionnellement"
+        assert (result.start[0], result.end[0]) == (0.0, 1.0)
+        assert " ".join(result.text[1:]).split() == "les pirogues rentrent au village ce matin".split()
+
+
+@pytest.mark.unit
+class TestLimitCps:
+    """Vitesse de lecture maximale."""
+
+    def test_segment_merged_at_most_once(self):
+        """Dans une suite de segments trop rapides, chaque segment est fusionné une fois au plus."""
+        # 11 caractères en 1 s (trop rapide), aucun allongement possible avec min_gap ; une paire : 23 caractères en 2.5 s
+        segments = [{"start": i * 1.5, "end": i * 1.5 + 1.0, "text": f" mot{i:02d} pêche"} for i in range(9)]
+        result = limit_cps(SegmentTable.from_segments(segments), 10.0, min_gap=0.5)
+
+        words = [text.split() for text in result.text]
+        assert sum(words, []) == " ".join(segment["text"] for segment in segments).split()
+        # Paires disjointes (0, 1), (2, 3)... : aucun segment n'absorbe une paire déjà fusionnée
+        assert [len(group) for group in words] == [4, 4, 4, 4, 2]
+        assert result.end.tolist() == pytest.approx([2.5, 5.5, 8.5, 11.5, 13.1])
+
+    def test_slow_segments_unchanged(self):
+        """Les segments sous la limite ne sont ni allongés ni fusionnés."""
+        table = SegmentTable.from_segments([
+            {"start": 0.0, "end": 2.0, "text": " la pêche"},
+            {"start": 3.0, "end": 5.0, "text": " au village"},
+        ])
+        result = limit_cps(table, 17.0)
+        assert result.to_segments() == table.to_segments()
+
+    def test_extended_before_merge(self):
+        """Un segment trop rapide est d'abord allongé sur l'intervalle qui le suit."""
+        table = SegmentTable.from_segments([
+            {"start": 0.0, "end": 0.5, "text": " les pirogues"},
+            {"start": 2.0, "end": 4.0, "text": " rentrent"},
+        ])
+        result = limit_cps(table, 10.0, min_gap=0.1)
+        assert len(result) == 2
+        assert result.end[0] == pytest.approx(1.2)
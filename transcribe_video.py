@@ -23,7 +23,8 @@ def setup_logging():
     )
 
 
-def transcribe_video(video_path: str, output_formats: list = None, model: str = "medium"):
+def transcribe_video(video_path: str, output_formats: list = None, model: str = "medium",
+                     use_cache: bool = True, refresh: bool = False, corrections: list = None):
     """
     Transcrit une vidéo avec toutes les améliorations.
     
@@ -31,6 +32,9 @@ def transcribe_video(video_path: str, output_formats: list = None, model: str =
         video_path: Chemin vers la vidéo
         output_formats: Formats de sortie (srt, vtt, txt, etc.)
         model: Modèle Whisper à utiliser
+        use_cache: Réutiliser une transcription déjà calculée
+        refresh: Recalculer la transcription et mettre à jour le cache
+        corrections: Dictionnaires de corrections propres à l'émission
     """
     if output_formats is None:
         output_formats = ["srt", "txt"]
@@ -48,7 +52,12 @@ def transcribe_video(video_path: str, output_formats: list = None, model: str =
     
     try:
         # Initialiser le gestionnaire Whisper
-        whisper_handler = WhisperHandler(model_name=model)
+        whisper_handler = WhisperHandler(
+            model_name=model,
+            use_result_cache=use_cache,
+            refresh_cache=refresh,
+            corrections=corrections
+        )
         
         # Transcription avec options avancées et post-traitement
         logger.info("🔄 Transcription avec options avancées...")
@@ -112,28 +121,40 @@ def main():
     setup_logging()
     logger = logging.getLogger(__name__)
     
-    if len(sys.argv) < 2:
+    # Options du cache de résultats
+    flags = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    use_cache = "--no-cache" not in flags
+    refresh = "--refresh" in flags
+    corrections = []
+    for flag in flags:
+        if flag.startswith("--corrections="):
+            corrections.extend(flag.split("=", 1)[1].split(","))
+    
+    if len(args) < 1:
         print("""
 🎬 JJ Caption - Transcription de vidéos
 
 Usage:
-  python transcribe_video.py <chemin_video> [formats] [modèle]
+  python transcribe_video.py <chemin_video> [formats] [modèle] [--no-cache] [--refresh] [--corrections=FICHIERS]
 
 Exemples:
   python transcribe_video.py video.mp4
   python transcribe_video.py video.mp4 srt,txt,vtt
   python transcribe_video.py video.mp4 srt,txt medium
+  python transcribe_video.py video.mp4 vtt --refresh
+  python transcribe_video.py video.mp4 srt,txt --corrections=emissions/boquilla.txt
 
 Formats supportés: srt, vtt, txt, json
 Modèles: tiny, base, small, medium, large
         """)
         return
     
-    video_path = sys.argv[1]
-    output_formats = sys.argv[2].split(",") if len(sys.argv) > 2 else ["srt", "txt"]
-    model = sys.argv[3] if len(sys.argv) > 3 else "medium"
+    video_path = args[0]
+    output_formats = args[1].split(",") if len(args) > 1 else ["srt", "txt"]
+    model = args[2] if len(args) > 2 else "medium"
     
-    transcribe_video(video_path, output_formats, model)
+    transcribe_video(video_path, output_formats, model, use_cache=use_cache, refresh=refresh, corrections=corrections)
 
 
 if __name__ == "__main__":